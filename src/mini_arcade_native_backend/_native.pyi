@@ -5,7 +5,9 @@ Type stubs for the native backend module.
 from __future__ import annotations
 
 from enum import IntEnum
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple, Union
+
+Buffer = Union[bytes, bytearray, memoryview]
 
 # Justification: Some methods have many arguments for configuration purposes.
 # pylint: disable=too-many-positional-arguments,too-many-arguments
@@ -36,6 +38,20 @@ class RenderAPI(IntEnum):
     SDL2 = 0
     OpenGL = 1
 
+class TextAlign(IntEnum):
+    """Horizontal alignment of laid out text lines."""
+
+    Left = 0
+    Center = 1
+    Right = 2
+
+class PixelFormat(IntEnum):
+    """Byte order of 4-byte texels read back from the framebuffer."""
+
+    RGBA = 0
+    BGRA = 1
+    ARGB = 2
+
 class Event:
     """
     Representation of a native event.
@@ -88,6 +104,37 @@ class ColorRGBA:
     b: int
     a: int
 
+class RenderStats:
+    """
+    Counters from the renderer's redundant-state filter.
+
+    :ivar state_changes (int): State calls actually sent to SDL.
+    :ivar state_skipped (int): State calls dropped because nothing changed.
+    :ivar texture_switches (int): Texture draws that used a different texture
+        than the previous texture draw.
+    """
+
+    state_changes: int
+    state_skipped: int
+    texture_switches: int
+
+class TextureStats:
+    """
+    Texture memory totals, counting w * h * 4 bytes per texture.
+
+    :ivar count (int): Live textures.
+    :ivar bytes (int): Bytes held by live textures.
+    :ivar evictable_bytes (int): Part of ``bytes`` that may be evicted.
+    :ivar budget (int): Texture budget in bytes, 0 for unlimited.
+    :ivar evictions (int): Textures destroyed to honor the budget.
+    """
+
+    count: int
+    bytes: int
+    evictable_bytes: int
+    budget: int
+    evictions: int
+
 class WindowConfig:
     """
     Configuration for the application window.
@@ -258,6 +305,24 @@ class Audio:
     def stop_all(self):
         """Stop all currently playing sounds."""
 
+def encode_qoi(
+    pixels: Buffer, width: int, height: int, pitch: int = -1
+) -> bytes:
+    """
+    Encode RGBA pixels as a QOI image. The GIL is released while encoding.
+
+    :param pixels: RGBA texels, laid out as for ``Backend.update_texture``.
+    :type pixels: Buffer
+    :param width: Image width in pixels.
+    :type width: int
+    :param height: Image height in pixels.
+    :type height: int
+    :param pitch: Bytes per row for flat buffers (-1 for tight rows).
+    :type pitch: int
+    :return: The encoded image.
+    :rtype: bytes
+    """
+
 class Backend:
     """
     Native backend class.
@@ -291,7 +356,34 @@ class Backend:
         """Begin a new rendering frame."""
 
     def end_frame(self):
-        """End the current rendering frame."""
+        """
+        End the current rendering frame.
+
+        Presenting may wait for vsync; the GIL is released meanwhile so other
+        Python threads keep running.
+        """
+
+    def set_viewport(
+        self, offset_x: float = 0.0, offset_y: float = 0.0, scale: float = 1.0
+    ):
+        """
+        Set the virtual-to-screen transform applied to every draw call.
+
+        :param offset_x: Horizontal offset in screen pixels.
+        :type offset_x: float
+        :param offset_y: Vertical offset in screen pixels.
+        :type offset_y: float
+        :param scale: Scale from virtual units to screen pixels.
+        :type scale: float
+        """
+
+    def viewport(self) -> Tuple[float, float, float]:
+        """
+        Get the current viewport transform.
+
+        :return: Offset x, offset y and scale.
+        :rtype: Tuple[float, float, float]
+        """
 
     def draw_rect(
         self, x: int, y: int, w: int, h: int, r: int, g: int, b: int, a: int
@@ -374,17 +466,18 @@ class Backend:
 
     def draw_poly(
         self,
-        points: Tuple[Tuple[int, int], ...],
+        points: Tuple[Tuple[float, float], ...],
         r: int,
         g: int,
         b: int,
         a: int,
+        filled: bool = True,
     ):
         """
-        Draw a filled polygon.
+        Draw a polygon, filled or as a closed outline.
 
         :param points: A tuple of (x, y) coordinates for the vertices of the polygon.
-        :type points: Tuple[Tuple[int, int], ...]
+        :type points: Tuple[Tuple[float, float], ...]
         :param r: Red component (0-255).
         :type r: int
         :param g: Green component (0-255).
@@ -393,7 +486,62 @@ class Backend:
         :type b: int
         :param a: Alpha component (0-255).
         :type a: int
+        :param filled: Fill the polygon (True) or draw its outline (False).
+        :type filled: bool
+        """
+
+    def draw_rects(
+        self,
+        rects: Buffer,
+        colors: Buffer | Tuple[int, ...] | None = None,
+    ):
         """
+        Draw many filled rectangles in one call.
+
+        :param rects: (N, 4) x, y, w, h rows, or (N, 8) with trailing RGBA.
+        :type rects: Buffer
+        :param colors: One color, an (N, 4) uint8 buffer, or None.
+        :type colors: Buffer | Tuple[int, ...] | None
+        """
+
+    def draw_lines(
+        self,
+        segments: Buffer,
+        colors: Buffer | Tuple[int, ...] | None = None,
+    ):
+        """
+        Draw many line segments in one call.
+
+        :param segments: (N, 4) x1, y1, x2, y2 rows, or (N, 8) with RGBA.
+        :type segments: Buffer
+        :param colors: One color, an (N, 4) uint8 buffer, or None.
+        :type colors: Buffer | Tuple[int, ...] | None
+        """
+
+    def draw_points(
+        self,
+        points: Buffer,
+        colors: Buffer | Tuple[int, ...] | None = None,
+    ):
+        """
+        Draw many points in one call.
+
+        :param points: (N, 2) x, y rows, or (N, 6) with trailing RGBA.
+        :type points: Buffer
+        :param colors: One color, an (N, 4) uint8 buffer, or None.
+        :type colors: Buffer | Tuple[int, ...] | None
+        """
+
+    def render_stats(self) -> RenderStats:
+        """
+        Get the renderer state-change counters.
+
+        :return: Snapshot of the counters.
+        :rtype: RenderStats
+        """
+
+    def reset_render_stats(self):
+        """Reset the renderer state-change counters to zero."""
 
     def set_clip_rect(self, x: int, y: int, w: int, h: int):
         """
@@ -412,16 +560,46 @@ class Backend:
     def clear_clip_rect(self):
         """Clear the clipping rectangle."""
 
+    def submit(self, commands: bytes | bytearray | memoryview) -> None:
+        """
+        Replay a packed draw-command buffer in one call.
+
+        :param commands: Records produced by ``DrawCommandBuffer``.
+        :type commands: bytes | bytearray | memoryview
+        :raises RuntimeError: If the buffer is truncated or has an unknown op.
+        """
+
     def load_font(self, path: str, pt: int) -> int:
         """
         Load a font from the given file path.
 
+        The file is memory-mapped once and shared by every size; loading the
+        same path and size again returns the same identifier. Only the file
+        header is checked here; the font is opened on first use.
+
         :param path: File path to the font.
         :type path: str
         :param pt: Point size of the font.
         :type pt: int
         :return: Font identifier.
         :rtype: int
+        :raises RuntimeError: If the file can't be mapped or has no
+            TrueType/OpenType header.
+        """
+
+    def load_sdf_font(self, path: str, pt: int) -> int:
+        """
+        Load a font drawn from a signed distance field atlas.
+
+        The size is in virtual units and glyphs stay crisp at any viewport
+        scale. Measurements and layouts of the font are virtual units.
+
+        :param path: File path to the font.
+        :type path: str
+        :param pt: Point size of the font in virtual units.
+        :type pt: int
+        :return: Font identifier.
+        :rtype: int
         """
 
     def measure_text(self, text: str, font_id: int = -1) -> Tuple[int, int]:
@@ -436,11 +614,117 @@ class Backend:
         :rtype: Tuple[int, int]
         """
 
+    def measure_text_many(
+        self, texts: List[str], font_id: int = -1
+    ) -> List[Tuple[int, int]]:
+        """
+        Measure several strings in one call.
+
+        :param texts: The strings to measure.
+        :type texts: List[str]
+        :param font_id: Identifier of the font to use (-1 for the default).
+        :type font_id: int
+        :return: Width and height of every string, in order.
+        :rtype: List[Tuple[int, int]]
+        """
+
+    def prewarm_text(self, texts: List[str], font_id: int = -1):
+        """
+        Rasterize the glyphs of several strings into the font's atlas now,
+        so their first draw doesn't.
+
+        :param texts: The strings whose glyphs to prepare.
+        :type texts: List[str]
+        :param font_id: Identifier of the font to use (-1 for the default).
+        :type font_id: int
+        """
+
+    def rasterize_text(self, texts: List[str], font_id: int = -1):
+        """
+        Render the glyphs of several strings without touching the renderer.
+
+        Unlike the other methods this may be called from any thread; the
+        glyphs are placed in the atlas by ``upload_rasterized_text`` or when
+        first drawn.
+
+        :param texts: The strings whose glyphs to render.
+        :type texts: List[str]
+        :param font_id: Identifier of the font to use (-1 for the default).
+        :type font_id: int
+        """
+
+    def upload_rasterized_text(self):
+        """Place glyphs rendered by ``rasterize_text`` into their atlases."""
+
+    def layout_text(
+        self,
+        text: str,
+        max_width: int = 0,
+        align: TextAlign | int = TextAlign.Left,
+        font_id: int = -1,
+    ) -> Tuple[int, int, List[Tuple[int, int, int, int, int]]]:
+        """
+        Break text into lines no wider than ``max_width`` pixels.
+
+        Lines wrap at spaces and always break at newlines. Layouts of
+        recent (text, width, alignment, font) combinations are cached.
+
+        :param text: The text to lay out.
+        :type text: str
+        :param max_width: Maximum line width in pixels (0 = no wrapping).
+        :type max_width: int
+        :param align: Horizontal alignment of each line.
+        :type align: TextAlign | int
+        :param font_id: Identifier of the font to use (-1 for the default).
+        :type font_id: int
+        :return: Block width and height, and one (start, end, x, y, width)
+            tuple per line; start and end are code point indices.
+        :rtype: Tuple[int, int, List[Tuple[int, int, int, int, int]]]
+        """
+
+    def draw_text_block(
+        self,
+        text: str,
+        x: float,
+        y: float,
+        max_width: int,
+        align: TextAlign | int,
+        r: int,
+        g: int,
+        b: int,
+        a: int,
+        font_id: int = -1,
+    ):
+        """
+        Lay out text as ``layout_text`` does and draw every line.
+
+        :param text: The text to draw.
+        :type text: str
+        :param x: X coordinate of the block's top-left corner.
+        :type x: float
+        :param y: Y coordinate of the block's top-left corner.
+        :type y: float
+        :param max_width: Maximum line width in pixels (0 = no wrapping).
+        :type max_width: int
+        :param align: Horizontal alignment of each line.
+        :type align: TextAlign | int
+        :param r: Red component (0-255).
+        :type r: int
+        :param g: Green component (0-255).
+        :type g: int
+        :param b: Blue component (0-255).
+        :type b: int
+        :param a: Alpha component (0-255).
+        :type a: int
+        :param font_id: Identifier of the font to use (-1 for the default).
+        :type font_id: int
+        """
+
     def draw_text(
         self,
         text: str,
-        x: int,
-        y: int,
+        x: float,
+        y: float,
         r: int,
         g: int,
         b: int,
@@ -448,14 +732,15 @@ class Backend:
         font_id: int = -1,
     ):
         """
-        Draw text at the specified position.
+        Draw a line of text from the font's glyph atlas. Glyphs are
+        rasterized once per font and drawn as batched quads.
 
         :param text: The text to draw.
         :type text: str
-        :param x: X coordinate for the text.
-        :type x: int
-        :param y: Y coordinate for the text.
-        :type y: int
+        :param x: X coordinate of the line's top-left corner.
+        :type x: float
+        :param y: Y coordinate of the line's top-left corner.
+        :type y: float
         :param r: Red component (0-255).
         :type r: int
         :param g: Green component (0-255).
@@ -476,6 +761,84 @@ class Backend:
         :rtype: list[Event]
         """
 
+    def poll_events_into(
+        self, records: bytearray | memoryview, text: bytearray | memoryview
+    ) -> Tuple[int, int, bool]:
+        """
+        Poll events as packed 64-byte records plus a UTF-8 text arena.
+
+        Events that don't fit are kept natively until the next call.
+
+        :param records: Writable buffer for the records (see
+            ``mapping.events.EVENT_FIELDS``).
+        :type records: bytearray | memoryview
+        :param text: Writable buffer for the text of text-input events.
+        :type text: bytearray | memoryview
+        :return: Event count, text bytes used, and whether they fit; if
+            not, nothing was copied and the call should be retried with
+            buffers at least that large.
+        :rtype: Tuple[int, int, bool]
+        """
+
+    def set_event_enabled(self, type: EventType, enabled: bool) -> None:
+        """
+        Enable or disable an event type.
+
+        Disabled input types are ignored by SDL and never queued; the rest
+        are dropped natively before reaching Python.
+
+        :param type: The event type.
+        :type type: EventType
+        :param enabled: Whether events of this type are delivered.
+        :type enabled: bool
+        """
+
+    def event_enabled(self, type: EventType) -> bool:
+        """
+        Check whether an event type is delivered.
+
+        :param type: The event type.
+        :type type: EventType
+        :return: True if events of this type are delivered.
+        :rtype: bool
+        """
+
+    def set_coalesce_mouse_motion(self, enabled: bool) -> None:
+        """
+        Merge consecutive mouse motion events into one per poll.
+
+        The merged event has the latest position and the summed deltas.
+
+        :param enabled: Whether to coalesce motion events.
+        :type enabled: bool
+        """
+
+    def keyboard_state(self) -> memoryview:
+        """
+        Read-only view over SDL's keyboard state, indexed by scancode.
+
+        The view is not a copy; it is updated whenever events are polled.
+
+        :return: One byte per scancode, non-zero while the key is held.
+        :rtype: memoryview
+        """
+
+    def mouse_state(self) -> Tuple[int, int, int]:
+        """
+        Mouse position and buttons, scaled like mouse events.
+
+        :return: x, y and the SDL button mask.
+        :rtype: Tuple[int, int, int]
+        """
+
+    def output_size(self) -> Tuple[int, int]:
+        """
+        Size in pixels of the current render output, i.e. of a full capture.
+
+        :return: Width and height.
+        :rtype: Tuple[int, int]
+        """
+
     def capture_bmp(self, path: str) -> bool:
         """
         Capture the current frame buffer to a BMP file.
@@ -494,6 +857,29 @@ class Backend:
         :rtype: tuple[int, int, bytes]
         """
 
+    def capture_into(
+        self,
+        buffer: bytearray | memoryview,
+        rect: Tuple[int, int, int, int] | None = None,
+        format: PixelFormat | int = PixelFormat.RGBA,
+    ) -> Tuple[int, int]:
+        """
+        Read the current frame buffer straight into a writable buffer.
+
+        :param buffer: Writable buffer-protocol object: flat bytes with tight
+            rows, or an array shaped (h, w, 4) / (h, w) uint32 with
+            contiguous rows.
+        :type buffer: bytearray | memoryview | numpy.ndarray
+        :param rect: Area (x, y, w, h) in output pixels, or None for the
+            whole frame buffer.
+        :type rect: Tuple[int, int, int, int] | None
+        :param format: Byte order of the written texels.
+        :type format: PixelFormat | int
+        :return: Width and height of the captured area.
+        :rtype: Tuple[int, int]
+        :raises RuntimeError: If the buffer is too small or the read fails.
+        """
+
     def create_texture_rgba(
         self, width: int, height: int, data: bytes, pitch: int = -1
     ) -> int:
@@ -520,6 +906,10 @@ class Backend:
         width: int,
         height: int,
         angle_deg: float = 0.0,
+        r: int = 255,
+        g: int = 255,
+        b: int = 255,
+        a: int = 255,
     ) -> None:
         """
         Draw a texture at the specified position and size.
@@ -534,6 +924,232 @@ class Backend:
         :type width: int
         :param height: Height of the texture.
         :type height: int
+        :param angle_deg: Clockwise rotation around the texture center.
+        :type angle_deg: float
+        :param r: Red tint multiplied into the texture (0-255).
+        :type r: int
+        :param g: Green tint (0-255).
+        :type g: int
+        :param b: Blue tint (0-255).
+        :type b: int
+        :param a: Alpha multiplied into the texture (0-255).
+        :type a: int
+        """
+
+    def draw_texture_region(
+        self,
+        texture_id: int,
+        src_x: float,
+        src_y: float,
+        src_w: float,
+        src_h: float,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        angle_deg: float = 0.0,
+    ) -> None:
+        """
+        Draw a sub-rectangle of a texture.
+
+        Consecutive region draws from the same texture are batched into one
+        geometry submission.
+
+        :param texture_id: Identifier of the texture to draw from.
+        :type texture_id: int
+        :param src_x: X of the source rect, in texels.
+        :type src_x: float
+        :param src_y: Y of the source rect, in texels.
+        :type src_y: float
+        :param src_w: Width of the source rect, in texels.
+        :type src_w: float
+        :param src_h: Height of the source rect, in texels.
+        :type src_h: float
+        :param x: X coordinate for the destination.
+        :type x: float
+        :param y: Y coordinate for the destination.
+        :type y: float
+        :param width: Destination width.
+        :type width: float
+        :param height: Destination height.
+        :type height: float
+        :param angle_deg: Clockwise rotation in degrees around the center.
+        :type angle_deg: float
+        """
+
+    def draw_texture_instances(
+        self,
+        texture_id: int,
+        instances: Buffer,
+        colors: Buffer | Tuple[int, ...] | None = None,
+        src: Tuple[float, float, float, float] | None = None,
+    ) -> None:
+        """
+        Draw many copies of a texture in one geometry submission.
+
+        :param texture_id: Identifier of the texture to draw.
+        :type texture_id: int
+        :param instances: (N, 5) x, y, w, h, angle_deg rows, or (N, 9) with
+            trailing RGBA tint columns.
+        :type instances: Buffer
+        :param colors: One tint, an (N, 4) uint8 buffer of tints, or None.
+        :type colors: Buffer | Tuple[int, ...] | None
+        :param src: Source rect (x, y, w, h) in texels shared by every
+            instance, or None for the whole texture.
+        :type src: Tuple[float, float, float, float] | None
+        """
+
+    def create_texture_streaming(self, width: int, height: int) -> int:
+        """
+        Create an RGBA texture that can be updated or locked every frame.
+
+        :param width: Width of the texture.
+        :type width: int
+        :param height: Height of the texture.
+        :type height: int
+        :return: Texture identifier, or 0 on failure.
+        :rtype: int
+        """
+
+    def update_texture(
+        self,
+        texture_id: int,
+        data: Buffer,
+        rect: Tuple[int, int, int, int] | None = None,
+        pitch: int = -1,
+    ) -> None:
+        """
+        Upload RGBA pixels straight from a buffer into a texture.
+
+        :param texture_id: Identifier of the texture to update.
+        :type texture_id: int
+        :param data: Flat RGBA bytes, or an N-D array with contiguous rows.
+        :type data: Buffer
+        :param rect: Area (x, y, w, h) to update, or None for the whole texture.
+        :type rect: Tuple[int, int, int, int] | None
+        :param pitch: Bytes per row for flat buffers (-1 for tightly packed).
+        :type pitch: int
+        :raises RuntimeError: If the buffer is too small or the upload fails.
+        """
+
+    def lock_texture(
+        self, texture_id: int, rect: Tuple[int, int, int, int] | None = None
+    ) -> Tuple[memoryview, int]:
+        """
+        Lock a streaming texture for writing.
+
+        The view points straight at the locked pixels and is only valid
+        until ``unlock_texture``; release it before unlocking, since writing
+        through it afterwards corrupts memory. ``RenderPort.lock_texture``
+        does both for you.
+
+        :param texture_id: Identifier of the texture to lock.
+        :type texture_id: int
+        :param rect: Area (x, y, w, h) to lock inside the texture, or None
+            for the whole texture.
+        :type rect: Tuple[int, int, int, int] | None
+        :return: A writable view of the pixels and the row pitch in bytes.
+        :rtype: Tuple[memoryview, int]
+        :raises RuntimeError: If the texture can't be locked or the rect is
+            outside it.
+        """
+
+    def unlock_texture(self, texture_id: int) -> None:
+        """
+        Unlock a texture locked with ``lock_texture`` and upload its changes.
+
+        :param texture_id: Identifier of the texture to unlock.
+        :type texture_id: int
+        """
+
+    def texture_size(self, texture_id: int) -> Tuple[int, int]:
+        """
+        Get the size of a texture.
+
+        :param texture_id: Identifier of the texture.
+        :type texture_id: int
+        :return: Width and height, or (0, 0) for unknown identifiers.
+        :rtype: Tuple[int, int]
+        """
+
+    def texture_stats(self) -> TextureStats:
+        """
+        Get the texture memory totals.
+
+        :return: Snapshot of the totals.
+        :rtype: TextureStats
+        """
+
+    def set_texture_budget(self, bytes: int):
+        """
+        Set the texture budget. Creating a texture that pushes the total
+        past it destroys evictable textures not drawn this frame, least
+        recently drawn first.
+
+        :param bytes: Budget in bytes, 0 for unlimited.
+        :type bytes: int
+        """
+
+    def set_texture_evictable(self, texture_id: int, evictable: bool = True):
+        """
+        Allow or forbid evicting a texture to honor the budget.
+
+        :param texture_id: Identifier of the texture.
+        :type texture_id: int
+        :param evictable: Whether the texture may be evicted.
+        :type evictable: bool
+        """
+
+    def take_evicted_textures(self) -> List[int]:
+        """
+        Get and forget the identifiers of textures evicted since the last
+        call.
+
+        :return: Evicted texture identifiers, oldest eviction first.
+        :rtype: List[int]
+        """
+
+    def create_render_target(self, width: int, height: int) -> int:
+        """
+        Create an RGBA texture that can be rendered into.
+
+        :param width: Width of the texture.
+        :type width: int
+        :param height: Height of the texture.
+        :type height: int
+        :return: Texture identifier, or 0 on failure.
+        :rtype: int
+        """
+
+    def set_render_target(self, texture_id: int = 0) -> None:
+        """
+        Redirect drawing into a render-target texture.
+
+        :param texture_id: Render-target texture, or 0 for the window.
+        :type texture_id: int
+        :raises RuntimeError: If the texture can't be rendered into.
+        """
+
+    def render_target(self) -> int:
+        """
+        Get the current render target.
+
+        :return: Texture identifier, or 0 for the window.
+        :rtype: int
+        """
+
+    def clear(self, r: int, g: int, b: int, a: int):
+        """
+        Fill the current render target with a color.
+
+        :param r: Red component (0-255).
+        :type r: int
+        :param g: Green component (0-255).
+        :type g: int
+        :param b: Blue component (0-255).
+        :type b: int
+        :param a: Alpha component (0-255).
+        :type a: int
         """
 
     def destroy_texture(self, texture_id: int) -> None:
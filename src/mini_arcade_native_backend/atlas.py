@@ -0,0 +1,321 @@
+"""
+Texture atlases and sprite sheets for the native backend.
+
+Many small RGBA images are packed into a few large pages with a shelf
+packer, uploaded once, and addressed through ``AtlasRegion`` handles.
+Drawing regions of the same page back to back lets the native renderer
+submit them as a single geometry batch.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Hashable, Protocol
+
+# Justification: Regions and packer calls carry position and size values.
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+
+
+class TextureFactory(Protocol):
+    """Anything that can upload RGBA pixels, e.g. ``RenderPort``."""
+
+    # pylint: disable=missing-function-docstring
+    def create_texture_rgba(
+        self,
+        w: int,
+        h: int,
+        pixels: bytes | bytearray | memoryview,
+        pitch: int | None = None,
+    ) -> int: ...
+
+    def destroy_texture(self, tex: int) -> None: ...
+
+
+@dataclass(frozen=True)
+class AtlasRegion:
+    """
+    Sub-image of a texture.
+
+    :ivar texture (int): Texture id of the page holding the image.
+    :ivar x (int): Left edge inside the texture, in texels.
+    :ivar y (int): Top edge inside the texture, in texels.
+    :ivar w (int): Width in texels.
+    :ivar h (int): Height in texels.
+    """
+
+    texture: int
+    x: int
+    y: int
+    w: int
+    h: int
+
+    @property
+    def src_rect(self) -> tuple[int, int, int, int]:
+        """
+        Source rect for ``RenderPort.draw_texture_region``.
+
+        :return: (x, y, w, h) in texels.
+        :rtype: tuple[int, int, int, int]
+        """
+        return (self.x, self.y, self.w, self.h)
+
+    def grid(
+        self, frame_w: int, frame_h: int, count: int | None = None
+    ) -> list[AtlasRegion]:
+        """
+        Slice this region into equally sized sprite-sheet frames.
+
+        Frames are returned row by row, left to right.
+
+        :param frame_w: Width of one frame, in texels.
+        :type frame_w: int
+        :param frame_h: Height of one frame, in texels.
+        :type frame_h: int
+        :param count: Number of frames to keep, or None for every full frame.
+        :type count: int | None
+        :return: The frame regions.
+        :rtype: list[AtlasRegion]
+        :raises ValueError: If the frame size is not positive.
+        """
+        if frame_w <= 0 or frame_h <= 0:
+            raise ValueError("frame size must be positive")
+
+        columns = self.w // frame_w
+        rows = self.h // frame_h
+        total = columns * rows
+        if count is not None:
+            total = min(total, int(count))
+
+        return [
+            AtlasRegion(
+                self.texture,
+                self.x + (i % columns) * frame_w,
+                self.y + (i // columns) * frame_h,
+                frame_w,
+                frame_h,
+            )
+            for i in range(total)
+        ]
+
+
+class ShelfPacker:
+    """
+    Shelf bin packer for one atlas page.
+
+    Images are placed left to right on horizontal shelves; a new shelf is
+    opened below the last one when no existing shelf fits. Inserting
+    images sorted by decreasing height keeps shelves tight. Padding is only
+    kept between images and between shelves, never past the page edges.
+
+    :param width: Page width in texels.
+    :type width: int
+    :param height: Page height in texels.
+    :type height: int
+    :param padding: Empty texels kept around every image so filtering
+        doesn't bleed neighbours into each other.
+    :type padding: int
+    """
+
+    def __init__(self, width: int, height: int, padding: int = 1):
+        self.width = int(width)
+        self.height = int(height)
+        self.padding = max(0, int(padding))
+        # Each shelf is [y, height, next free x].
+        self._shelves: list[list[int]] = []
+        self._used_h = 0
+
+    @property
+    def used_height(self) -> int:
+        """
+        Height actually covered by shelves.
+
+        :return: Used height in texels.
+        :rtype: int
+        """
+        return self._used_h
+
+    def insert(self, w: int, h: int) -> tuple[int, int] | None:
+        """
+        Reserve a w x h area.
+
+        :param w: Width of the image.
+        :type w: int
+        :param h: Height of the image.
+        :type h: int
+        :return: Top-left corner of the reserved area, or None if full.
+        :rtype: tuple[int, int] | None
+        """
+        pad = self.padding
+
+        best: list[int] | None = None
+        best_h = 0
+        for shelf in self._shelves:
+            _, shelf_h, shelf_x = shelf
+            if h <= shelf_h and shelf_x + w <= self.width:
+                # Prefer the shelf wasting the least height.
+                if best is None or shelf_h < best_h:
+                    best, best_h = shelf, shelf_h
+                    if shelf_h == h:
+                        break
+
+        if best is None:
+            y = self._used_h + pad if self._shelves else 0
+            if y + h > self.height or w > self.width:
+                return None
+            best = [y, h, 0]
+            self._shelves.append(best)
+            self._used_h = y + h
+
+        pos = (best[2], best[0])
+        best[2] += w + pad
+        return pos
+
+
+@dataclass
+class _PendingImage:
+    key: Hashable
+    w: int
+    h: int
+    pixels: memoryview
+    pitch: int
+
+
+@dataclass
+class TextureAtlas:
+    """
+    Uploaded atlas pages and the regions packed into them.
+
+    :ivar pages (list[int]): Texture ids of the atlas pages.
+    :ivar regions (dict[Hashable, AtlasRegion]): Region for every added key.
+    """
+
+    pages: list[int] = field(default_factory=list)
+    regions: dict[Hashable, AtlasRegion] = field(default_factory=dict)
+
+    def __getitem__(self, key: Hashable) -> AtlasRegion:
+        return self.regions[key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.regions
+
+    def destroy(self, textures: TextureFactory):
+        """
+        Destroy every page texture.
+
+        :param textures: The port that created the pages.
+        :type textures: TextureFactory
+        """
+        for tex in self.pages:
+            textures.destroy_texture(tex)
+        self.pages.clear()
+        self.regions.clear()
+
+
+class TextureAtlasBuilder:
+    """
+    Collects RGBA images and packs them into as few pages as possible.
+
+    :param page_size: Maximum page width and height in texels.
+    :type page_size: int
+    :param padding: Empty texels kept between packed images.
+    :type padding: int
+    """
+
+    def __init__(self, page_size: int = 1024, padding: int = 1):
+        self.page_size = int(page_size)
+        self.padding = int(padding)
+        self._images: list[_PendingImage] = []
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def add(
+        self,
+        key: Hashable,
+        w: int,
+        h: int,
+        pixels: bytes,
+        pitch: int | None = None,
+    ):
+        """
+        Queue an RGBA image for packing.
+
+        :param key: Name used to look up the region after ``build``.
+        :type key: Hashable
+        :param w: Image width.
+        :type w: int
+        :param h: Image height.
+        :type h: int
+        :param pixels: RGBA pixel data.
+        :type pixels: bytes
+        :param pitch: Bytes per row. If None, defaults to w * 4.
+        :type pitch: int | None
+        :raises ValueError: If the image doesn't fit a page or the buffer is
+            too small.
+        """
+        w, h = int(w), int(h)
+        if pitch is None:
+            pitch = w * 4
+        if w <= 0 or h <= 0:
+            raise ValueError(f"atlas image {key!r} has an empty size")
+        if w > self.page_size or h > self.page_size:
+            raise ValueError(
+                f"atlas image {key!r} ({w}x{h}) exceeds page size "
+                f"{self.page_size}"
+            )
+        view = memoryview(pixels).cast("B")
+        if len(view) < pitch * (h - 1) + w * 4:
+            raise ValueError(f"atlas image {key!r} buffer is too small")
+        self._images.append(_PendingImage(key, w, h, view, int(pitch)))
+
+    def build(self, textures: TextureFactory) -> TextureAtlas:
+        """
+        Pack the queued images, upload the pages and clear the queue.
+
+        :param textures: Port used to upload the pages, e.g. ``RenderPort``.
+        :type textures: TextureFactory
+        :return: The uploaded atlas.
+        :rtype: TextureAtlas
+        """
+        packers: list[ShelfPacker] = []
+        placed: list[tuple[_PendingImage, int, int, int]] = []
+
+        order = sorted(self._images, key=lambda img: (-img.h, -img.w))
+        for img in order:
+            for page, packer in enumerate(packers):
+                pos = packer.insert(img.w, img.h)
+                if pos is not None:
+                    break
+            else:
+                packer = ShelfPacker(
+                    self.page_size, self.page_size, self.padding
+                )
+                packers.append(packer)
+                page = len(packers) - 1
+                pos = packer.insert(img.w, img.h)
+            placed.append((img, page, pos[0], pos[1]))
+
+        # Pages are trimmed to the height their shelves actually use.
+        page_w = self.page_size
+        heights = [p.used_height for p in packers]
+        buffers = [bytearray(page_w * h * 4) for h in heights]
+        for img, page, x, y in placed:
+            dst = buffers[page]
+            row = img.w * 4
+            for j in range(img.h):
+                d = ((y + j) * page_w + x) * 4
+                s = j * img.pitch
+                dst[d : d + row] = img.pixels[s : s + row]
+
+        atlas = TextureAtlas()
+        for buf, h in zip(buffers, heights):
+            atlas.pages.append(
+                textures.create_texture_rgba(page_w, h, buf, page_w * 4)
+            )
+        for img, page, x, y in placed:
+            atlas.regions[img.key] = AtlasRegion(
+                atlas.pages[page], x, y, img.w, img.h
+            )
+
+        self._images.clear()
+        return atlas
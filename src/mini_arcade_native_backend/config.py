@@ -22,6 +22,8 @@ from . import _native as native  # type: ignore
 
 # pylint: enable=no-name-in-module,no-member
 
+DEFAULT_TEXT_CACHE_BYTES = 8 * 1024 * 1024
+
 
 @dataclass(frozen=True)
 class NativeBackendSettings:
@@ -30,10 +32,23 @@ class NativeBackendSettings:
 
     :ivar core: Core backend settings.
     :ivar api: The rendering API to use.
+    :ivar text_cache_bytes: Texture bytes the text port may keep cached for
+        strings drawn with the built-in default font. TrueType fonts use
+        native glyph atlases and aren't affected.
+    :ivar sdf_text: Draw TrueType text from signed distance field atlases
+        that stay crisp at any viewport scale.
+    :ivar screenshot_queue: Asynchronous screenshots that may be pending at
+        once.
+    :ivar screenshot_policy: ``"drop"`` or ``"block"`` when the screenshot
+        queue is full.
     """
 
     core: CoreBackendSettings = field(default_factory=CoreBackendSettings)
     api: object = native.RenderAPI.SDL2  # pylint: disable=no-member
+    text_cache_bytes: int = DEFAULT_TEXT_CACHE_BYTES
+    sdf_text: bool = False
+    screenshot_queue: int = 2
+    screenshot_policy: str = "drop"
 
     def to_dict(self) -> dict:
         """
@@ -68,4 +83,10 @@ class NativeBackendSettings:
             # Justification: native is a compiled extension module with stubbed members.
             # pylint: disable=no-member
             api=native.RenderAPI(data.get("api", cls.api)),
+            text_cache_bytes=int(
+                data.get("text_cache_bytes", DEFAULT_TEXT_CACHE_BYTES)
+            ),
+            sdf_text=bool(data.get("sdf_text", False)),
+            screenshot_queue=int(data.get("screenshot_queue", 2)),
+            screenshot_policy=str(data.get("screenshot_policy", "drop")),
         )
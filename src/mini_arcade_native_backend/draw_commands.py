@@ -0,0 +1,350 @@
+"""
+Packed draw-command buffer for the native backend.
+
+Ports append draw operations to a shared buffer and the whole frame is
+replayed by ``Backend.submit`` in a single native call. The record layout
+mirrors ``src/native/include/mini/draw_commands.h``. Coordinates are
+virtual; the native renderer applies the viewport transform.
+"""
+
+from __future__ import annotations
+
+from struct import Struct, pack
+from typing import Union
+
+from mini_arcade_core.backend.viewport import ViewportTransform
+
+# Justification: native is a compiled extension module.
+# pylint: disable=no-name-in-module
+from mini_arcade_native_backend import _native as native  # type: ignore
+
+# Justification: Draw records carry position, size and color components.
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+
+OP_RECT = 1
+OP_LINE = 2
+OP_TEXTURE = 3
+OP_CLIP_RECT = 4
+OP_CLEAR_CLIP_RECT = 5
+OP_CIRCLE = 6
+OP_POLY = 7
+OP_TEXTURE_REGION = 8
+OP_TEXT = 9
+OP_TEXT_BLOCK = 10
+
+_RECT = Struct("<I4f4B")
+_LINE = Struct("<I4f4Bi")
+_TEXTURE = Struct("<II5f4B")
+_TEXTURE_REGION = Struct("<II9f")
+_CLIP_RECT = Struct("<I4f")
+_CLEAR_CLIP_RECT = Struct("<I")
+_CIRCLE = Struct("<I3f4B")
+_POLY_HEADER = Struct("<I4BII")
+_TEXT_HEADER = Struct("<Iiff4BI")
+_TEXT_BLOCK_HEADER = Struct("<Iiff4BiII")
+
+
+class DrawCommandBuffer:
+    """
+    Append-only packed buffer of draw operations.
+
+    Coordinates are virtual values; they are stored as float32 and mapped
+    and rounded natively, so callers don't need to ``int()`` them.
+
+    :param native_backend: The native backend instance.
+    :type native_backend: native.Backend
+    """
+
+    def __init__(self, native_backend: native.Backend):
+        self._b = native_backend
+        self._data = bytearray()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def rect(self, x, y, w, h, r: int, g: int, b: int, a: int):
+        """Queue a filled rectangle."""
+        self._data += _RECT.pack(OP_RECT, x, y, w, h, r, g, b, a)
+
+    def line(
+        self, x1, y1, x2, y2, r: int, g: int, b: int, a: int, thickness=1
+    ):
+        """Queue a line segment."""
+        self._data += _LINE.pack(
+            OP_LINE, x1, y1, x2, y2, r, g, b, a, int(thickness)
+        )
+
+    def texture(
+        self,
+        tex: int,
+        x,
+        y,
+        w,
+        h,
+        angle_deg: float = 0.0,
+        r: int = 255,
+        g: int = 255,
+        b: int = 255,
+        a: int = 255,
+    ):
+        """Queue a texture blit, optionally tinted and rotated."""
+        self._data += _TEXTURE.pack(
+            OP_TEXTURE, tex, x, y, w, h, angle_deg, r, g, b, a
+        )
+
+    def texture_region(
+        self, tex: int, src, x, y, w, h, angle_deg: float = 0.0
+    ):
+        """Queue a blit of the ``src`` (x, y, w, h) texel rect of a texture."""
+        self._data += _TEXTURE_REGION.pack(
+            OP_TEXTURE_REGION, tex, *src, x, y, w, h, angle_deg
+        )
+
+    def texture_tiled_y(self, tex: int, x, y, w, h):
+        """Draw a vertically tiled texture after the queued commands."""
+        self.flush()
+        self._b.draw_texture_tiled_y(tex, x, y, w, h)
+
+    def texture_instances(self, tex: int, instances, colors=None, src=None):
+        """Draw texture instances after the queued commands."""
+        self.flush()
+        self._b.draw_texture_instances(tex, instances, colors, src)
+
+    def circle(self, x, y, radius, r: int, g: int, b: int, a: int):
+        """Queue a filled circle."""
+        self._data += _CIRCLE.pack(OP_CIRCLE, x, y, radius, r, g, b, a)
+
+    def poly(self, points, r: int, g: int, b: int, a: int, filled=True):
+        """Queue a polygon given as a sequence of (x, y) vertices."""
+        flat = [c for point in points for c in point]
+        count = len(flat) // 2
+        self._data += _POLY_HEADER.pack(
+            OP_POLY, r, g, b, a, count, 1 if filled else 0
+        )
+        self._data += pack(f"<{len(flat)}f", *flat)
+
+    def text(
+        self, font_id: int, x, y, text: str, r: int, g: int, b: int, a: int
+    ):
+        """Queue a line of text drawn from the font's glyph atlas."""
+        data = text.encode("utf-8")
+        self._data += _TEXT_HEADER.pack(
+            OP_TEXT, font_id, x, y, r, g, b, a, len(data)
+        )
+        self._data += data
+
+    def text_block(
+        self,
+        font_id: int,
+        x,
+        y,
+        text: str,
+        max_width: int,
+        align: int,
+        r: int,
+        g: int,
+        b: int,
+        a: int,
+    ):
+        """Queue a wrapped text block; ``max_width`` is in screen pixels."""
+        data = text.encode("utf-8")
+        self._data += _TEXT_BLOCK_HEADER.pack(
+            OP_TEXT_BLOCK,
+            font_id,
+            x,
+            y,
+            r,
+            g,
+            b,
+            a,
+            int(max_width),
+            int(align),
+            len(data),
+        )
+        self._data += data
+
+    def clip_rect(self, x, y, w, h):
+        """Queue a clip rectangle change."""
+        self._data += _CLIP_RECT.pack(OP_CLIP_RECT, x, y, w, h)
+
+    def clear_clip_rect(self):
+        """Queue removal of the clip rectangle."""
+        self._data += _CLEAR_CLIP_RECT.pack(OP_CLEAR_CLIP_RECT)
+
+    def flush(self):
+        """Replay all queued commands natively and reset the buffer."""
+        if not self._data:
+            return
+        try:
+            self._b.submit(self._data)
+        finally:
+            self._data.clear()
+
+
+class ImmediateDrawCommands:
+    """
+    Command sink that forwards every operation straight to the backend.
+
+    Used with stale compiled extensions that predate ``Backend.submit``.
+    Those builds have no native viewport either, so coordinates are mapped
+    here in Python. Only the operations such builds can draw are supported:
+    texture regions, tinted textures, texture instances and text blocks
+    raise RuntimeError.
+
+    :param native_backend: The native backend instance.
+    :type native_backend: native.Backend
+    :param vp: The viewport transform to apply, identity if None.
+    :type vp: ViewportTransform | None
+    """
+
+    def __init__(
+        self,
+        native_backend: native.Backend,
+        vp: ViewportTransform | None = None,
+    ):
+        self._b = native_backend
+        self._vp = vp if vp is not None else ViewportTransform()
+
+    def __len__(self) -> int:
+        return 0
+
+    @staticmethod
+    def _unsupported(what: str) -> RuntimeError:
+        return RuntimeError(
+            f"{what} need a native extension with Backend.submit; "
+            "rebuild mini_arcade_native_backend._native"
+        )
+
+    def _rect(self, x, y, w, h) -> tuple[int, int, int, int]:
+        return (*self._vp.map_xy(x, y), *self._vp.map_wh(w, h))
+
+    def rect(self, x, y, w, h, r: int, g: int, b: int, a: int):
+        """Draw a filled rectangle now."""
+        self._b.draw_rect(*self._rect(x, y, w, h), r, g, b, a)
+
+    def line(
+        self, x1, y1, x2, y2, r: int, g: int, b: int, a: int, thickness=1
+    ):
+        """Draw a line segment now."""
+        self._b.draw_line(
+            *self._vp.map_xy(x1, y1),
+            *self._vp.map_xy(x2, y2),
+            r,
+            g,
+            b,
+            a,
+            int(thickness),
+        )
+
+    def texture(
+        self,
+        tex: int,
+        x,
+        y,
+        w,
+        h,
+        angle_deg: float = 0.0,
+        r: int = 255,
+        g: int = 255,
+        b: int = 255,
+        a: int = 255,
+    ):
+        """Draw a texture now."""
+        if (r, g, b, a) != (255, 255, 255, 255):
+            raise self._unsupported("tinted textures")
+        args = (int(tex), *self._rect(x, y, w, h))
+        try:
+            self._b.draw_texture(*args, float(angle_deg))
+        except TypeError:
+            # Older compiled native extensions expose the pre-rotation
+            # 5-argument signature. Fall back so stale builds keep rendering.
+            self._b.draw_texture(*args)
+
+    def texture_region(
+        self, tex: int, src, x, y, w, h, angle_deg: float = 0.0
+    ):
+        """Texture regions are not supported by legacy builds."""
+        raise self._unsupported("texture regions")
+
+    def texture_tiled_y(self, tex: int, x, y, w, h):
+        """Draw a vertically tiled texture now."""
+        self._b.draw_texture_tiled_y(int(tex), *self._rect(x, y, w, h))
+
+    def texture_instances(self, tex: int, instances, colors=None, src=None):
+        """Texture instances are not supported by legacy builds."""
+        raise self._unsupported("texture instances")
+
+    def circle(self, x, y, radius, r: int, g: int, b: int, a: int):
+        """Draw a filled circle now."""
+        sx, sy = self._vp.map_xy(x, y)
+        sr = max(1, int(round(radius * self._vp.s)))
+        self._b.draw_circle(sx, sy, sr, r, g, b, a)
+
+    def poly(self, points, r: int, g: int, b: int, a: int, filled=True):
+        """Draw a polygon now."""
+        points = [self._vp.map_xy(x, y) for (x, y) in points]
+        if filled:
+            self._b.draw_poly(points, r, g, b, a)
+            return
+
+        # Builds without native outlines: one line per edge.
+        for i, (x1, y1) in enumerate(points):
+            x2, y2 = points[(i + 1) % len(points)]
+            self._b.draw_line(
+                int(x1), int(y1), int(x2), int(y2), r, g, b, a, 1
+            )
+
+    def text(
+        self, font_id: int, x, y, text: str, r: int, g: int, b: int, a: int
+    ):
+        """Draw a line of text now."""
+        sx, sy = self._vp.map_xy(x, y)
+        self._b.draw_text(text, sx, sy, r, g, b, a, font_id)
+
+    def text_block(
+        self,
+        font_id: int,
+        x,
+        y,
+        text: str,
+        max_width: int,
+        align: int,
+        r: int,
+        g: int,
+        b: int,
+        a: int,
+    ):
+        """Text blocks are not supported by legacy builds."""
+        raise self._unsupported("text blocks")
+
+    def clip_rect(self, x, y, w, h):
+        """Set the clip rectangle now."""
+        self._b.set_clip_rect(*self._rect(x, y, w, h))
+
+    def clear_clip_rect(self):
+        """Clear the clip rectangle now."""
+        self._b.clear_clip_rect()
+
+    def flush(self):
+        """Nothing is queued, so there is nothing to flush."""
+
+
+DrawCommands = Union[DrawCommandBuffer, ImmediateDrawCommands]
+
+
+def make_draw_commands(
+    native_backend: native.Backend, vp: ViewportTransform | None = None
+) -> DrawCommands:
+    """
+    Create the command sink best suited to the given native backend.
+
+    :param native_backend: The native backend instance.
+    :type native_backend: native.Backend
+    :param vp: Viewport applied by the immediate sink on legacy builds.
+    :type vp: ViewportTransform | None
+    :return: A packed buffer, or an immediate sink for builds without submit.
+    :rtype: DrawCommandBuffer | ImmediateDrawCommands
+    """
+    if hasattr(native_backend, "submit"):
+        return DrawCommandBuffer(native_backend)
+    return ImmediateDrawCommands(native_backend, vp)
@@ -0,0 +1,132 @@
+"""
+Binary input logs for recording and replaying sessions.
+
+A log stores the packed event records of every poll that returned events,
+tagged with the poll's frame number, so a recorded session can be fed back
+frame by frame in place of live input (e.g. for benchmarks under a headless
+backend).
+
+Layout (little-endian): a ``MAIL`` header with the format version and the
+record size, then one chunk per non-empty frame made of the frame number,
+event count and text size, the raw records and the UTF-8 text arena.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from struct import Struct
+from typing import BinaryIO
+
+from mini_arcade_native_backend.mapping.events import EVENT_RECORD_SIZE
+
+INPUT_LOG_MAGIC = b"MAIL"
+INPUT_LOG_VERSION = 1
+_HEADER = Struct("<4sHH")
+_FRAME = Struct("<III")
+
+
+class InputRecorder:
+    """
+    Writes polled event frames to an input log.
+
+    :param path: File to write; replaced if it exists.
+    :type path: str | Path
+    """
+
+    def __init__(self, path: str | Path):
+        self._file: BinaryIO = open(  # pylint: disable=consider-using-with
+            path, "wb"
+        )
+        self._file.write(
+            _HEADER.pack(INPUT_LOG_MAGIC, INPUT_LOG_VERSION, EVENT_RECORD_SIZE)
+        )
+        self.frames = 0
+
+    def write(
+        self, frame: int, records: memoryview, text: memoryview, count: int
+    ):
+        """
+        Append the events of one frame; empty frames are not stored.
+
+        :param frame: Frame number, counted from the start of recording.
+        :type frame: int
+        :param records: Buffer holding at least ``count`` packed records.
+        :type records: memoryview
+        :param text: Text arena of the poll.
+        :type text: memoryview
+        :param count: Number of records.
+        :type count: int
+        """
+        if not count:
+            return
+        size = count * EVENT_RECORD_SIZE
+        self._file.write(_FRAME.pack(frame, count, len(text)))
+        self._file.write(records[:size])
+        self._file.write(text)
+        self.frames += 1
+
+    def close(self):
+        """Flush and close the log."""
+        self._file.close()
+
+
+class InputReplay:
+    """
+    Reads an input log back frame by frame.
+
+    The whole log is loaded up front so replaying never touches the disk
+    while frames are being measured.
+
+    :param path: Log to read.
+    :type path: str | Path
+    :raises ValueError: If the file is not a compatible input log.
+    """
+
+    def __init__(self, path: str | Path):
+        self._data = memoryview(Path(path).read_bytes())
+        if len(self._data) < _HEADER.size:
+            raise ValueError(f"{path}: not an input log")
+        magic, version, record_size = _HEADER.unpack_from(self._data)
+        if magic != INPUT_LOG_MAGIC or version != INPUT_LOG_VERSION:
+            raise ValueError(f"{path}: not an input log (version 1)")
+        if record_size != EVENT_RECORD_SIZE:
+            raise ValueError(
+                f"{path}: records are {record_size} bytes, "
+                f"expected {EVENT_RECORD_SIZE}"
+            )
+        self._pos = _HEADER.size
+
+    @property
+    def finished(self) -> bool:
+        """
+        Whether every frame has been replayed.
+
+        :return: True once the log is exhausted.
+        :rtype: bool
+        """
+        return self._pos >= len(self._data)
+
+    def read(self, frame: int) -> tuple[memoryview, memoryview, int]:
+        """
+        Return the events recorded for a frame.
+
+        :param frame: Frame number, counted from the start of replay.
+        :type frame: int
+        :return: Records, text arena and event count; empty for frames
+            without recorded events.
+        :rtype: tuple[memoryview, memoryview, int]
+        """
+        data = self._data
+        if self.finished:
+            return data[:0], data[:0], 0
+        logged, count, text_bytes = _FRAME.unpack_from(data, self._pos)
+        if logged != frame:
+            return data[:0], data[:0], 0
+        start = self._pos + _FRAME.size
+        text_start = start + count * EVENT_RECORD_SIZE
+        self._pos = text_start + text_bytes
+        return (
+            data[start:text_start],
+            data[text_start : self._pos],
+            count,
+        )
@@ -7,8 +7,10 @@ format used by the mini-arcade core.
 
 from __future__ import annotations
 
+from collections import namedtuple
 from dataclasses import dataclass
-from typing import Callable, Dict, Optional, Tuple
+from struct import Struct
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
 
 from mini_arcade_core.backend.events import (  # pyright: ignore[reportMissingImports]
     Event,
@@ -46,6 +48,139 @@ class _Fields:
 
 # pylint: enable=too-many-instance-attributes
 
+# Field order of the packed event records filled by
+# ``Backend.poll_events_into``; see ``PackedEvent`` in event.h.
+EVENT_FIELDS = (
+    "type",
+    "key",
+    "scancode",
+    "mod",
+    "repeat",
+    "x",
+    "y",
+    "dx",
+    "dy",
+    "button",
+    "wheel_x",
+    "wheel_y",
+    "width",
+    "height",
+    "text_offset",
+    "text_length",
+)
+EVENT_RECORD_SIZE = 4 * len(EVENT_FIELDS)
+# ``numpy.dtype(EVENT_DTYPE)`` views the records as a structured array.
+EVENT_DTYPE = [(name, "<i4") for name in EVENT_FIELDS]
+_FIELD_INDEX = {name: i for i, name in enumerate(EVENT_FIELDS)}
+_STRIDE = len(EVENT_FIELDS)
+_RECORD = Struct(f"<{_STRIDE}i")
+_TEXT_OFFSET = _FIELD_INDEX["text_offset"]
+
+# One decoded event: the ``EVENT_FIELDS`` values and its text, shaped like
+# ``native.Event`` so the mapper reads both the same way.
+PackedRecord = namedtuple("PackedRecord", (*EVENT_FIELDS, "text"))
+
+
+class PackedEvents:
+    """
+    Events of one poll stored as packed int32 records and a text arena.
+
+    Nothing is created per event until it is requested: ``column`` gives
+    strided views for vectorized checks, and indexing or iterating builds
+    core events through the mapper. The storage is reused by the next
+    poll.
+
+    :param mapper: Mapper used to build core events.
+    :type mapper: NativeEventMapper
+    """
+
+    def __init__(self, mapper: NativeEventMapper):
+        self._mapper = mapper
+        self.ints = memoryview(bytearray()).cast("i")
+        self._text = bytearray()
+        self._count = 0
+
+    def reset(
+        self, ints: memoryview, text: bytearray | memoryview, count: int
+    ):
+        """
+        Point the view at freshly polled records.
+
+        :param ints: The records as a flat int32 view.
+        :type ints: memoryview
+        :param text: The UTF-8 text arena.
+        :type text: bytearray | memoryview
+        :param count: Number of valid records.
+        :type count: int
+        """
+        self.ints = ints
+        self._text = text
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def column(self, name: str) -> memoryview:
+        """
+        Get one field of every event as a strided int view.
+
+        :param name: A name from ``EVENT_FIELDS``.
+        :type name: str
+        :return: The field values, one per event.
+        :rtype: memoryview
+        """
+        start = _FIELD_INDEX[name]
+        return self.ints[start : self._count * _STRIDE : _STRIDE]
+
+    def records(self) -> memoryview:
+        """
+        Get the raw records, e.g. for ``numpy.frombuffer`` with
+        ``EVENT_DTYPE``.
+
+        :return: ``len(self) * EVENT_RECORD_SIZE`` bytes.
+        :rtype: memoryview
+        """
+        return self.ints.cast("B")[: self._count * EVENT_RECORD_SIZE]
+
+    def text(self, index: int) -> str:
+        """
+        Get the text of a text-input event.
+
+        :param index: Index of the event.
+        :type index: int
+        :return: The event's text, empty for other events.
+        :rtype: str
+        """
+        base = index * _STRIDE + _TEXT_OFFSET
+        return self._decode_text(self.ints[base], self.ints[base + 1])
+
+    def _decode_text(self, offset: int, length: int) -> str:
+        if not length:
+            return ""
+        return str(self._text[offset : offset + length], "utf-8")
+
+    def record(self, index: int) -> PackedRecord:
+        """
+        Decode one event without mapping it.
+
+        :param index: Index of the event.
+        :type index: int
+        :return: The decoded record.
+        :rtype: PackedRecord
+        """
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        values = _RECORD.unpack_from(self.ints, index * EVENT_RECORD_SIZE)
+        return PackedRecord(*values, self._decode_text(*values[-2:]))
+
+    def __getitem__(self, index: int) -> Event:
+        if index < 0:
+            index += self._count
+        return self._mapper.packed_to_core(self.record(index))
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(self._mapper.to_core_many(self))
+
 
 class NativeEventMapper:
     """
@@ -79,6 +214,8 @@ class NativeEventMapper:
             EventType.WINDOWRESIZED: self._window_resized,
             EventType.TEXTINPUT: self._text_input,
         }
+        # Packed records carry the enum's integer value.
+        self._by_value = {int(k): v for k, v in self._map.items()}
 
     def to_core(self, ev: native.Event) -> Event:
         """
@@ -89,7 +226,66 @@ class NativeEventMapper:
         :return: The mapped core event.
         :rtype: Event
         """
-        etype = self._map.get(ev.type, EventType.UNKNOWN)
+        return self._build(self._map.get(ev.type, EventType.UNKNOWN), ev)
+
+    def native_type(self, etype: EventType) -> native.EventType:
+        """
+        Maps a core event type to the native one.
+
+        :param etype: The core event type.
+        :type etype: EventType
+        :return: The native event type.
+        :rtype: native.EventType
+        :raises ValueError: If the type has no native counterpart.
+        """
+        for native_type, core_type in self._map.items():
+            if core_type == etype:
+                return native_type
+        raise ValueError(f"No native event type for {etype!r}")
+
+    def packed_to_core(self, record: PackedRecord) -> Event:
+        """
+        Maps one packed event record to a core event.
+
+        :param record: The packed record.
+        :type record: PackedRecord
+        :return: The mapped core event.
+        :rtype: Event
+        """
+        return self._build(
+            self._by_value.get(record.type, EventType.UNKNOWN), record
+        )
+
+    def to_core_many(
+        self,
+        events: PackedEvents,
+        types: Iterable[EventType] | None = None,
+    ) -> list[Event]:
+        """
+        Maps packed events to core events, optionally only some types.
+
+        The type filter runs over the packed type column, so skipped events
+        (e.g. a burst of mouse motion) never become Python objects.
+
+        :param events: The polled events.
+        :type events: PackedEvents
+        :param types: Core event types to keep, all if None.
+        :type types: Iterable[EventType] | None
+        :return: The mapped core events, in order.
+        :rtype: list[Event]
+        """
+        wanted = None
+        if types is not None:
+            keep = set(types)
+            wanted = {v for v, t in self._by_value.items() if t in keep}
+        by_value = self._by_value
+        return [
+            self._build(by_value.get(raw, EventType.UNKNOWN), events.record(i))
+            for i, raw in enumerate(events.column("type"))
+            if wanted is None or raw in wanted
+        ]
+
+    def _build(self, etype: EventType, ev) -> Event:
         fields = self._handlers.get(etype, self._noop)(ev)
 
         return Event(
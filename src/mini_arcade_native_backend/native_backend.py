@@ -8,6 +8,7 @@ from pathlib import Path
 
 from mini_arcade_core.backend.viewport import ViewportTransform
 from mini_arcade_native_backend.config import NativeBackendSettings
+from mini_arcade_native_backend.draw_commands import make_draw_commands
 from mini_arcade_native_backend.mapping.events import NativeEventMapper
 from mini_arcade_native_backend.ports.audio import AudioPort
 from mini_arcade_native_backend.ports.capture import CapturePort
@@ -155,11 +156,14 @@ class NativeBackend:
         self._backend = native.Backend(cfg)
 
         mapper = NativeEventMapper(native)
+        # One command stream shared by every port that draws or reads pixels,
+        # so draw order is preserved across ports.
+        commands = make_draw_commands(self._backend, self._vp)
 
         # Build ports
         self.window = WindowPort(self._backend.window)
         self.audio = AudioPort(self._backend.audio)
-        self.render = RenderPort(self._backend, self._vp)
+        self.render = RenderPort(self._backend, self._vp, commands)
         configured_fonts = {
             font.name: (str(font.path) if font.path else None)
             for font in self._settings.core.fonts
@@ -170,9 +174,29 @@ class NativeBackend:
             self._vp,
             resolved_font_path,
             fonts=configured_fonts,
+            commands=commands,
+            textures=self.render,
+            cache_bytes=self._settings.text_cache_bytes,
+            sdf=self._settings.sdf_text,
         )
         self.input = InputPort(self._backend, mapper)
-        self.capture = CapturePort(self._backend)
+        self.capture = CapturePort(
+            self._backend,
+            commands,
+            screenshot_queue=self._settings.screenshot_queue,
+            screenshot_policy=self._settings.screenshot_policy,
+        )
+
+    def shutdown(self):
+        """
+        Stop the ports' background workers, finishing pending screenshots.
+
+        Call once the game loop is done; the ports must not be used after.
+        """
+        if self.text is not None:
+            self.text.close()
+        if self.capture is not None:
+            self.capture.close()
 
     def set_viewport_transform(
         self, offset_x: int, offset_y: int, scale: float
@@ -187,6 +211,9 @@ class NativeBackend:
         :param scale: Scaling factor.
         :type scale: float
         """
+        if self.render is not None:
+            self.render.set_viewport(offset_x, offset_y, scale)
+            return
         self._vp.ox = int(offset_x)
         self._vp.oy = int(offset_y)
         self._vp.s = float(scale)
@@ -195,6 +222,4 @@ class NativeBackend:
         """
         Clear the viewport transformation (reset to defaults).
         """
-        self._vp.ox = 0
-        self._vp.oy = 0
-        self._vp.s = 1.0
+        self.set_viewport_transform(0, 0, 1.0)
@@ -1,13 +1,26 @@
 """
 Capture port implementation for Mini Arcade Native Backend.
-Provides functionality to capture screenshots in BMP format.
+Provides functionality to capture screenshots in BMP format, to save them
+asynchronously as PNG or QOI, and to read pixels into caller-provided buffers.
 """
 
 from __future__ import annotations
 
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable
+
 # Justification: native is a compiled extension module.
 # pylint: disable=no-name-in-module
 from mini_arcade_native_backend import _native as native  # type: ignore
+from mini_arcade_native_backend.draw_commands import (
+    DrawCommands,
+    make_draw_commands,
+)
+from mini_arcade_native_backend.screenshots import ScreenshotWriter
+
+# Byte orders accepted by Backend.capture_into.
+_FORMATS = {"rgba": 0, "bgra": 1, "argb": 2}
 
 
 class CapturePort:
@@ -16,10 +29,32 @@ class CapturePort:
 
     :param native_backend: The native backend instance.
     :type native_backend: native.Backend
+    :param commands: Shared draw-command sink, flushed before reading pixels.
+    :type commands: DrawCommands | None
+    :param screenshot_queue: Asynchronous screenshots that may be pending at
+        once.
+    :type screenshot_queue: int
+    :param screenshot_policy: What save_async does when the queue is full:
+        ``"drop"`` the screenshot or ``"block"`` until one finishes.
+    :type screenshot_policy: str
     """
 
-    def __init__(self, native_backend: native.Backend):
+    def __init__(
+        self,
+        native_backend: native.Backend,
+        commands: DrawCommands | None = None,
+        screenshot_queue: int = 2,
+        screenshot_policy: str = "drop",
+    ):
         self._b = native_backend
+        self._cmds = (
+            commands
+            if commands is not None
+            else make_draw_commands(native_backend)
+        )
+        self._screenshots = ScreenshotWriter(
+            screenshot_queue, screenshot_policy
+        )
 
     def bmp(self, path: str) -> bool:
         """
@@ -30,6 +65,7 @@ class CapturePort:
         :return: True if the screenshot was successfully saved, False otherwise.
         :rtype: bool
         """
+        self._cmds.flush()
         return bool(self._b.capture_bmp(str(path)))
 
     def argb8888_bytes(self) -> tuple[int, int, bytes]:
@@ -39,9 +75,86 @@ class CapturePort:
         :return: A tuple containing the width, height, and pixel data in ARGB8888 format.
         :rtype: tuple[int, int, bytes]
         """
-        # new native function you add
+        self._cmds.flush()
         w, h, data = self._b.capture_argb8888_bytes()
         # ensure types are right
-        if not isinstance(data, (bytes, bytearray)):
+        if isinstance(data, bytearray):
+            data = bytes(data)
+        elif not isinstance(data, bytes):
             raise TypeError(f"capture_argb8888_bytes() returned {type(data)}")
-        return int(w), int(h), bytes(data)
+        return int(w), int(h), data
+
+    def into(
+        self,
+        buffer,
+        rect: tuple[int, int, int, int] | None = None,
+        format: str = "rgba",  # pylint: disable=redefined-builtin
+    ) -> tuple[int, int]:
+        """
+        Read the current screen straight into a caller-provided buffer.
+
+        Nothing is allocated or copied on the way, so a buffer reused across
+        frames makes captures allocation-free.
+
+        :param buffer: Writable buffer-protocol object: a bytearray with
+            tight rows, or an array shaped (h, w, 4) / (h, w) uint32.
+        :type buffer: bytearray | memoryview | numpy.ndarray
+        :param rect: Area (x, y, w, h) in output pixels, or None for the
+            whole screen.
+        :type rect: tuple[int, int, int, int] | None
+        :param format: Byte order of the texels: ``"rgba"``, ``"bgra"`` or
+            ``"argb"``.
+        :type format: str
+        :return: Width and height of the captured area.
+        :rtype: tuple[int, int]
+        :raises ValueError: If the format is unknown.
+        :raises RuntimeError: If the buffer is too small or the read fails.
+        """
+        try:
+            format_id = _FORMATS[format.lower()]
+        except KeyError:
+            raise ValueError(f"unknown pixel format: {format!r}") from None
+        self._cmds.flush()
+        w, h = self._b.capture_into(buffer, rect, format_id)
+        return int(w), int(h)
+
+    def save_async(
+        self,
+        path: str | Path,
+        format: str = "png",  # pylint: disable=redefined-builtin
+        on_done: Callable[[Future[bool]], None] | None = None,
+    ) -> Future[bool]:
+        """
+        Capture the current screen and save it without blocking the frame.
+
+        Only the pixel readback happens now, into a pooled buffer; encoding
+        and writing the file run on a worker thread.
+
+        :param path: The file path to save the screenshot.
+        :type path: str | Path
+        :param format: ``"png"`` or ``"qoi"``.
+        :type format: str
+        :param on_done: Called with the future once it completes.
+        :type on_done: Callable[[Future[bool]], None] | None
+        :return: Resolves to True once the file is written, or False if the
+            screenshot was dropped because the queue was full.
+        :rtype: Future[bool]
+        :raises ValueError: If the format is unknown.
+        """
+        self._cmds.flush()
+        return self._screenshots.save(
+            lambda buffer: self._b.capture_into(buffer, None, 0),
+            self._b.output_size(),
+            path,
+            format=format,
+            on_done=on_done,
+        )
+
+    @property
+    def screenshots_dropped(self) -> int:
+        """Asynchronous screenshots dropped because the queue was full."""
+        return self._screenshots.dropped
+
+    def close(self):
+        """Finish pending asynchronous screenshots."""
+        self._screenshots.close()
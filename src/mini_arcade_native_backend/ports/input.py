@@ -5,14 +5,22 @@ Provides functionality to poll and map input events.
 
 from __future__ import annotations
 
+from pathlib import Path
+
 from mini_arcade_core.backend.events import (  # pyright: ignore[reportMissingImports]
     Event,
+    EventType,
 )
 
 # Justification: native is a compiled extension module.
 # pylint: disable=no-name-in-module
 from mini_arcade_native_backend import _native as native  # type: ignore
-from mini_arcade_native_backend.mapping.events import NativeEventMapper
+from mini_arcade_native_backend.input_log import InputRecorder, InputReplay
+from mini_arcade_native_backend.mapping.events import (
+    EVENT_RECORD_SIZE,
+    NativeEventMapper,
+    PackedEvents,
+)
 
 
 class InputPort:
@@ -30,6 +38,20 @@ class InputPort:
     ):
         self._b = native_backend
         self._mapper = mapper
+        self._packed = PackedEvents(mapper)
+        self._records = bytearray()
+        self._text = bytearray()
+        self._grow(256, 1024)
+        self._keys: memoryview | None = None
+        self._frame = 0
+        self._recorder: InputRecorder | None = None
+        self._replay: InputReplay | None = None
+
+    def _grow(self, count: int, text_bytes: int):
+        # Fresh buffers rather than resizing: old views keep the old ones.
+        self._records = bytearray(count * EVENT_RECORD_SIZE)
+        self._text = bytearray(text_bytes)
+        self._ints = memoryview(self._records).cast("i")
 
     def poll(self) -> list[Event]:
         """
@@ -38,4 +60,154 @@ class InputPort:
         :return: A list of core events.
         :rtype: list[Event]
         """
+        if self._replay is not None or hasattr(self._b, "poll_events_into"):
+            return self._mapper.to_core_many(self.poll_packed())
         return [self._mapper.to_core(ev) for ev in self._b.poll_events()]
+
+    def set_event_enabled(self, etype: EventType, enabled: bool = True):
+        """
+        Enable or disable delivery of an event type.
+
+        Disabled types are dropped natively, so ignoring e.g. mouse motion
+        costs nothing per event in Python.
+
+        :param etype: The core event type.
+        :type etype: EventType
+        :param enabled: Whether events of this type are delivered.
+        :type enabled: bool
+        """
+        if hasattr(self._b, "set_event_enabled"):
+            self._b.set_event_enabled(self._mapper.native_type(etype), enabled)
+
+    def set_coalesce_motion(self, enabled: bool = True):
+        """
+        Merge consecutive mouse motion events into one per poll.
+
+        The merged event has the latest position and the summed deltas.
+
+        :param enabled: Whether to coalesce motion events.
+        :type enabled: bool
+        """
+        if hasattr(self._b, "set_coalesce_mouse_motion"):
+            self._b.set_coalesce_mouse_motion(enabled)
+
+    def keyboard_state(self) -> memoryview:
+        """
+        Pressed state of every key, indexed by SDL scancode.
+
+        The view is read-only and shares SDL's own array, so it is never
+        copied and reflects the latest poll; it can be kept across frames.
+
+        :return: One byte per scancode, non-zero while the key is held.
+        :rtype: memoryview
+        """
+        if self._keys is None:
+            self._keys = self._b.keyboard_state()
+        return self._keys
+
+    def mouse_state(self) -> tuple[int, int, int]:
+        """
+        Mouse position and buttons as of the latest poll.
+
+        The position is scaled to drawable pixels like mouse events.
+
+        :return: x, y and the SDL button mask (bit ``button - 1`` set while
+            that button is held).
+        :rtype: tuple[int, int, int]
+        """
+        return self._b.mouse_state()
+
+    def start_recording(self, path: str | Path):
+        """
+        Record every following poll to an input log (see ``input_log``).
+
+        Frames are numbered from 0 at this call, one per poll.
+
+        :param path: Log file to write.
+        :type path: str | Path
+        """
+        self.stop_recording()
+        self._recorder = InputRecorder(path)
+        self._frame = 0
+
+    def stop_recording(self):
+        """Stop recording and close the log."""
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+
+    def start_replay(self, path: str | Path):
+        """
+        Replay an input log in place of live input.
+
+        Each poll returns the events recorded for the same frame number.
+        Live events are still drained, so the window stays responsive, but
+        they are discarded. Replay ends by itself once the log is exhausted.
+
+        :param path: Log file to replay.
+        :type path: str | Path
+        :raises ValueError: If the file is not a compatible input log.
+        """
+        self._replay = InputReplay(path)
+        self._frame = 0
+
+    def stop_replay(self):
+        """Return to live input."""
+        self._replay = None
+
+    @property
+    def replaying(self) -> bool:
+        """
+        Whether polls are served from an input log.
+
+        :return: True while a replay is running.
+        :rtype: bool
+        """
+        return self._replay is not None
+
+    def poll_packed(self) -> PackedEvents:
+        """
+        Poll for input events into reused packed buffers.
+
+        No per-event objects are created until events are read from the
+        result, so high-rate input is cheap to drain or filter (see
+        ``NativeEventMapper.to_core_many``). The result is reused by the
+        next poll.
+
+        :return: The polled events.
+        :rtype: PackedEvents
+        """
+        count, text_bytes = self._poll_native()
+        frame = self._frame
+        self._frame += 1
+
+        if self._replay is not None:
+            records, text, count = self._replay.read(frame)
+            if self._replay.finished:
+                self._replay = None
+            self._packed.reset(records.cast("i"), text, count)
+            return self._packed
+
+        if self._recorder is not None:
+            self._recorder.write(
+                frame,
+                memoryview(self._records),
+                memoryview(self._text)[:text_bytes],
+                count,
+            )
+        self._packed.reset(self._ints, self._text, count)
+        return self._packed
+
+    def _poll_native(self) -> tuple[int, int]:
+        if not hasattr(self._b, "poll_events_into"):
+            return 0, 0
+        while True:
+            count, text_bytes, fits = self._b.poll_events_into(
+                self._records, self._text
+            )
+            if fits:
+                return count, text_bytes
+            capacity = len(self._records) // EVENT_RECORD_SIZE
+            self._grow(
+                max(count, capacity * 2), max(text_bytes, len(self._text) * 2)
+            )
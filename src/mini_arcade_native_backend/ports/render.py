@@ -5,6 +5,10 @@ Provides functionality to draw shapes and manage rendering state.
 
 from __future__ import annotations
 
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
 from mini_arcade_core.backend.utils import (  # pyright: ignore[reportMissingImports]
     rgba,
 )
@@ -13,25 +17,204 @@ from mini_arcade_core.backend.viewport import ViewportTransform
 # Justification: native is a compiled extension module.
 # pylint: disable=no-name-in-module
 from mini_arcade_native_backend import _native as native  # type: ignore
+from mini_arcade_native_backend.atlas import AtlasRegion
+from mini_arcade_native_backend.draw_commands import (
+    DrawCommands,
+    make_draw_commands,
+)
 
 # Justification: Methods like draw_rect have many parameters because of color and position.
 # We want to keep the API simple and straightforward.
 # pylint: disable=too-many-arguments,too-many-positional-arguments
 
 
+@dataclass
+class _Layer:
+    """Offscreen render target sized in virtual units."""
+
+    w: int
+    h: int
+    texture: int = 0
+    scale: float = 0.0
+    dirty: bool = True
+
+
+# Justification: The port is the backend's single rendering surface: the core
+# render protocol plus layers, streaming textures and the texture budget.
+# pylint: disable-next=too-many-public-methods
 class RenderPort:
     """
     Render port for the Mini Arcade native backend.
 
     :param native_backend: The native backend instance.
     :type native_backend: native.Backend
-    :param vp: The viewport transform.
+    :param vp: The viewport transform. Draw calls take virtual coordinates;
+        the native renderer maps them, so change it through ``set_viewport``.
     :type vp: ViewportTransform
+    :param commands: Shared draw-command sink. Primitives are queued here and
+        replayed natively on ``flush``/``end_frame``.
+    :type commands: DrawCommands | None
     """
 
-    def __init__(self, native_backend: native.Backend, vp: ViewportTransform):
+    def __init__(
+        self,
+        native_backend: native.Backend,
+        vp: ViewportTransform,
+        commands: DrawCommands | None = None,
+    ):
         self._b = native_backend
         self._vp = vp
+        self._cmds = (
+            commands
+            if commands is not None
+            else make_draw_commands(native_backend, vp)
+        )
+        self._sync_viewport()
+        self._layers: dict[int, _Layer] = {}
+        self._next_layer = 1
+        # (layer id, saved viewport origin) for every open begin_layer.
+        self._layer_stack: list[tuple[int, int, int]] = []
+        self._eviction_listeners: list[Callable[[list[int]], None]] = []
+        self._texture_budget = 0
+        self._frame_listeners: list[Callable[[], None]] = []
+
+    def flush(self):
+        """Submit all queued draw commands to the native renderer."""
+        self._cmds.flush()
+
+    def _sync_viewport(self):
+        # Builds without a native viewport map in the immediate sink instead.
+        set_viewport = getattr(self._b, "set_viewport", None)
+        if set_viewport is not None:
+            set_viewport(self._vp.ox, self._vp.oy, self._vp.s)
+
+    def set_viewport(self, ox: int, oy: int, s: float):
+        """
+        Set the virtual-to-screen transform applied to every draw call.
+
+        Queued commands are flushed first so they keep the old transform.
+
+        :param ox: Horizontal offset in screen pixels.
+        :type ox: int
+        :param oy: Vertical offset in screen pixels.
+        :type oy: int
+        :param s: Scale from virtual units to screen pixels.
+        :type s: float
+        """
+        self._cmds.flush()
+        self._vp.ox = int(ox)
+        self._vp.oy = int(oy)
+        self._vp.s = float(s)
+        self._sync_viewport()
+
+    def render_stats(self) -> dict[str, int]:
+        """
+        Get the native renderer's state-change counters.
+
+        Queued commands are flushed first so the counters include them.
+
+        :return: ``state_changes``, ``state_skipped`` and
+            ``texture_switches`` since the last reset.
+        :rtype: dict[str, int]
+        """
+        self._cmds.flush()
+        stats = self._b.render_stats()
+        return {
+            "state_changes": int(stats.state_changes),
+            "state_skipped": int(stats.state_skipped),
+            "texture_switches": int(stats.texture_switches),
+        }
+
+    def texture_stats(self) -> dict[str, int]:
+        """
+        Get the native texture memory totals.
+
+        Useful to spot texture leaks in long-running sessions.
+
+        :return: ``count``, ``bytes``, ``evictable_bytes``, ``budget``
+            (0 = unlimited) and ``evictions`` so far.
+        :rtype: dict[str, int]
+        """
+        stats = self._b.texture_stats()
+        return {
+            "count": int(stats.count),
+            "bytes": int(stats.bytes),
+            "evictable_bytes": int(stats.evictable_bytes),
+            "budget": int(stats.budget),
+            "evictions": int(stats.evictions),
+        }
+
+    def set_texture_budget(self, budget_bytes: int):
+        """
+        Cap texture memory, counted as w * h * 4 bytes per texture.
+
+        When a new texture pushes the total over the budget, evictable
+        textures not drawn during the current frame are destroyed, least
+        recently drawn first. Other textures are never evicted, so the
+        budget is soft.
+
+        :param budget_bytes: The budget in bytes, 0 for unlimited.
+        :type budget_bytes: int
+        """
+        self._cmds.flush()
+        self._texture_budget = max(0, int(budget_bytes))
+        self._b.set_texture_budget(self._texture_budget)
+        self._dispatch_evictions()
+
+    def set_texture_evictable(self, tex: int, evictable: bool = True):
+        """
+        Allow or forbid evicting a texture to honor the texture budget.
+
+        :param tex: The texture ID.
+        :type tex: int
+        :param evictable: Whether the texture may be evicted.
+        :type evictable: bool
+        """
+        self._b.set_texture_evictable(int(tex), bool(evictable))
+
+    def add_eviction_listener(self, callback: Callable[[list[int]], None]):
+        """
+        Register a callback receiving the IDs of evicted textures.
+
+        Owners of evictable textures use it to drop their stale handles.
+
+        :param callback: Called with the list of evicted texture IDs.
+        :type callback: Callable[[list[int]], None]
+        """
+        self._eviction_listeners.append(callback)
+
+    def add_frame_listener(self, callback: Callable[[], None]):
+        """
+        Register a callback run at the start of every frame.
+
+        Ports use it to upload work prepared off the render thread.
+
+        :param callback: Called with no arguments after the native
+            ``begin_frame``.
+        :type callback: Callable[[], None]
+        """
+        self._frame_listeners.append(callback)
+
+    def _flush_before_create(self):
+        # Native eviction only spares textures drawn this frame, and queued
+        # draws haven't reached it yet, so they must be submitted first.
+        if self._texture_budget:
+            self._cmds.flush()
+
+    def _dispatch_evictions(self):
+        take = getattr(self._b, "take_evicted_textures", None)
+        if take is None:
+            return
+        evicted = [int(tex) for tex in take()]
+        if not evicted:
+            return
+        for callback in self._eviction_listeners:
+            callback(evicted)
+
+    def reset_render_stats(self):
+        """Reset the native renderer's state-change counters."""
+        self._cmds.flush()
+        self._b.reset_render_stats()
 
     def set_clear_color(self, r: int, g: int, b: int):
         """
@@ -48,10 +231,14 @@ class RenderPort:
 
     def begin_frame(self):
         """Begin a new rendering frame."""
+        self._cmds.flush()
         self._b.begin_frame()
+        for callback in self._frame_listeners:
+            callback()
 
     def end_frame(self):
         """End the current rendering frame."""
+        self._cmds.flush()
         self._b.end_frame()
 
     def draw_rect(self, x: int, y: int, w: int, h: int, color=(255, 255, 255)):
@@ -70,9 +257,7 @@ class RenderPort:
         :type color: tuple[int, int, int] | tuple[int, int, int, int]
         """
         r, g, b, a = rgba(color)
-        sx, sy = self._vp.map_xy(x, y)
-        sw, sh = self._vp.map_wh(w, h)
-        self._b.draw_rect(sx, sy, sw, sh, r, g, b, a)
+        self._cmds.rect(x, y, w, h, r, g, b, a)
 
     def draw_line(
         self,
@@ -98,9 +283,7 @@ class RenderPort:
         :type color: tuple[int, int, int] | tuple[int, int, int, int]
         """
         r, g, b, a = rgba(color)
-        sx1, sy1 = self._vp.map_xy(x1, y1)
-        sx2, sy2 = self._vp.map_xy(x2, y2)
-        self._b.draw_line(sx1, sy1, sx2, sy2, r, g, b, a, thickness)
+        self._cmds.line(x1, y1, x2, y2, r, g, b, a, thickness)
 
     def draw_circle(self, x: int, y: int, radius: int, color=(255, 255, 255)):
         """
@@ -112,16 +295,7 @@ class RenderPort:
         :param color: (R,G,B) or (R,G,B,A)
         """
         r, g, b, a = rgba(color)
-
-        sx, sy = self._vp.map_xy(int(x), int(y))
-
-        d = int(radius) * 2
-        sw, sh = self._vp.map_wh(d, d)
-        sr = max(1, int(min(sw, sh) // 2))
-
-        self._b.draw_circle(
-            int(sx), int(sy), int(sr), int(r), int(g), int(b), int(a)
-        )
+        self._cmds.circle(x, y, radius, r, g, b, a)
 
     def draw_poly(
         self,
@@ -145,29 +319,55 @@ class RenderPort:
         if len(points) < 3:
             return
 
-        mapped = [self._vp.map_xy(int(x), int(y)) for (x, y) in points]
+        self._cmds.poly(points, r, g, b, a, filled)
 
-        if filled:
-            self._b.draw_poly(mapped, r, g, b, a)
-            return
+    @staticmethod
+    def _batch_colors(colors):
+        if isinstance(colors, (tuple, list)):
+            return rgba(colors)
+        return colors
 
-        # outline-only fallback (since C++ draw_poly is filled)
-        # Justification: Disabling consider-using-enumerate because we need to access
-        # the next point in the list for drawing lines.
-        # pylint: disable=consider-using-enumerate
-        for i in range(len(mapped)):
-            x1, y1 = mapped[i]
-            x2, y2 = mapped[(i + 1) % len(mapped)]
-            self._b.draw_line(
-                int(x1),
-                int(y1),
-                int(x2),
-                int(y2),
-                int(r),
-                int(g),
-                int(b),
-                int(a),
-            )
+    def draw_rects(self, rects, colors=None):
+        """
+        Draw many filled rectangles in one native call.
+
+        :param rects: Buffer of shape (N, 4) holding x, y, w, h, or (N, 8)
+            with trailing per-rect RGBA columns.
+        :type rects: numpy.ndarray | memoryview
+        :param colors: One (R, G, B[, A]) color for every rect, an (N, 4)
+            uint8 buffer of per-rect colors, or None for inline colors/white.
+        :type colors: tuple | numpy.ndarray | memoryview | None
+        """
+        self._cmds.flush()
+        self._b.draw_rects(rects, self._batch_colors(colors))
+
+    def draw_lines(self, segments, colors=None):
+        """
+        Draw many line segments in one native call.
+
+        :param segments: Buffer of shape (N, 4) holding x1, y1, x2, y2, or
+            (N, 8) with trailing per-segment RGBA columns.
+        :type segments: numpy.ndarray | memoryview
+        :param colors: One (R, G, B[, A]) color for every segment, an (N, 4)
+            uint8 buffer of per-segment colors, or None for inline colors/white.
+        :type colors: tuple | numpy.ndarray | memoryview | None
+        """
+        self._cmds.flush()
+        self._b.draw_lines(segments, self._batch_colors(colors))
+
+    def draw_points(self, points, colors=None):
+        """
+        Draw many single-pixel points in one native call.
+
+        :param points: Buffer of shape (N, 2) holding x, y, or (N, 6) with
+            trailing per-point RGBA columns.
+        :type points: numpy.ndarray | memoryview
+        :param colors: One (R, G, B[, A]) color for every point, an (N, 4)
+            uint8 buffer of per-point colors, or None for inline colors/white.
+        :type colors: tuple | numpy.ndarray | memoryview | None
+        """
+        self._cmds.flush()
+        self._b.draw_points(points, self._batch_colors(colors))
 
     def set_clip_rect(self, x: int, y: int, w: int, h: int):
         """
@@ -182,16 +382,19 @@ class RenderPort:
         :param h: The height of the clipping rectangle.
         :type h: int
         """
-        sx, sy = self._vp.map_xy(x, y)
-        sw, sh = self._vp.map_wh(w, h)
-        self._b.set_clip_rect(sx, sy, sw, sh)
+        self._cmds.clip_rect(x, y, w, h)
 
     def clear_clip_rect(self):
         """Clear the clipping rectangle."""
-        self._b.clear_clip_rect()
+        self._cmds.clear_clip_rect()
 
     def create_texture_rgba(
-        self, w: int, h: int, pixels: bytes, pitch: int | None = None
+        self,
+        w: int,
+        h: int,
+        pixels: bytes,
+        pitch: int | None = None,
+        evictable: bool = False,
     ) -> int:
         """
         Create a texture from RGBA pixel data.
@@ -204,12 +407,94 @@ class RenderPort:
         :type pixels: bytes
         :param pitch: The number of bytes in a row of pixel data. If None, defaults to w * 4.
         :type pitch: int | None
+        :param evictable: Whether the texture may be evicted to honor the
+            texture budget. Owners must listen for evictions, see
+            ``add_eviction_listener``.
+        :type evictable: bool
+        :return: The texture ID, or 0 on failure.
+        :rtype: int
         """
         if pitch is None:
             pitch = w * 4
-        return int(
+        self._flush_before_create()
+        tex = int(
             self._b.create_texture_rgba(int(w), int(h), pixels, int(pitch))
         )
+        if evictable and tex:
+            self._b.set_texture_evictable(tex, True)
+        self._dispatch_evictions()
+        return tex
+
+    def create_texture_streaming(self, w: int, h: int) -> int:
+        """
+        Create an RGBA texture meant to be rewritten frequently.
+
+        :param w: The width of the texture.
+        :type w: int
+        :param h: The height of the texture.
+        :type h: int
+        :return: The texture ID, or 0 on failure.
+        :rtype: int
+        """
+        self._flush_before_create()
+        tex = int(self._b.create_texture_streaming(int(w), int(h)))
+        self._dispatch_evictions()
+        return tex
+
+    def update_texture(
+        self,
+        tex: int,
+        pixels,
+        rect: tuple[int, int, int, int] | None = None,
+        pitch: int | None = None,
+    ):
+        """
+        Upload new RGBA pixels into a texture without an intermediate copy.
+
+        Queued draws of the texture are submitted first, so they keep
+        showing the previous contents.
+
+        :param tex: The texture ID.
+        :type tex: int
+        :param pixels: Any buffer-protocol object: flat RGBA bytes, or an
+            array shaped (h, w, 4) / (h, w) uint32 with contiguous rows.
+        :type pixels: bytes | bytearray | memoryview | numpy.ndarray
+        :param rect: Area (x, y, w, h) to update, or None for the whole texture.
+        :type rect: tuple[int, int, int, int] | None
+        :param pitch: Bytes per row for flat buffers. Defaults to tight rows.
+        :type pitch: int | None
+        :raises RuntimeError: If the buffer is too small or the upload fails.
+        """
+        self._cmds.flush()
+        self._b.update_texture(
+            int(tex), pixels, rect, -1 if pitch is None else int(pitch)
+        )
+
+    @contextmanager
+    def lock_texture(
+        self, tex: int, rect: tuple[int, int, int, int] | None = None
+    ) -> Iterator[tuple[memoryview, int]]:
+        """
+        Map a streaming texture's pixels for writing.
+
+        The previous contents are undefined, so every texel of the area
+        must be written. The view is released when the block exits.
+
+        :param tex: The texture ID.
+        :type tex: int
+        :param rect: Area (x, y, w, h) to lock, or None for the whole texture.
+        :type rect: tuple[int, int, int, int] | None
+        :return: A writable view of the locked pixels and its row pitch.
+        :rtype: Iterator[tuple[memoryview, int]]
+        :raises RuntimeError: If the texture is not a streaming texture.
+        """
+        self._cmds.flush()
+        view, pitch = self._b.lock_texture(int(tex), rect)
+        try:
+            yield view, pitch
+        finally:
+            view.release()
+            self._b.unlock_texture(int(tex))
 
     def destroy_texture(self, tex: int) -> None:
         """
@@ -218,6 +503,8 @@ class RenderPort:
         :param tex: The texture ID to destroy.
         :type tex: int
         """
+        # Queued draws may still reference the texture.
+        self._cmds.flush()
         self._b.destroy_texture(int(tex))
 
     def draw_texture(
@@ -228,6 +515,7 @@ class RenderPort:
         w: int,
         h: int,
         angle_deg: float = 0.0,
+        tint=None,
     ):
         """
         Draw a texture at the specified position and size.
@@ -244,22 +532,263 @@ class RenderPort:
         :type h: int
         :param angle_deg: Clockwise rotation angle in degrees around texture center.
         :type angle_deg: float
+        :param tint: Color multiplied into the texture, e.g. to color a white
+            mask or fade a sprite. None draws the texture unchanged.
+        :type tint: tuple[int, int, int] | tuple[int, int, int, int] | None
+        """
+        if tint is None:
+            self._cmds.texture(int(tex), x, y, w, h, angle_deg)
+            return
+        self._cmds.texture(int(tex), x, y, w, h, angle_deg, *rgba(tint))
+
+    def draw_texture_region(
+        self,
+        tex: int,
+        src: tuple[int, int, int, int],
+        x: int,
+        y: int,
+        w: int,
+        h: int,
+        angle_deg: float = 0.0,
+    ):
         """
-        sx, sy = self._vp.map_xy(x, y)
-        sw, sh = self._vp.map_wh(w, h)
-        args = (
-            int(tex),
-            int(sx),
-            int(sy),
-            int(sw),
-            int(sh),
+        Draw part of a texture at the specified position and size.
+
+        Consecutive region draws from the same texture are submitted to the
+        GPU as one geometry batch.
+
+        :param tex: The texture ID.
+        :type tex: int
+        :param src: Source rect (x, y, w, h) inside the texture, in texels.
+        :type src: tuple[int, int, int, int]
+        :param x: The x-coordinate to draw the region.
+        :type x: int
+        :param y: The y-coordinate to draw the region.
+        :type y: int
+        :param w: The width to draw the region.
+        :type w: int
+        :param h: The height to draw the region.
+        :type h: int
+        :param angle_deg: Clockwise rotation angle in degrees around the center.
+        :type angle_deg: float
+        """
+        self._cmds.texture_region(int(tex), src, x, y, w, h, angle_deg)
+
+    def draw_region(
+        self,
+        region: AtlasRegion,
+        x: int,
+        y: int,
+        w: int | None = None,
+        h: int | None = None,
+        angle_deg: float = 0.0,
+    ):
+        """
+        Draw an atlas or sprite-sheet region.
+
+        :param region: The region to draw.
+        :type region: AtlasRegion
+        :param x: The x-coordinate to draw the region.
+        :type x: int
+        :param y: The y-coordinate to draw the region.
+        :type y: int
+        :param w: The width to draw the region. Defaults to its texel width.
+        :type w: int | None
+        :param h: The height to draw the region. Defaults to its texel height.
+        :type h: int | None
+        :param angle_deg: Clockwise rotation angle in degrees around the center.
+        :type angle_deg: float
+        """
+        self.draw_texture_region(
+            region.texture,
+            region.src_rect,
+            x,
+            y,
+            region.w if w is None else w,
+            region.h if h is None else h,
+            angle_deg,
         )
-        try:
-            self._b.draw_texture(*args, float(angle_deg))
-        except TypeError:
-            # Older compiled native extensions expose the pre-rotation
-            # 5-argument signature. Fall back so stale builds keep rendering.
-            self._b.draw_texture(*args)
+
+    def draw_texture_instances(
+        self,
+        tex: int | AtlasRegion,
+        instances,
+        colors=None,
+    ):
+        """
+        Draw many copies of a texture or atlas region in one native call.
+
+        :param tex: The texture ID, or an atlas region to draw from.
+        :type tex: int | AtlasRegion
+        :param instances: Buffer of shape (N, 5) holding x, y, w, h and a
+            clockwise angle in degrees, or (N, 9) with trailing per-instance
+            RGBA tint columns.
+        :type instances: numpy.ndarray | memoryview
+        :param colors: One (R, G, B[, A]) tint for every instance, an (N, 4)
+            uint8 buffer of per-instance tints, or None for inline tints/white.
+        :type colors: tuple | numpy.ndarray | memoryview | None
+        """
+        src = None
+        if isinstance(tex, AtlasRegion):
+            src = tex.src_rect
+            tex = tex.texture
+        self._cmds.texture_instances(
+            int(tex), instances, self._batch_colors(colors), src
+        )
+
+    def create_layer(self, w: int, h: int) -> int:
+        """
+        Create an offscreen layer that caches rendered content.
+
+        The backing texture is allocated on the first ``begin_layer`` at the
+        current viewport scale, so layers stay crisp after a resize.
+
+        :param w: The width of the layer in virtual units.
+        :type w: int
+        :param h: The height of the layer in virtual units.
+        :type h: int
+        :return: The layer ID.
+        :rtype: int
+        """
+        layer_id = self._next_layer
+        self._next_layer += 1
+        self._layers[layer_id] = _Layer(int(w), int(h))
+        return layer_id
+
+    def layer_dirty(self, layer_id: int) -> bool:
+        """
+        Check whether a layer must be rendered again.
+
+        A layer is dirty until its first ``end_layer``, after
+        ``invalidate_layer`` and whenever the viewport scale has changed.
+
+        :param layer_id: The layer ID.
+        :type layer_id: int
+        :return: True if the cached content is missing or stale.
+        :rtype: bool
+        """
+        layer = self._layers[layer_id]
+        return layer.dirty or layer.scale != self._vp.s
+
+    def invalidate_layer(self, layer_id: int | None = None):
+        """
+        Mark a layer, or every layer, as needing to be rendered again.
+
+        :param layer_id: The layer ID, or None for all layers.
+        :type layer_id: int | None
+        """
+        layers = (
+            self._layers.values()
+            if layer_id is None
+            else [self._layers[layer_id]]
+        )
+        for layer in layers:
+            layer.dirty = True
+
+    def begin_layer(self, layer_id: int, clear=(0, 0, 0, 0)):
+        """
+        Redirect drawing into a layer until the matching ``end_layer``.
+
+        While the layer is open, (0, 0) is its top-left corner.
+
+        :param layer_id: The layer ID.
+        :type layer_id: int
+        :param clear: Color the layer is cleared to, or None to keep the
+            previous content.
+        :type clear: tuple[int, int, int, int] | None
+        :raises RuntimeError: If the layer texture can't be created.
+        """
+        layer = self._layers[layer_id]
+        self._cmds.flush()
+
+        if not layer.texture or layer.scale != self._vp.s:
+            if layer.texture:
+                self._b.destroy_texture(layer.texture)
+            pw, ph = self._vp.map_wh(layer.w, layer.h)
+            layer.texture = int(
+                self._b.create_render_target(max(1, pw), max(1, ph))
+            )
+            layer.scale = self._vp.s
+            layer.dirty = True
+            self._dispatch_evictions()
+            if not layer.texture:
+                raise RuntimeError(
+                    f"cannot create texture for layer {layer_id}"
+                )
+
+        self._b.set_render_target(layer.texture)
+        if clear is not None:
+            self._b.clear(*rgba(clear))
+
+        self._layer_stack.append((layer_id, self._vp.ox, self._vp.oy))
+        self._vp.ox = 0
+        self._vp.oy = 0
+        self._sync_viewport()
+
+    def end_layer(self):
+        """
+        Finish drawing into the current layer and mark it clean.
+
+        :raises RuntimeError: If no layer is open.
+        """
+        if not self._layer_stack:
+            raise RuntimeError("end_layer called without begin_layer")
+
+        self._cmds.flush()
+        layer_id, ox, oy = self._layer_stack.pop()
+        self._layers[layer_id].dirty = False
+        self._vp.ox = ox
+        self._vp.oy = oy
+        self._sync_viewport()
+
+        parent = 0
+        if self._layer_stack:
+            parent = self._layers[self._layer_stack[-1][0]].texture
+        self._b.set_render_target(parent)
+
+    def draw_layer(
+        self,
+        layer_id: int,
+        x: int,
+        y: int,
+        w: int | None = None,
+        h: int | None = None,
+    ):
+        """
+        Draw a layer's cached content.
+
+        :param layer_id: The layer ID.
+        :type layer_id: int
+        :param x: The x-coordinate to draw the layer.
+        :type x: int
+        :param y: The y-coordinate to draw the layer.
+        :type y: int
+        :param w: The width to draw the layer. Defaults to its own width.
+        :type w: int | None
+        :param h: The height to draw the layer. Defaults to its own height.
+        :type h: int | None
+        """
+        layer = self._layers[layer_id]
+        if not layer.texture:
+            return
+        self._cmds.texture(
+            layer.texture,
+            x,
+            y,
+            layer.w if w is None else w,
+            layer.h if h is None else h,
+        )
+
+    def destroy_layer(self, layer_id: int):
+        """
+        Destroy a layer and its texture.
+
+        :param layer_id: The layer ID.
+        :type layer_id: int
+        """
+        layer = self._layers.pop(layer_id)
+        if layer.texture:
+            self.destroy_texture(layer.texture)
 
     def draw_texture_tiled_y(self, tex: int, x: int, y: int, w: int, h: int):
         """
@@ -276,8 +805,4 @@ class RenderPort:
         :param h: The height to draw the texture.
         :type h: int
         """
-        sx, sy = self._vp.map_xy(x, y)
-        sw, sh = self._vp.map_wh(w, h)
-        self._b.draw_texture_tiled_y(
-            int(tex), int(sx), int(sy), int(sw), int(sh)
-        )
+        self._cmds.texture_tiled_y(int(tex), x, y, w, h)
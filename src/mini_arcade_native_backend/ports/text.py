@@ -5,7 +5,10 @@ Provides functionality to draw and measure text.
 
 from __future__ import annotations
 
+import threading
 from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterable
 
 from PIL import Image, ImageDraw, ImageFont
 
@@ -17,11 +20,63 @@ from mini_arcade_core.backend.viewport import ViewportTransform
 # Justification: native is a compiled extension module.
 # pylint: disable=no-name-in-module
 from mini_arcade_native_backend import _native as native  # type: ignore
+from mini_arcade_native_backend.config import DEFAULT_TEXT_CACHE_BYTES
+from mini_arcade_native_backend.draw_commands import (
+    DrawCommands,
+    make_draw_commands,
+)
+
+if TYPE_CHECKING:
+    from mini_arcade_native_backend.ports.render import RenderPort
 
 # Justification: Methods like draw have many parameters because of color and position.
 # We want to keep the API simple and straightforward.
 # pylint: disable=too-many-arguments,too-many-positional-arguments
 
+# Horizontal alignment of text blocks, as understood by the native layout.
+_ALIGN = {"left": 0, "center": 1, "right": 2}
+
+# Threads rasterizing prewarmed strings; PIL and the native glyph renderer
+# release the GIL while drawing.
+_PREWARM_WORKERS = 2
+
+# FreeType faces aren't thread-safe, so each worker opens its own fonts.
+_worker_fonts = threading.local()
+
+
+def _mask_pixels(text: str, font) -> tuple[int, int, bytes]:
+    # White RGBA coverage mask of the text's ink box.
+    bbox = font.getbbox(text or " ")
+    width = max(1, int(bbox[2] - bbox[0]))
+    height = max(1, int(bbox[3] - bbox[1]))
+    mask = Image.new("L", (width, height), 0)
+    ImageDraw.Draw(mask).text(
+        (-bbox[0], -bbox[1]),
+        text,
+        font=font,
+        fill=255,
+    )
+    white = Image.new("L", (width, height), 255)
+    image = Image.merge("RGBA", (white, white, white, mask))
+    return width, height, image.tobytes()
+
+
+def _render_mask_in_worker(
+    text: str, font_path: str | None, size: int
+) -> tuple[int, int, bytes]:
+    fonts = getattr(_worker_fonts, "fonts", None)
+    if fonts is None or len(fonts) > 16:
+        fonts = _worker_fonts.fonts = {}
+    font = fonts.get((font_path, size))
+    if font is None:
+        font = (
+            ImageFont.truetype(font_path, size)
+            if font_path
+            else ImageFont.load_default()
+        )
+        fonts[(font_path, size)] = font
+    return _mask_pixels(text, font)
+
 
 class TextPort:
     """
@@ -33,6 +88,22 @@ class TextPort:
     :type vp: ViewportTransform
     :param font_path: The path to the font file to use for text rendering.
     :type font_path: str | None
+    :param commands: Shared draw-command sink, so text keeps its draw order
+        relative to primitives queued by the render port.
+    :type commands: DrawCommands | None
+    :param textures: Render port used to create text textures. They are
+        marked evictable so a texture budget can reclaim them, and cache
+        entries of evicted textures are dropped.
+    :type textures: RenderPort | None
+    :param cache_bytes: Texture bytes kept for strings drawn with the
+        built-in default font before the least recently drawn unpinned ones
+        are destroyed. TrueType text is drawn from native glyph atlases,
+        which this cache doesn't hold.
+    :type cache_bytes: int
+    :param sdf: Draw TrueType fonts from signed distance field atlases. One
+        atlas per (font, size) then serves every viewport scale, so resizing
+        the window doesn't rasterize new glyphs.
+    :type sdf: bool
     """
 
     def __init__(
@@ -41,22 +112,54 @@ class TextPort:
         vp: ViewportTransform,
         font_path: str | None,
         fonts: dict[str, str | None] | None = None,
+        commands: DrawCommands | None = None,
+        textures: RenderPort | None = None,
+        cache_bytes: int = DEFAULT_TEXT_CACHE_BYTES,
+        sdf: bool = False,
     ):
         self._b = native_backend
         self._vp = vp
+        self._cmds = (
+            commands
+            if commands is not None
+            else make_draw_commands(native_backend)
+        )
         self._font_path = font_path
         self._font_paths: dict[str, str | None] = {"default": font_path}
         if fonts:
             self._font_paths.update(fonts)
-        self._fonts_by_key: dict[tuple[str | None, int], int] = {}
-        self._pil_fonts_by_key: dict[
+        # Builds without SDF support keep rasterizing per scaled size.
+        self._sdf = bool(sdf) and hasattr(native_backend, "load_sdf_font")
+        self._fonts_by_key: dict[tuple[str | None, int, bool], int] = {}
+        self._pil_fonts_by_key: OrderedDict[
             tuple[str | None, int], ImageFont.ImageFont
-        ] = {}
+        ] = OrderedDict()
+        self._max_pil_fonts = 16
         self._text_texture_cache: OrderedDict[
-            tuple[str, tuple[int, int, int, int], int, str | None],
+            tuple[str, int, str | None],
             tuple[int, int, int],
         ] = OrderedDict()
-        self._max_cached_textures = 256
+        self._text_texture_keys: dict[int, tuple[str, int, str | None]] = {}
+        self._measure_memo: OrderedDict[tuple[str, int], tuple[int, int]] = (
+            OrderedDict()
+        )
+        self._max_measure_memo = 4096
+        self._cache_budget = max(0, int(cache_bytes))
+        self._cache_bytes = 0
+        self._pinned: set[tuple[str, str | None]] = set()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+        self._upload_bytes = 0
+        self._textures = textures
+        self._prewarm_pool: ThreadPoolExecutor | None = None
+        self._pending_masks: dict[
+            tuple[str, int, str | None], Future[tuple[int, int, bytes]]
+        ] = {}
+        self._pending_glyphs: list[Future[None]] = []
+        if textures is not None:
+            textures.add_eviction_listener(self._forget_textures)
+            textures.add_frame_listener(self.upload_prewarmed)
 
     def _resolve_font_path(self, font_name: str | None) -> str | None:
         if font_name is None:
@@ -66,7 +169,7 @@ class TextPort:
         return self._font_paths.get("default", self._font_path)
 
     def _get_font_id(
-        self, font_size: int | None, font_name: str | None
+        self, font_size: int | None, font_name: str | None, sdf: bool = False
     ) -> int:
         font_path = self._resolve_font_path(font_name)
         if font_size is None or not font_path:
@@ -75,15 +178,74 @@ class TextPort:
         if font_size <= 0:
             raise ValueError(f"font_size must be > 0, got {font_size}")
 
-        cache_key = (font_name, int(font_size))
+        cache_key = (font_name, int(font_size), sdf)
         cached = self._fonts_by_key.get(cache_key)
         if cached is not None:
             return cached
 
-        fid = self._b.load_font(font_path, int(font_size))
+        load = self._b.load_sdf_font if sdf else self._b.load_font
+        fid = load(font_path, int(font_size))
         self._fonts_by_key[cache_key] = fid
         return fid
 
+    def _scaled_size(self, font_size: int | None) -> int | None:
+        if font_size is None:
+            return None
+        return max(8, int(round(font_size * self._vp.s)))
+
+    def _native_font_id(
+        self, font_size: int | None, font_name: str | None
+    ) -> int:
+        if self._sdf:
+            # SDF fonts are sized in virtual units and scale natively.
+            return self._get_font_id(
+                24 if font_size is None else int(font_size), font_name, True
+            )
+        # TrueType fonts are rasterized natively at the scaled size, with
+        # the same 24 px default as the PIL path.
+        scaled_size = self._scaled_size(font_size)
+        return self._get_font_id(
+            24 if scaled_size is None else scaled_size, font_name
+        )
+
+    def _measure_native(
+        self, texts: list[str], font_id: int
+    ) -> list[tuple[int, int]]:
+        memo = self._measure_memo
+        sizes: list[tuple[int, int]] = [(0, 0)] * len(texts)
+        missing: list[int] = []
+        for i, text in enumerate(texts):
+            cached = memo.get((text, font_id))
+            if cached is None:
+                missing.append(i)
+                continue
+            memo.move_to_end((text, font_id))
+            sizes[i] = cached
+
+        if missing:
+            measured = self._b.measure_text_many(
+                [texts[i] for i in missing], font_id
+            )
+            for i, (w, h) in zip(missing, measured):
+                sizes[i] = (int(w), int(h))
+                memo[(texts[i], font_id)] = sizes[i]
+            while len(memo) > self._max_measure_memo:
+                memo.popitem(last=False)
+        return sizes
+
+    def _native_scale(self) -> float:
+        # Native units per virtual unit: SDF fonts already measure in
+        # virtual units, bitmap fonts in screen pixels.
+        return 1.0 if self._sdf else (self._vp.s or 1.0)
+
+    def _to_virtual(
+        self, w_px: int, h_px: int, s: float | None = None
+    ) -> tuple[int, int]:
+        # Convert screen pixels back to virtual units for layout math
+        if s is None:
+            s = self._vp.s or 1.0
+        return int(round(w_px / s)), int(round(h_px / s))
+
     def _get_pil_font(
         self, font_size: int | None, font_name: str | None
     ) -> ImageFont.ImageFont:
@@ -94,6 +256,7 @@ class TextPort:
         cache_key = (font_name, normalized_size)
         cached = self._pil_fonts_by_key.get(cache_key)
         if cached is not None:
+            self._pil_fonts_by_key.move_to_end(cache_key)
             return cached
 
         font_path = self._resolve_font_path(font_name)
@@ -102,6 +265,9 @@ class TextPort:
         else:
             font = ImageFont.load_default()
         self._pil_fonts_by_key[cache_key] = font
+        # Every viewport scale is a new size; keep the recent ones only.
+        while len(self._pil_fonts_by_key) > self._max_pil_fonts:
+            self._pil_fonts_by_key.popitem(last=False)
         return font
 
     def _measure_text_pixels(
@@ -125,52 +291,281 @@ class TextPort:
             ),
         )
 
-    def _evict_cached_textures_if_needed(self) -> None:
-        while len(self._text_texture_cache) > self._max_cached_textures:
-            _, (texture_id, _width, _height) = (
-                self._text_texture_cache.popitem(last=False)
+    def _discard_cached_texture(
+        self, cache_key: tuple[str, int, str | None]
+    ) -> int:
+        texture_id, width, height = self._text_texture_cache.pop(cache_key)
+        self._text_texture_keys.pop(texture_id, None)
+        self._cache_bytes -= width * height * 4
+        self._cache_evictions += 1
+        return texture_id
+
+    def _evict_cached_textures_if_needed(
+        self, keep: tuple[str, int, str | None]
+    ) -> None:
+        excess = self._cache_bytes - self._cache_budget
+        if excess <= 0:
+            return
+
+        victims = []
+        for cache_key, entry in self._text_texture_cache.items():
+            if excess <= 0:
+                break
+            text, _size, font_name = cache_key
+            if cache_key == keep or (text, font_name) in self._pinned:
+                continue
+            victims.append(cache_key)
+            excess -= entry[1] * entry[2] * 4
+        if not victims:
+            return
+
+        # Queued draws may still reference the textures we're about to drop.
+        self._cmds.flush()
+        for cache_key in victims:
+            self._b.destroy_texture(
+                int(self._discard_cached_texture(cache_key))
             )
-            self._b.destroy_texture(int(texture_id))
+
+    def _forget_textures(self, texture_ids: list[int]) -> None:
+        # The renderer already destroyed these to honor its texture budget.
+        for texture_id in texture_ids:
+            cache_key = self._text_texture_keys.get(texture_id)
+            if cache_key is not None:
+                self._discard_cached_texture(cache_key)
+
+    def _set_pinned_evictable(
+        self, text: str, font_name: str | None, evictable: bool
+    ) -> None:
+        if self._textures is None:
+            return
+        for cache_key, entry in self._text_texture_cache.items():
+            if cache_key[0] == text and cache_key[2] == font_name:
+                self._textures.set_texture_evictable(entry[0], evictable)
+
+    def pin(self, text: str, font_name: str | None = None):
+        """
+        Keep the textures of a string cached at every size.
+
+        Pinned strings, e.g. HUD labels, are never evicted by the cache or
+        the texture budget, so a burst of one-off strings can't push them
+        out. Only the built-in default font caches whole strings; TrueType
+        glyph atlases are never evicted, so pinning doesn't affect them.
+
+        :param text: The string to pin.
+        :type text: str
+        :param font_name: The font the string is drawn with.
+        :type font_name: str | None
+        """
+        self._pinned.add((str(text), font_name))
+        self._set_pinned_evictable(str(text), font_name, False)
+
+    def unpin(self, text: str, font_name: str | None = None):
+        """
+        Let a pinned string be evicted again.
+
+        :param text: The string to unpin.
+        :type text: str
+        :param font_name: The font the string was pinned with.
+        :type font_name: str | None
+        """
+        self._pinned.discard((str(text), font_name))
+        self._set_pinned_evictable(str(text), font_name, True)
+
+    def cache_stats(self) -> dict[str, int]:
+        """
+        Get the string texture cache counters of the built-in default font.
+
+        :return: ``hits``, ``misses``, ``evictions``, ``upload_bytes``,
+            cached ``entries`` and ``bytes``, and the ``budget`` in bytes.
+        :rtype: dict[str, int]
+        """
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "evictions": self._cache_evictions,
+            "upload_bytes": self._upload_bytes,
+            "entries": len(self._text_texture_cache),
+            "bytes": self._cache_bytes,
+            "budget": self._cache_budget,
+        }
+
+    def reset_cache_stats(self):
+        """Reset the hit, miss, eviction and upload counters."""
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+        self._upload_bytes = 0
 
     def _get_text_texture(
         self,
         text: str,
-        color: tuple[int, int, int, int],
         font_size: int | None,
         font_name: str | None,
     ) -> tuple[int, int, int]:
-        cache_key = (str(text), color, int(font_size or 24), font_name)
+        # Textures are white coverage masks tinted at draw time, so color
+        # and alpha changes reuse the same entry.
+        cache_key = (str(text), int(font_size or 24), font_name)
         cached = self._text_texture_cache.get(cache_key)
         if cached is not None:
             self._text_texture_cache.move_to_end(cache_key)
+            self._cache_hits += 1
             return cached
+        self._cache_misses += 1
 
-        width, height, bbox = self._measure_text_pixels(
-            text, font_size, font_name
-        )
-        font = self._get_pil_font(font_size, font_name)
-        image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-        drawer = ImageDraw.Draw(image)
-        drawer.text(
-            (-bbox[0], -bbox[1]),
-            text,
-            font=font,
-            fill=color,
-        )
+        future = self._pending_masks.pop(cache_key, None)
+        if future is not None and not future.cancel():
+            # Already rasterizing in the background; finishing it is no
+            # slower than starting over here.
+            width, height, pixels = future.result()
+        else:
+            width, height, pixels = _mask_pixels(
+                text, self._get_pil_font(font_size, font_name)
+            )
+        return self._store_text_texture(cache_key, width, height, pixels)
 
-        texture_id = int(
-            self._b.create_texture_rgba(
+    def _store_text_texture(
+        self,
+        cache_key: tuple[str, int, str | None],
+        width: int,
+        height: int,
+        pixels: bytes,
+    ) -> tuple[int, int, int]:
+        font_name = cache_key[2]
+        pinned = (cache_key[0], font_name) in self._pinned
+        if self._textures is not None:
+            texture_id = self._textures.create_texture_rgba(
                 width,
                 height,
-                image.tobytes(),
+                pixels,
                 width * 4,
+                evictable=not pinned,
+            )
+        else:
+            texture_id = int(
+                self._b.create_texture_rgba(
+                    width,
+                    height,
+                    pixels,
+                    width * 4,
+                )
             )
-        )
         cached = (texture_id, width, height)
         self._text_texture_cache[cache_key] = cached
-        self._evict_cached_textures_if_needed()
+        self._text_texture_keys[texture_id] = cache_key
+        self._cache_bytes += width * height * 4
+        self._upload_bytes += width * height * 4
+        self._evict_cached_textures_if_needed(cache_key)
         return cached
 
+    def prewarm(
+        self,
+        strings: Iterable[str],
+        fonts: Iterable[str | None] | None = None,
+        sizes: Iterable[int | None] | None = None,
+    ) -> int:
+        """
+        Prepare strings ahead of their first draw, e.g. on scene load.
+
+        Strings are rasterized on a worker pool: whole strings for the
+        built-in default font, missing glyphs for TrueType fonts. Only the
+        texture uploads are left for the next ``begin_frame`` of the render
+        port given as ``textures`` (or the first draw without one). Drawing
+        a string that is still pending waits for or redoes just that string,
+        so prewarming never changes what is drawn.
+
+        :param strings: The strings to prepare.
+        :type strings: Iterable[str]
+        :param fonts: Font names to prepare them in (default font if None).
+        :type fonts: Iterable[str | None] | None
+        :param sizes: Font sizes to prepare them at (default size if None).
+        :type sizes: Iterable[int | None] | None
+        :return: Number of (string, font, size) combinations queued.
+        :rtype: int
+        """
+        texts = list(dict.fromkeys(str(t) for t in strings))
+        font_names = list(fonts) if fonts is not None else [None]
+        font_sizes = list(sizes) if sizes is not None else [None]
+
+        queued = 0
+        for font_name in font_names:
+            for font_size in font_sizes:
+                font_id = self._native_font_id(font_size, font_name)
+                if font_id >= 0:
+                    if hasattr(self._b, "rasterize_text"):
+                        self._pending_glyphs.append(
+                            self._pool().submit(
+                                self._b.rasterize_text, texts, font_id
+                            )
+                        )
+                        queued += len(texts)
+                    continue
+                queued += self._queue_masks(texts, font_size, font_name)
+        return queued
+
+    def _queue_masks(
+        self, texts: list[str], font_size: int | None, font_name: str | None
+    ) -> int:
+        scaled_size = self._scaled_size(font_size)
+        size = int(scaled_size or 24)
+        font_path = self._resolve_font_path(font_name)
+        pool = self._pool()
+
+        queued = 0
+        for text in texts:
+            cache_key = (text, size, font_name)
+            if (
+                cache_key in self._text_texture_cache
+                or cache_key in self._pending_masks
+            ):
+                continue
+            self._pending_masks[cache_key] = pool.submit(
+                _render_mask_in_worker, text, font_path, size
+            )
+            queued += 1
+        return queued
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._prewarm_pool is None:
+            self._prewarm_pool = ThreadPoolExecutor(
+                max_workers=_PREWARM_WORKERS,
+                thread_name_prefix="text-prewarm",
+            )
+        return self._prewarm_pool
+
+    def upload_prewarmed(self):
+        """
+        Upload prewarmed strings that finished rasterizing.
+
+        Called at every ``begin_frame`` of the render port this text port
+        was given; call it yourself otherwise.
+        """
+        if any(future.done() for future in self._pending_glyphs):
+            # Glyphs that failed to render are retried, and raise, when drawn.
+            self._pending_glyphs = [
+                future for future in self._pending_glyphs if not future.done()
+            ]
+            self._b.upload_rasterized_text()
+
+        done = [
+            cache_key
+            for cache_key, future in self._pending_masks.items()
+            if future.done()
+        ]
+        for cache_key in done:
+            future = self._pending_masks.pop(cache_key)
+            if cache_key in self._text_texture_cache or future.exception():
+                # Failed strings are retried, and raise, when drawn.
+                continue
+            self._store_text_texture(cache_key, *future.result())
+
+    def close(self):
+        """Stop the prewarm workers, dropping strings not yet rasterized."""
+        if self._prewarm_pool is not None:
+            self._prewarm_pool.shutdown(wait=True, cancel_futures=True)
+            self._prewarm_pool = None
+        self._pending_masks.clear()
+        self._pending_glyphs.clear()
+
     def measure(
         self,
         text: str,
@@ -187,22 +582,47 @@ class TextPort:
         :return: A tuple containing the width and height of the text.
         :rtype: tuple[int, int]
         """
-        scaled_size = (
-            None
-            if font_size is None
-            else max(8, int(round(font_size * self._vp.s)))
-        )
+        font_id = self._native_font_id(font_size, font_name)
+        if font_id >= 0:
+            # Line box of the glyph-atlas text drawn by ``draw``.
+            w, h = self._measure_native([str(text)], font_id)[0]
+            return self._to_virtual(w, h, self._native_scale())
+
         w_px, h_px, _bbox = self._measure_text_pixels(
             text,
-            scaled_size,
+            self._scaled_size(font_size),
             font_name,
         )
+        return self._to_virtual(w_px, h_px)
 
-        # Convert screen pixels back to virtual units for layout math
-        s = self._vp.s or 1.0
-        w_v = int(round(w_px / s))
-        h_v = int(round(h_px / s))
-        return w_v, h_v
+    def measure_many(
+        self,
+        texts: list[str],
+        font_size: int | None = None,
+        font_name: str | None = None,
+    ) -> list[tuple[int, int]]:
+        """
+        Measure several strings with the same font.
+
+        Strings not measured recently are measured in a single native call.
+
+        :param texts: The strings to measure.
+        :type texts: list[str]
+        :param font_size: The font size to use for measurement.
+        :type font_size: int | None
+        :param font_name: The font to use for measurement.
+        :type font_name: str | None
+        :return: Width and height of every string, in order.
+        :rtype: list[tuple[int, int]]
+        """
+        font_id = self._native_font_id(font_size, font_name)
+        if font_id < 0:
+            return [self.measure(t, font_size, font_name) for t in texts]
+        s = self._native_scale()
+        return [
+            self._to_virtual(w, h, s)
+            for w, h in self._measure_native([str(t) for t in texts], font_id)
+        ]
 
     def draw(
         self,
@@ -216,6 +636,8 @@ class TextPort:
         """
         Draw the given text at the specified position.
 
+        With a TrueType font, (x, y) is the top-left of the line box.
+
         :param x: The x-coordinate to draw the text.
         :type x: int
         :param y: The y-coordinate to draw the text.
@@ -228,28 +650,171 @@ class TextPort:
         :type font_size: int | None
         """
         r, g, b, a = rgba(color)
-        sx, sy = self._vp.map_xy(x, y)
-        scaled_size = (
-            None
-            if font_size is None
-            else max(8, int(round(font_size * self._vp.s)))
+        font_id = self._native_font_id(font_size, font_name)
+        if font_id >= 0:
+            # TrueType fonts draw from the native glyph atlas of this
+            # (font, size), so new strings cost no rasterization.
+            self._cmds.text(font_id, x, y, str(text), r, g, b, a)
+            return
+
+        texture_id, width, height = self._get_text_texture(
+            str(text),
+            self._scaled_size(font_size),
+            font_name,
         )
-        try:
-            texture_id, width, height = self._get_text_texture(
-                str(text),
-                (r, g, b, a),
-                scaled_size,
-                font_name,
+
+        # The texture is rasterized in screen pixels; the renderer scales
+        # destination sizes by the viewport, so pass them in virtual units.
+        s = self._vp.s or 1.0
+        self._cmds.texture(
+            texture_id, x, y, width / s, height / s, 0.0, r, g, b, a
+        )
+
+    def _layout_pil(
+        self,
+        text: str,
+        align: int,
+        font_size: int | None,
+        font_name: str | None,
+    ) -> tuple[int, int, list[tuple[int, int, int, int, int]]]:
+        # The PIL default font has no native layout: break on newlines only.
+        scaled_size = self._scaled_size(font_size)
+        line_h = self._measure_text_pixels("Ag", scaled_size, font_name)[1]
+        lines = []
+        start = 0
+        for i, part in enumerate(text.split("\n")):
+            width = (
+                self._measure_text_pixels(part, scaled_size, font_name)[0]
+                if part
+                else 0
+            )
+            lines.append((start, start + len(part), 0, i * line_h, width))
+            start += len(part) + 1
+        block = max(line[4] for line in lines)
+        if align:
+            lines = [
+                (s, e, (block - w) // (2 if align == 1 else 1), y, w)
+                for s, e, _x, y, w in lines
+            ]
+        return block, len(lines) * line_h, lines
+
+    def layout(
+        self,
+        text: str,
+        max_width: int = 0,
+        font_size: int | None = None,
+        font_name: str | None = None,
+        align: str = "left",
+    ) -> dict:
+        """
+        Break text into lines that fit ``max_width``.
+
+        TrueType text is wrapped at spaces natively, and the line breaks of
+        recent (text, width, font, alignment) combinations are cached, so
+        laying out the same paragraph every frame is a lookup. ``\\n``
+        always starts a new line. The built-in default font only breaks on
+        ``\\n``.
+
+        :param text: The text to lay out.
+        :type text: str
+        :param max_width: Maximum line width in virtual units, 0 to only
+            break on newlines.
+        :type max_width: int
+        :param font_size: The font size to lay out with.
+        :type font_size: int | None
+        :param font_name: The font to lay out with.
+        :type font_name: str | None
+        :param align: ``"left"``, ``"center"`` or ``"right"``.
+        :type align: str
+        :return: Block ``width`` and ``height``, and ``lines`` as
+            (start, end, x, y, width) tuples, where start/end index into
+            ``text`` and the rest are virtual units relative to the block.
+        :rtype: dict
+        """
+        text = str(text)
+        align_id = _ALIGN[align]
+        s = self._vp.s or 1.0
+        font_id = self._native_font_id(font_size, font_name)
+        if font_id >= 0:
+            s = self._native_scale()
+            width, height, lines = self._b.layout_text(
+                text, int(round(max_width * s)), align_id, font_id
+            )
+        else:
+            width, height, lines = self._layout_pil(
+                text, align_id, font_size, font_name
+            )
+        return {
+            "width": int(round(width / s)),
+            "height": int(round(height / s)),
+            "lines": [
+                (start, end, x / s, y / s, w / s)
+                for start, end, x, y, w in lines
+            ],
+        }
+
+    def draw_block(
+        self,
+        x: int,
+        y: int,
+        text: str,
+        max_width: int = 0,
+        color=(255, 255, 255),
+        font_size: int | None = None,
+        font_name: str | None = None,
+        align: str = "left",
+    ):
+        """
+        Draw text wrapped to ``max_width`` with its block top-left at (x, y).
+
+        TrueType text is laid out and drawn by a single queued command; see
+        :meth:`layout` for the wrapping rules.
+
+        :param x: The x-coordinate of the block.
+        :type x: int
+        :param y: The y-coordinate of the block.
+        :type y: int
+        :param text: The text to draw.
+        :type text: str
+        :param max_width: Maximum line width in virtual units, 0 to only
+            break on newlines.
+        :type max_width: int
+        :param color: The color of the text as an (R, G, B) or (R, G, B, A) tuple.
+        :type color: tuple[int, int, int] | tuple[int, int, int, int]
+        :param font_size: The font size to use for drawing.
+        :type font_size: int | None
+        :param font_name: The font to use for drawing.
+        :type font_name: str | None
+        :param align: ``"left"``, ``"center"`` or ``"right"``.
+        :type align: str
+        """
+        text = str(text)
+        font_id = self._native_font_id(font_size, font_name)
+        if font_id >= 0:
+            r, g, b, a = rgba(color)
+            s = self._native_scale()
+            self._cmds.text_block(
+                font_id,
+                x,
+                y,
+                text,
+                int(round(max_width * s)),
+                _ALIGN[align],
+                r,
+                g,
+                b,
+                a,
             )
-        except OSError:
-            font_id = self._get_font_id(scaled_size, font_name)
-            self._b.draw_text(str(text), sx, sy, r, g, b, a, font_id)
             return
 
-        self._b.draw_texture(
-            int(texture_id),
-            int(sx),
-            int(sy),
-            int(width),
-            int(height),
-        )
+        block = self.layout(text, max_width, font_size, font_name, align)
+        for start, end, lx, ly, _w in block["lines"]:
+            if end > start:
+                self.draw(
+                    x + lx,
+                    y + ly,
+                    text[start:end],
+                    color,
+                    font_size,
+                    font_name,
+                )
@@ -0,0 +1,200 @@
+"""
+Asynchronous screenshots.
+
+The render thread only reads the frame back into a pooled pixel buffer;
+encoding (PNG or QOI) and file I/O run on a worker thread, so taking a
+screenshot mid-game doesn't stall the frame.
+"""
+
+from __future__ import annotations
+
+import io
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+from PIL import Image
+
+# Justification: native is a compiled extension module with stubbed members.
+# pylint: disable=no-name-in-module,no-member
+from mini_arcade_native_backend import _native as native  # type: ignore
+
+SCREENSHOT_POLICIES = ("drop", "block")
+
+
+def encode_png(pixels, width: int, height: int) -> bytes:
+    """
+    Encode tightly packed RGBA pixels as a PNG image.
+
+    :param pixels: ``width * height * 4`` bytes of RGBA texels.
+    :type pixels: bytes | bytearray | memoryview
+    :param width: Image width in pixels.
+    :type width: int
+    :param height: Image height in pixels.
+    :type height: int
+    :return: The encoded image.
+    :rtype: bytes
+    """
+    image = Image.frombuffer(
+        "RGBA", (width, height), pixels, "raw", "RGBA", 0, 1
+    )
+    out = io.BytesIO()
+    image.save(out, format="PNG")
+    return out.getvalue()
+
+
+def encode_qoi(pixels, width: int, height: int) -> bytes:
+    """
+    Encode tightly packed RGBA pixels as a QOI image.
+
+    :param pixels: ``width * height * 4`` bytes of RGBA texels.
+    :type pixels: bytes | bytearray | memoryview
+    :param width: Image width in pixels.
+    :type width: int
+    :param height: Image height in pixels.
+    :type height: int
+    :return: The encoded image.
+    :rtype: bytes
+    """
+    return native.encode_qoi(pixels, width, height)
+
+
+SCREENSHOT_ENCODERS: dict[str, Callable[..., bytes]] = {
+    "png": encode_png,
+    "qoi": encode_qoi,
+}
+
+
+class ScreenshotWriter:
+    """
+    Encodes and writes captured frames on a worker thread.
+
+    At most ``max_pending`` screenshots are in flight, each holding one
+    pooled pixel buffer. When all of them are taken, a new screenshot is
+    dropped (``"drop"``) or waits for the oldest one to finish (``"block"``).
+
+    :param max_pending: Screenshots that may be queued or encoding at once.
+    :type max_pending: int
+    :param policy: ``"drop"`` or ``"block"``.
+    :type policy: str
+    :raises ValueError: If the policy is unknown or max_pending < 1.
+    """
+
+    def __init__(self, max_pending: int = 2, policy: str = "drop"):
+        if policy not in SCREENSHOT_POLICIES:
+            raise ValueError(f"unknown screenshot policy: {policy!r}")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self._policy = policy
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._pool: list[bytearray] = []
+        self._executor: ThreadPoolExecutor | None = None
+        self.dropped = 0
+
+    def save(
+        self,
+        capture: Callable[[bytearray], tuple[int, int]],
+        size: tuple[int, int],
+        path: str | Path,
+        *,
+        format: str = "png",  # pylint: disable=redefined-builtin
+        on_done: Callable[[Future[bool]], None] | None = None,
+    ) -> Future[bool]:
+        """
+        Capture a frame now and encode and write it in the background.
+
+        :param capture: Fills a buffer of ``size`` with tightly packed RGBA
+            texels and returns the captured width and height.
+        :type capture: Callable[[bytearray], tuple[int, int]]
+        :param size: Width and height of the frame to capture.
+        :type size: tuple[int, int]
+        :param path: File to write; replaced if it exists.
+        :type path: str | Path
+        :param format: ``"png"`` or ``"qoi"``.
+        :type format: str
+        :param on_done: Called with the future once it completes, on the
+            worker thread (or right away if the screenshot was dropped).
+        :type on_done: Callable[[Future[bool]], None] | None
+        :return: Resolves to True once the file is written, or False if the
+            screenshot was dropped; encoding or I/O errors are raised from
+            ``result()``.
+        :rtype: Future[bool]
+        :raises ValueError: If the format is unknown.
+        """
+        encoder = SCREENSHOT_ENCODERS.get(format.lower())
+        if encoder is None:
+            raise ValueError(f"unknown screenshot format: {format!r}")
+
+        # Justification: the slot is released by the worker thread once the
+        # file is written, so it can't be scoped with a `with` block.
+        # pylint: disable-next=consider-using-with
+        if not self._slots.acquire(blocking=self._policy == "block"):
+            self.dropped += 1
+            future: Future[bool] = Future()
+            future.set_result(False)
+            if on_done is not None:
+                future.add_done_callback(on_done)
+            return future
+
+        w, h = size
+        buffer = self._take_buffer(w * h * 4)
+        try:
+            w, h = capture(buffer)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="screenshot"
+                )
+            future = self._executor.submit(
+                self._write,
+                buffer,
+                int(w),
+                int(h),
+                Path(path),
+                encoder=encoder,
+            )
+        except BaseException:
+            self._give_buffer(buffer)
+            self._slots.release()
+            raise
+
+        if on_done is not None:
+            future.add_done_callback(on_done)
+        return future
+
+    def close(self):
+        """Finish pending screenshots and stop the worker thread."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _take_buffer(self, size: int) -> bytearray:
+        with self._lock:
+            while self._pool:
+                buffer = self._pool.pop()
+                if len(buffer) == size:
+                    return buffer
+        return bytearray(size)
+
+    def _give_buffer(self, buffer: bytearray):
+        with self._lock:
+            self._pool.append(buffer)
+
+    def _write(
+        self,
+        buffer: bytearray,
+        w: int,
+        h: int,
+        path: Path,
+        *,
+        encoder: Callable[..., bytes],
+    ) -> bool:
+        try:
+            with memoryview(buffer) as view:
+                data = encoder(view[: w * h * 4], w, h)
+            path.write_bytes(data)
+        finally:
+            self._give_buffer(buffer)
+            self._slots.release()
+        return True
@@ -44,20 +44,19 @@ Backend::Backend(const BackendConfig& cfg)
     renderer_->set_clear_color(cfg.render.clear_color);
 
     // Text renderer depends on renderer (future: GlTextRenderer)
-    text_ = std::make_unique<SdlTextRenderer>(*renderer_);
+    auto text = std::make_unique<SdlTextRenderer>(*renderer_);
 
-    // Load default font: explicit path first, otherwise built-in fallbacks.
+    // Default font: explicit path first, otherwise built-in fallbacks. It is
+    // only loaded when text is first drawn with it.
     if (!cfg.text.default_font_path.empty()) {
-        int fid = text_->load_font(cfg.text.default_font_path, cfg.text.default_font_size);
-        // If it's the SDL text renderer, it sets default automatically; fine.
-        (void)fid;
+        text->set_default_font_path(cfg.text.default_font_path, cfg.text.default_font_size);
     } else {
         const auto fallback = resolve_fallback_font_path();
         if (!fallback.empty()) {
-            int fid = text_->load_font(fallback, cfg.text.default_font_size);
-            (void)fid;
+            text->set_default_font_path(fallback, cfg.text.default_font_size);
         }
     }
+    text_ = std::move(text);
 
   // Audio (optional)
     if (cfg.audio.enabled) {
@@ -1,15 +1,237 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
+#include <algorithm>
+#include <cstring>
+#include <string>
+#include <vector>
+
 #include "mini/backend.h"
 #include "mini/sdl_renderer.h" // only for types if needed
 #include "mini/event.h"
 #include "mini/config.h"
 #include "mini/capture_bytes.h"
+#include "mini/image_encode.h"
 
 namespace py = pybind11;
 using namespace mini;
 
+namespace {
+
+// Float32 geometry rows plus their colors, ready for the batched
+// IRenderer draw calls. Reused between calls to avoid per-frame allocation.
+struct BatchInput {
+    std::vector<float> raw;
+    std::vector<float> geometry;
+    std::vector<ColorRGBA> colors;
+    size_t rows = 0;
+};
+
+template <typename T>
+void copy_rows(
+    const uint8_t* base, py::ssize_t row_stride, py::ssize_t col_stride,
+    size_t rows, size_t cols, float* out
+) {
+    for (size_t r = 0; r < rows; ++r) {
+        const uint8_t* row = base + static_cast<py::ssize_t>(r) * row_stride;
+        for (size_t c = 0; c < cols; ++c) {
+            T v;
+            std::memcpy(&v, row + static_cast<py::ssize_t>(c) * col_stride, sizeof(T));
+            out[r * cols + c] = static_cast<float>(v);
+        }
+    }
+}
+
+// Read a 1D (flat) or 2D (N, cols) numeric buffer into `out` as float32.
+// `allowed_cols` lists the accepted row widths; the chosen one is returned.
+size_t read_numeric_rows(
+    const py::buffer& data,
+    std::initializer_list<size_t> allowed_cols,
+    std::vector<float>& out,
+    size_t& rows,
+    const char* fn
+) {
+    py::buffer_info info = data.request();
+
+    size_t cols = 0;
+    py::ssize_t row_stride = 0;
+    py::ssize_t col_stride = 0;
+    if (info.ndim == 2) {
+        cols = static_cast<size_t>(info.shape[1]);
+        rows = static_cast<size_t>(info.shape[0]);
+        row_stride = info.strides[0];
+        col_stride = info.strides[1];
+    } else if (info.ndim == 1) {
+        cols = *allowed_cols.begin();
+        if (info.size % static_cast<py::ssize_t>(cols) != 0) {
+            throw std::runtime_error(std::string(fn) + ": flat buffer length is not a multiple of the row width");
+        }
+        rows = static_cast<size_t>(info.size) / cols;
+        col_stride = info.strides[0];
+        row_stride = col_stride * static_cast<py::ssize_t>(cols);
+    } else {
+        throw std::runtime_error(std::string(fn) + ": expected a 1D or 2D buffer");
+    }
+
+    bool ok = false;
+    for (size_t allowed : allowed_cols) ok = ok || (cols == allowed);
+    if (!ok) {
+        throw std::runtime_error(std::string(fn) + ": unexpected number of columns " + std::to_string(cols));
+    }
+
+    out.resize(rows * cols);
+    const auto* base = static_cast<const uint8_t*>(info.ptr);
+
+    // Buffer formats may carry a byte-order prefix ('<', '=', '@').
+    std::string fmt = info.format;
+    if (!fmt.empty() && (fmt[0] == '<' || fmt[0] == '=' || fmt[0] == '@')) fmt.erase(0, 1);
+    const char kind = fmt.size() == 1 ? fmt[0] : '\0';
+    const bool signed_int = kind != '\0' && std::strchr("hilq", kind) != nullptr;
+
+    if (kind == 'f' && info.itemsize == 4) {
+        copy_rows<float>(base, row_stride, col_stride, rows, cols, out.data());
+    } else if (kind == 'd' && info.itemsize == 8) {
+        copy_rows<double>(base, row_stride, col_stride, rows, cols, out.data());
+    } else if (kind == 'B' && info.itemsize == 1) {
+        copy_rows<uint8_t>(base, row_stride, col_stride, rows, cols, out.data());
+    } else if (signed_int && info.itemsize == 2) {
+        copy_rows<int16_t>(base, row_stride, col_stride, rows, cols, out.data());
+    } else if (signed_int && info.itemsize == 4) {
+        copy_rows<int32_t>(base, row_stride, col_stride, rows, cols, out.data());
+    } else if (signed_int && info.itemsize == 8) {
+        copy_rows<int64_t>(base, row_stride, col_stride, rows, cols, out.data());
+    } else {
+        throw std::runtime_error(std::string(fn) + ": unsupported buffer format '" + info.format + "'");
+    }
+    return cols;
+}
+
+uint8_t to_u8(float v) {
+    if (v <= 0.0f) return 0;
+    if (v >= 255.0f) return 255;
+    return static_cast<uint8_t>(v + 0.5f);
+}
+
+// Load a batch of primitives with `geom_cols` geometry columns per row.
+// Rows may carry 4 trailing RGBA columns when `colors` is None.
+// Coordinates stay virtual; the renderer applies its viewport.
+BatchInput& load_batch(
+    const py::buffer& data,
+    size_t geom_cols,
+    const py::object& colors,
+    const char* fn
+) {
+    thread_local BatchInput batch;
+
+    const size_t cols = read_numeric_rows(
+        data, {geom_cols, geom_cols + 4}, batch.raw, batch.rows, fn
+    );
+    const size_t rows = batch.rows;
+
+    if (cols == geom_cols) {
+        batch.geometry.swap(batch.raw);
+    } else {
+        batch.geometry.resize(rows * geom_cols);
+        for (size_t r = 0; r < rows; ++r) {
+            std::copy_n(&batch.raw[r * cols], geom_cols, &batch.geometry[r * geom_cols]);
+        }
+    }
+
+    batch.colors.clear();
+    if (colors.is_none()) {
+        if (cols == geom_cols + 4) {
+            batch.colors.resize(rows);
+            for (size_t r = 0; r < rows; ++r) {
+                const float* src = &batch.raw[r * cols + geom_cols];
+                batch.colors[r] = ColorRGBA{ to_u8(src[0]), to_u8(src[1]), to_u8(src[2]), to_u8(src[3]) };
+            }
+        } else {
+            batch.colors.push_back(ColorRGBA{ 255, 255, 255, 255 });
+        }
+    } else if (py::isinstance<py::buffer>(colors)) {
+        std::vector<float> raw_colors;
+        size_t color_rows = 0;
+        read_numeric_rows(colors.cast<py::buffer>(), {4}, raw_colors, color_rows, fn);
+        if (color_rows != rows && color_rows != 1) {
+            throw std::runtime_error(std::string(fn) + ": colors must have one row per item");
+        }
+        batch.colors.resize(color_rows);
+        for (size_t r = 0; r < color_rows; ++r) {
+            const float* src = &raw_colors[r * 4];
+            batch.colors[r] = ColorRGBA{ to_u8(src[0]), to_u8(src[1]), to_u8(src[2]), to_u8(src[3]) };
+        }
+    } else {
+        auto c = colors.cast<std::vector<int>>();
+        if (c.size() != 3 && c.size() != 4) {
+            throw std::runtime_error(std::string(fn) + ": color must be (r, g, b) or (r, g, b, a)");
+        }
+        batch.colors.push_back(ColorRGBA{
+            to_u8((float)c[0]), to_u8((float)c[1]), to_u8((float)c[2]),
+            to_u8(c.size() == 4 ? (float)c[3] : 255.0f)
+        });
+    }
+    return batch;
+}
+
+// Optional (x, y, w, h) tuple; returns nullptr for None (whole texture).
+const TextureRect* read_texture_rect(const py::object& rect, TextureRect& out, const char* fn) {
+    if (rect.is_none()) return nullptr;
+    auto r = rect.cast<std::vector<int>>();
+    if (r.size() != 4) {
+        throw std::runtime_error(std::string(fn) + ": rect must be (x, y, w, h)");
+    }
+    out = TextureRect{ r[0], r[1], r[2], r[3] };
+    return &out;
+}
+
+// Throw unless `r` (if any) is a non-empty area inside a w x h surface.
+void check_rect_inside(const TextureRect* r, int w, int h, const char* fn, const char* surface) {
+    if (r && (r->x < 0 || r->y < 0 || r->w <= 0 || r->h <= 0
+              || r->x + r->w > w || r->y + r->h > h)) {
+        throw std::runtime_error(std::string(fn) + ": rect is outside the " + surface);
+    }
+}
+
+// Validate that `info` holds `h` rows of `w` RGBA texels whose rows are
+// contiguous, and return the row pitch in bytes. 1D buffers use `pitch`
+// (or tight rows when negative); N-D buffers use their outer stride.
+int rgba_pitch(const py::buffer_info& info, int w, int h, int pitch, const char* fn) {
+    const py::ssize_t row_bytes = static_cast<py::ssize_t>(w) * 4;
+    py::ssize_t span = 0;
+    if (info.ndim == 1) {
+        if (info.strides[0] != info.itemsize) {
+            throw std::runtime_error(std::string(fn) + ": buffer must be contiguous");
+        }
+        if (pitch < 0) pitch = static_cast<int>(row_bytes);
+        span = info.size * info.itemsize;
+    } else if (info.ndim >= 2) {
+        py::ssize_t expected = info.itemsize;
+        for (py::ssize_t k = info.ndim - 1; k >= 1; --k) {
+            if (info.strides[k] != expected) {
+                throw std::runtime_error(std::string(fn) + ": buffer rows must be contiguous");
+            }
+            expected *= info.shape[k];
+        }
+        if (info.strides[0] < expected) {
+            throw std::runtime_error(std::string(fn) + ": buffer rows must not overlap");
+        }
+        pitch = static_cast<int>(info.strides[0]);
+        span = info.strides[0] * (info.shape[0] - 1) + expected;
+    } else {
+        throw std::runtime_error(std::string(fn) + ": expected a pixel buffer");
+    }
+
+    if (pitch < row_bytes) {
+        throw std::runtime_error(std::string(fn) + ": pitch is smaller than one row of RGBA texels");
+    }
+    if (h > 0 && span < static_cast<py::ssize_t>(pitch) * (h - 1) + row_bytes) {
+        throw std::runtime_error(std::string(fn) + ": buffer too small for the target area");
+    }
+    return pitch;
+}
+
+} // namespace
+
 PYBIND11_MODULE(_native, m) {
     m.doc() = "Mini Arcade native backend (SDL2 today, OpenGL-ready design)";
 
@@ -48,6 +270,16 @@ PYBIND11_MODULE(_native, m) {
         .value("OpenGL", RenderAPI::OpenGL)
         .export_values();
 
+    py::enum_<PixelFormat>(m, "PixelFormat")
+        .value("RGBA", PixelFormat::RGBA)
+        .value("BGRA", PixelFormat::BGRA)
+        .value("ARGB", PixelFormat::ARGB);
+
+    py::enum_<TextAlign>(m, "TextAlign")
+        .value("Left", TextAlign::Left)
+        .value("Center", TextAlign::Center)
+        .value("Right", TextAlign::Right);
+
     py::class_<WindowConfig>(m, "WindowConfig")
         .def(py::init<>())
         .def_readwrite("width", &WindowConfig::width)
@@ -64,6 +296,18 @@ PYBIND11_MODULE(_native, m) {
         .def_readwrite("a", &ColorRGBA::a);
 
 
+    py::class_<RenderStats>(m, "RenderStats")
+        .def_readonly("state_changes", &RenderStats::state_changes)
+        .def_readonly("state_skipped", &RenderStats::state_skipped)
+        .def_readonly("texture_switches", &RenderStats::texture_switches);
+
+    py::class_<TextureStats>(m, "TextureStats")
+        .def_readonly("count", &TextureStats::count)
+        .def_readonly("bytes", &TextureStats::bytes)
+        .def_readonly("evictable_bytes", &TextureStats::evictable_bytes)
+        .def_readonly("budget", &TextureStats::budget)
+        .def_readonly("evictions", &TextureStats::evictions);
+
     py::class_<RenderConfig>(m, "RenderConfig")
         .def(py::init<>())
         .def_readwrite("api", &RenderConfig::api)
@@ -97,9 +341,10 @@ PYBIND11_MODULE(_native, m) {
         .def("drawable_size", &Window::drawable_size);
 
     py::class_<Audio>(m, "Audio")
-        .def("init", &Audio::init, py::arg("frequency")=44100, py::arg("channels")=2, py::arg("chunk_size")=2048)
+        .def("init", &Audio::init, py::arg("frequency")=44100, py::arg("channels")=2, py::arg("chunk_size")=2048,
+             py::call_guard<py::gil_scoped_release>())
         .def("shutdown", &Audio::shutdown)
-        .def("load_sound", &Audio::load_sound)
+        .def("load_sound", &Audio::load_sound, py::call_guard<py::gil_scoped_release>())
         .def("play_sound", &Audio::play_sound, py::arg("id"), py::arg("loops")=0)
         .def("set_master_volume", &Audio::set_master_volume)
         .def("set_sound_volume", &Audio::set_sound_volume)
@@ -117,9 +362,31 @@ PYBIND11_MODULE(_native, m) {
         // same: use Backend.capture_frame() wrapper; but you can expose this later.
         ;
 
-    // Backend: user entry-point
+    m.def("encode_qoi",
+        [](py::buffer pixels, int w, int h, int pitch) {
+            py::buffer_info info = pixels.request();
+            pitch = rgba_pitch(info, w, h, pitch, "encode_qoi");
+            std::vector<uint8_t> out;
+            {
+                py::gil_scoped_release release;
+                out = encode_qoi(static_cast<const uint8_t*>(info.ptr), w, h, pitch);
+            }
+            return py::bytes(reinterpret_cast<const char*>(out.data()), out.size());
+        },
+        py::arg("pixels"),
+        py::arg("width"),
+        py::arg("height"),
+        py::arg("pitch") = -1
+    );
+
+    // Backend: user entry-point.
+    // Calls that only touch native state (present, file and font I/O,
+    // readback) run with the GIL released so other Python threads keep
+    // running. The Backend itself is still single-threaded: only the thread
+    // that owns the window may call into it.
     py::class_<Backend>(m, "Backend")
-        .def(py::init<const BackendConfig&>(), py::arg("config"))
+        .def(py::init<const BackendConfig&>(), py::arg("config"),
+             py::call_guard<py::gil_scoped_release>())
 
         .def_property_readonly("window", &Backend::window, py::return_value_policy::reference_internal)
         .def_property_readonly("audio", &Backend::audio, py::return_value_policy::reference_internal)
@@ -130,15 +397,100 @@ PYBIND11_MODULE(_native, m) {
                 (uint8_t)r,(uint8_t)g,(uint8_t)bb,255
             });
         })
-        .def("begin_frame", [](Backend& b){ b.render().begin_frame(); })
-        .def("end_frame", [](Backend& b){ b.render().end_frame(); })
-        .def("draw_rect", [](Backend& b,int x,int y,int w,int h,int r,int g,int bb,int a){
+        .def("begin_frame", [](Backend& b){ b.render().begin_frame(); },
+             py::call_guard<py::gil_scoped_release>())
+        .def("end_frame", [](Backend& b){ b.render().end_frame(); },
+             py::call_guard<py::gil_scoped_release>())
+        .def("set_viewport",
+            [](Backend& b, float offset_x, float offset_y, float scale) {
+                b.render().set_viewport(Viewport{ offset_x, offset_y, scale });
+            },
+            py::arg("offset_x") = 0.0f,
+            py::arg("offset_y") = 0.0f,
+            py::arg("scale") = 1.0f
+        )
+        .def("viewport", [](Backend& b) {
+            const Viewport vp = b.render().viewport();
+            return py::make_tuple(vp.ox, vp.oy, vp.scale);
+        })
+        .def("draw_rect", [](Backend& b,float x,float y,float w,float h,int r,int g,int bb,int a){
             b.render().draw_rect(x,y,w,h, ColorRGBA{(uint8_t)r,(uint8_t)g,(uint8_t)bb,(uint8_t)a});
         })
-        .def("draw_line", [](Backend& b,int x1,int y1,int x2,int y2,int r,int g,int bb,int a,int thickness){
+        .def("draw_line", [](Backend& b,float x1,float y1,float x2,float y2,int r,int g,int bb,int a,int thickness){
             b.render().draw_line(x1,y1,x2,y2, ColorRGBA{(uint8_t)r,(uint8_t)g,(uint8_t)bb,(uint8_t)a}, thickness);
         })
-        .def("set_clip_rect", [](Backend& b,int x,int y,int w,int h){
+        .def("submit",
+            [](Backend& b, py::buffer commands) {
+                py::buffer_info info = commands.request();
+                if (info.ndim != 1 || info.itemsize != 1) {
+                    throw std::runtime_error("submit: expected a 1D bytes-like buffer");
+                }
+                // `info` keeps the buffer exported while the GIL is released.
+                py::gil_scoped_release release;
+                b.render().submit(
+                    static_cast<const uint8_t*>(info.ptr),
+                    static_cast<size_t>(info.size),
+                    &b.text()
+                );
+            },
+            py::arg("commands")
+        )
+        .def("draw_circle", [](Backend& b,float x,float y,float radius,int r,int g,int bb,int a){
+            b.render().draw_circle(x,y,radius, ColorRGBA{(uint8_t)r,(uint8_t)g,(uint8_t)bb,(uint8_t)a});
+        })
+        .def("draw_poly",
+            [](Backend& b, const std::vector<std::pair<float,float>>& points, int r, int g, int bb, int a, bool filled) {
+                std::vector<float> xy;
+                xy.reserve(points.size() * 2);
+                for (const auto& p : points) {
+                    xy.push_back(p.first);
+                    xy.push_back(p.second);
+                }
+                b.render().draw_poly(
+                    xy.data(), points.size(),
+                    ColorRGBA{(uint8_t)r,(uint8_t)g,(uint8_t)bb,(uint8_t)a}, filled
+                );
+            },
+            py::arg("points"),
+            py::arg("r"),
+            py::arg("g"),
+            py::arg("b"),
+            py::arg("a"),
+            py::arg("filled") = true
+        )
+        .def("draw_rects",
+            [](Backend& b, py::buffer rects, py::object colors) {
+                auto& batch = load_batch(rects, 4, colors, "draw_rects");
+                b.render().draw_rects(
+                    batch.geometry.data(), batch.rows, batch.colors.data(), batch.colors.size()
+                );
+            },
+            py::arg("rects"),
+            py::arg("colors") = py::none()
+        )
+        .def("draw_lines",
+            [](Backend& b, py::buffer segments, py::object colors) {
+                auto& batch = load_batch(segments, 4, colors, "draw_lines");
+                b.render().draw_lines(
+                    batch.geometry.data(), batch.rows, batch.colors.data(), batch.colors.size()
+                );
+            },
+            py::arg("segments"),
+            py::arg("colors") = py::none()
+        )
+        .def("draw_points",
+            [](Backend& b, py::buffer points, py::object colors) {
+                auto& batch = load_batch(points, 2, colors, "draw_points");
+                b.render().draw_points(
+                    batch.geometry.data(), batch.rows, batch.colors.data(), batch.colors.size()
+                );
+            },
+            py::arg("points"),
+            py::arg("colors") = py::none()
+        )
+        .def("render_stats", [](Backend& b){ return b.render().stats(); })
+        .def("reset_render_stats", [](Backend& b){ b.render().reset_stats(); })
+        .def("set_clip_rect", [](Backend& b,float x,float y,float w,float h){
             b.render().set_clip_rect(x,y,w,h);
         })
         .def("clear_clip_rect", [](Backend& b){
@@ -161,6 +513,7 @@ PYBIND11_MODULE(_native, m) {
                     throw std::runtime_error("create_texture_rgba: buffer too small for h*pitch");
                 }
 
+                py::gil_scoped_release release;
                 return static_cast<int>(
                     b.render().create_texture_rgba(w, h, info.ptr, pitch)
                 );
@@ -171,6 +524,142 @@ PYBIND11_MODULE(_native, m) {
             py::arg("pitch") = -1
         )
 
+        .def("create_texture_streaming",
+            [](Backend& b, int w, int h) -> int {
+                return static_cast<int>(b.render().create_texture_streaming(w, h));
+            },
+            py::arg("width"),
+            py::arg("height")
+        )
+
+        .def("update_texture",
+            [](Backend& b, int texture_id, py::buffer data, py::object rect, int pitch) {
+                const auto tex = static_cast<TextureHandle>(texture_id);
+                auto [tw, th] = b.render().texture_size(tex);
+                if (tw <= 0 || th <= 0) {
+                    throw std::runtime_error("update_texture: unknown texture id " + std::to_string(texture_id));
+                }
+                TextureRect area;
+                const TextureRect* r = read_texture_rect(rect, area, "update_texture");
+                const int w = r ? r->w : tw;
+                const int h = r ? r->h : th;
+
+                // Upload straight from the caller's buffer, no staging copy.
+                py::buffer_info info = data.request();
+                pitch = rgba_pitch(info, w, h, pitch, "update_texture");
+                bool ok;
+                {
+                    py::gil_scoped_release release;
+                    ok = b.render().update_texture(tex, r, info.ptr, pitch);
+                }
+                if (!ok) {
+                    throw std::runtime_error("update_texture: " + std::string(SDL_GetError()));
+                }
+            },
+            py::arg("texture_id"),
+            py::arg("data"),
+            py::arg("rect") = py::none(),
+            py::arg("pitch") = -1
+        )
+
+        .def("lock_texture",
+            [](Backend& b, int texture_id, py::object rect) {
+                const auto tex = static_cast<TextureHandle>(texture_id);
+                auto [tw, th] = b.render().texture_size(tex);
+                if (tw <= 0 || th <= 0) {
+                    throw std::runtime_error("lock_texture: unknown texture id " + std::to_string(texture_id));
+                }
+                TextureRect area;
+                const TextureRect* r = read_texture_rect(rect, area, "lock_texture");
+                // SDL_LockTexture doesn't clip, and the view would reach
+                // past the texture's pixels.
+                check_rect_inside(r, tw, th, "lock_texture", "texture");
+                const int w = r ? r->w : tw;
+                const int h = r ? r->h : th;
+
+                void* pixels = nullptr;
+                int pitch = 0;
+                if (!b.render().lock_texture(tex, r, &pixels, &pitch)) {
+                    throw std::runtime_error("lock_texture: " + std::string(SDL_GetError()));
+                }
+                const py::ssize_t size = h > 0
+                    ? static_cast<py::ssize_t>(pitch) * (h - 1) + static_cast<py::ssize_t>(w) * 4
+                    : 0;
+                return py::make_tuple(
+                    py::memoryview::from_memory(pixels, size, false),
+                    pitch
+                );
+            },
+            py::arg("texture_id"),
+            py::arg("rect") = py::none()
+        )
+
+        .def("unlock_texture",
+            [](Backend& b, int texture_id) {
+                b.render().unlock_texture(static_cast<TextureHandle>(texture_id));
+            },
+            py::arg("texture_id")
+        )
+
+        .def("texture_size",
+            [](Backend& b, int texture_id) {
+                return b.render().texture_size(static_cast<TextureHandle>(texture_id));
+            },
+            py::arg("texture_id")
+        )
+
+        .def("texture_stats", [](Backend& b){ return b.render().texture_stats(); })
+
+        .def("set_texture_budget",
+            [](Backend& b, uint64_t bytes) {
+                b.render().set_texture_budget(bytes);
+            },
+            py::arg("bytes")
+        )
+
+        .def("set_texture_evictable",
+            [](Backend& b, int texture_id, bool evictable) {
+                b.render().set_texture_evictable(static_cast<TextureHandle>(texture_id), evictable);
+            },
+            py::arg("texture_id"),
+            py::arg("evictable") = true
+        )
+
+        .def("take_evicted_textures", [](Backend& b) {
+            std::vector<int> out;
+            for (TextureHandle tex : b.render().take_evicted_textures()) {
+                out.push_back(static_cast<int>(tex));
+            }
+            return out;
+        })
+
+        .def("create_render_target",
+            [](Backend& b, int w, int h) -> int {
+                return static_cast<int>(b.render().create_render_target(w, h));
+            },
+            py::arg("width"),
+            py::arg("height")
+        )
+
+        .def("set_render_target",
+            [](Backend& b, int texture_id) {
+                if (!b.render().set_render_target(static_cast<TextureHandle>(texture_id))) {
+                    throw std::runtime_error(
+                        "set_render_target: cannot render into texture " + std::to_string(texture_id)
+                    );
+                }
+            },
+            py::arg("texture_id") = 0
+        )
+
+        .def("render_target", [](Backend& b) -> int {
+            return static_cast<int>(b.render().render_target());
+        })
+
+        .def("clear", [](Backend& b, int r, int g, int bb, int a) {
+            b.render().clear(ColorRGBA{(uint8_t)r,(uint8_t)g,(uint8_t)bb,(uint8_t)a});
+        })
+
         .def("destroy_texture",
             [](Backend& b, int texture_id) {
                 b.render().destroy_texture(static_cast<TextureHandle>(texture_id));
@@ -179,17 +668,46 @@ PYBIND11_MODULE(_native, m) {
         )
 
         .def("draw_texture",
-            [](Backend& b, int texture_id, int x, int y, int w, int h, double angle_deg) {
+            [](Backend& b, int texture_id, float x, float y, float w, float h, double angle_deg,
+               int r, int g, int bb, int a) {
                 b.render().draw_texture(
                     static_cast<TextureHandle>(texture_id),
                     x,
                     y,
                     w,
                     h,
+                    angle_deg,
+                    ColorRGBA{(uint8_t)r,(uint8_t)g,(uint8_t)bb,(uint8_t)a}
+                );
+            },
+            py::arg("texture_id"),
+            py::arg("x"),
+            py::arg("y"),
+            py::arg("width"),
+            py::arg("height"),
+            py::arg("angle_deg") = 0.0,
+            py::arg("r") = 255,
+            py::arg("g") = 255,
+            py::arg("b") = 255,
+            py::arg("a") = 255
+        )
+
+        .def("draw_texture_region",
+            [](Backend& b, int texture_id,
+               float sx, float sy, float sw, float sh,
+               float x, float y, float w, float h, double angle_deg) {
+                b.render().draw_texture_region(
+                    static_cast<TextureHandle>(texture_id),
+                    sx, sy, sw, sh,
+                    x, y, w, h,
                     angle_deg
                 );
             },
             py::arg("texture_id"),
+            py::arg("src_x"),
+            py::arg("src_y"),
+            py::arg("src_w"),
+            py::arg("src_h"),
             py::arg("x"),
             py::arg("y"),
             py::arg("width"),
@@ -197,8 +715,32 @@ PYBIND11_MODULE(_native, m) {
             py::arg("angle_deg") = 0.0
         )
 
+        .def("draw_texture_instances",
+            [](Backend& b, int texture_id, py::buffer instances, py::object colors, py::object src) {
+                float src_rect[4];
+                const float* src_ptr = nullptr;
+                if (!src.is_none()) {
+                    auto r = src.cast<std::vector<float>>();
+                    if (r.size() != 4) {
+                        throw std::runtime_error("draw_texture_instances: src must be (x, y, w, h)");
+                    }
+                    std::copy(r.begin(), r.end(), src_rect);
+                    src_ptr = src_rect;
+                }
+                auto& batch = load_batch(instances, 5, colors, "draw_texture_instances");
+                b.render().draw_texture_instances(
+                    static_cast<TextureHandle>(texture_id), src_ptr,
+                    batch.geometry.data(), batch.rows, batch.colors.data(), batch.colors.size()
+                );
+            },
+            py::arg("texture_id"),
+            py::arg("instances"),
+            py::arg("colors") = py::none(),
+            py::arg("src") = py::none()
+        )
+
         .def("draw_texture_tiled_y",
-            [](Backend& b, int texture_id, int x, int y, int w, int h) {
+            [](Backend& b, int texture_id, float x, float y, float w, float h) {
                 b.render().draw_texture_tiled_y(
                     static_cast<TextureHandle>(texture_id), x, y, w, h
                 );
@@ -214,28 +756,145 @@ PYBIND11_MODULE(_native, m) {
         // Text wrappers
         .def("load_font", [](Backend& b, const std::string& path, int pt){
             return b.text().load_font(path, pt);
-        })
+        }, py::call_guard<py::gil_scoped_release>())
         .def("measure_text", [](Backend& b, const std::string& text, int font_id){
             return b.text().measure_utf8(text, font_id);
         }, py::arg("text"), py::arg("font_id")=-1)
-        .def("draw_text", [](Backend& b, const std::string& text,int x,int y,int r,int g,int bb,int a,int font_id){
+        .def("measure_text_many", [](Backend& b, const std::vector<std::string>& texts, int font_id){
+            std::vector<std::pair<int,int>> sizes;
+            sizes.reserve(texts.size());
+            for (const auto& text : texts) sizes.push_back(b.text().measure_utf8(text, font_id));
+            return sizes;
+        }, py::arg("texts"), py::arg("font_id")=-1)
+        .def("load_sdf_font", [](Backend& b, const std::string& path, int pt){
+            return b.text().load_sdf_font(path, pt);
+        }, py::arg("path"), py::arg("pt"), py::call_guard<py::gil_scoped_release>())
+        .def("prewarm_text", [](Backend& b, const std::vector<std::string>& texts, int font_id){
+            for (const std::string& text : texts) b.text().prewarm_utf8(text, font_id);
+        }, py::arg("texts"), py::arg("font_id")=-1, py::call_guard<py::gil_scoped_release>())
+        .def("rasterize_text", [](Backend& b, const std::vector<std::string>& texts, int font_id){
+            for (const std::string& text : texts) b.text().rasterize_utf8(text, font_id);
+        }, py::arg("texts"), py::arg("font_id")=-1, py::call_guard<py::gil_scoped_release>())
+        .def("upload_rasterized_text", [](Backend& b){
+            b.text().upload_rasterized();
+        }, py::call_guard<py::gil_scoped_release>())
+        .def("layout_text", [](Backend& b, const std::string& text, int max_width, int align, int font_id){
+            const TextLayout& layout = b.text().layout_utf8(
+                text, max_width, static_cast<TextAlign>(align), font_id
+            );
+            py::list lines;
+            for (const TextLine& line : layout.lines) {
+                lines.append(py::make_tuple(line.start, line.end, line.x, line.y, line.width));
+            }
+            return py::make_tuple(layout.width, layout.height, lines);
+        }, py::arg("text"), py::arg("max_width")=0, py::arg("align")=0, py::arg("font_id")=-1)
+        .def("draw_text_block", [](Backend& b, const std::string& text, float x, float y, int max_width,
+                                   int align, int r, int g, int bb, int a, int font_id){
+            b.text().draw_layout_utf8(
+                text, x, y, max_width, static_cast<TextAlign>(align), r, g, bb, a, font_id
+            );
+        }, py::arg("text"), py::arg("x"), py::arg("y"), py::arg("max_width"), py::arg("align"),
+           py::arg("r"), py::arg("g"), py::arg("b"), py::arg("a"), py::arg("font_id")=-1)
+        .def("draw_text", [](Backend& b, const std::string& text,float x,float y,int r,int g,int bb,int a,int font_id){
             b.text().draw_utf8(text, x,y, r,g,bb,a, font_id);
         }, py::arg("text"), py::arg("x"), py::arg("y"), py::arg("r"), py::arg("g"), py::arg("b"), py::arg("a"), py::arg("font_id")=-1)
 
         // Events
         .def("poll_events", [](Backend& b){
             return b.input().poll(b.window(), b.render());
+        }, py::call_guard<py::gil_scoped_release>())
+        .def("set_event_enabled", [](Backend& b, EventType type, bool enabled){
+            b.input().set_event_enabled(type, enabled);
+        }, py::arg("type"), py::arg("enabled"))
+        .def("event_enabled", [](Backend& b, EventType type){
+            return b.input().event_enabled(type);
+        }, py::arg("type"))
+        .def("set_coalesce_mouse_motion", [](Backend& b, bool enabled){
+            b.input().set_coalesce_motion(enabled);
+        }, py::arg("enabled"))
+        .def("keyboard_state", [](Backend& b){
+            int count = 0;
+            const uint8_t* keys = b.input().keyboard_state(count);
+            // SDL owns the array for the process lifetime; no copy.
+            return py::memoryview::from_memory(keys, (py::ssize_t)count);
         })
+        .def("mouse_state", [](Backend& b){
+            const MouseState m = b.input().mouse_state(b.window(), b.render());
+            return py::make_tuple(m.x, m.y, m.buttons);
+        })
+        .def("poll_events_into",
+            [](Backend& b, py::buffer records, py::buffer text) {
+                py::buffer_info ri = records.request(true);
+                py::buffer_info ti = text.request(true);
+                const size_t record_bytes = static_cast<size_t>(ri.size * ri.itemsize);
+                const size_t text_bytes = static_cast<size_t>(ti.size * ti.itemsize);
+                PackedPoll polled;
+                {
+                    py::gil_scoped_release release;
+                    polled = b.input().poll_into(
+                        b.window(), b.render(),
+                        static_cast<PackedEvent*>(ri.ptr), record_bytes / sizeof(PackedEvent),
+                        static_cast<char*>(ti.ptr), text_bytes
+                    );
+                }
+                return py::make_tuple(polled.count, polled.text_bytes, polled.fits);
+            },
+            py::arg("records"), py::arg("text"),
+            "Poll events as packed 64-byte records plus a UTF-8 text arena. "
+            "Returns (count, text_bytes, fits); when fits is False nothing was "
+            "copied and the call should be retried with larger buffers.")
 
         // Capture
+        .def("output_size", [](Backend& b){ return b.render().drawable_size(); })
         .def("capture_bmp", [](Backend& b, const std::string& path){
             return b.capture().save_bmp(b.render(), path);
-        })
+        }, py::call_guard<py::gil_scoped_release>())
         .def("capture_argb8888_bytes", [](Backend& b){
-            PixelBuffer pb = mini::capture_argb8888(b.render());
-            return py::make_tuple(pb.w, pb.h, py::bytes(
-                reinterpret_cast<const char*>(pb.bytes.data()),
-                pb.bytes.size()
-            ));
-        });
+            auto [w, h] = b.render().drawable_size();
+            if (w <= 0 || h <= 0) return py::make_tuple(0, 0, py::bytes());
+
+            // Read straight into the bytes object handed back to Python.
+            const py::ssize_t pitch = static_cast<py::ssize_t>(w) * 4;
+            auto data = py::reinterpret_steal<py::bytes>(
+                PyBytes_FromStringAndSize(nullptr, pitch * h)
+            );
+            if (!data) throw py::error_already_set();
+            char* dst = PyBytes_AS_STRING(data.ptr());
+            bool ok;
+            {
+                py::gil_scoped_release release;
+                ok = b.render().read_pixels_argb8888(dst, static_cast<int>(pitch), w, h);
+            }
+            if (!ok) return py::make_tuple(0, 0, py::bytes());
+            return py::make_tuple(w, h, data);
+        })
+        .def("capture_into",
+            [](Backend& b, py::buffer buffer, py::object rect, int format) {
+                if (format < 0 || format > static_cast<int>(PixelFormat::ARGB)) {
+                    throw std::runtime_error("capture_into: unknown pixel format " + std::to_string(format));
+                }
+                auto [dw, dh] = b.render().drawable_size();
+                TextureRect area;
+                const TextureRect* r = read_texture_rect(rect, area, "capture_into");
+                check_rect_inside(r, dw, dh, "capture_into", "framebuffer");
+                const int w = r ? r->w : dw;
+                const int h = r ? r->h : dh;
+                if (w <= 0 || h <= 0) return py::make_tuple(0, 0);
+
+                py::buffer_info info = buffer.request(true);
+                const int pitch = rgba_pitch(info, w, h, -1, "capture_into");
+                bool ok;
+                {
+                    py::gil_scoped_release release;
+                    ok = b.render().read_pixels(r, static_cast<PixelFormat>(format), info.ptr, pitch);
+                }
+                if (!ok) {
+                    throw std::runtime_error("capture_into: " + std::string(SDL_GetError()));
+                }
+                return py::make_tuple(w, h);
+            },
+            py::arg("buffer"),
+            py::arg("rect") = py::none(),
+            py::arg("format") = 0
+        );
 }
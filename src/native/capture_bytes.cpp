@@ -1,7 +1,5 @@
 #include "mini/capture_bytes.h"
 #include "mini/renderer.h"
-#include <SDL.h>
-#include <cstring>
 
 namespace mini {
 
@@ -10,22 +8,16 @@ namespace mini {
         auto [w, h] = renderer.drawable_size();
         if (w <= 0 || h <= 0) return out;
 
-        SDL_Surface* surface = SDL_CreateRGBSurfaceWithFormat(
-            0, w, h, 32, SDL_PIXELFORMAT_ARGB8888
-        );
-        if (!surface) return out;
-
-        if (!renderer.read_pixels_argb8888(surface->pixels, surface->pitch, w, h)) {
-            SDL_FreeSurface(surface);
+        // Read straight into the result; tight rows, no staging surface.
+        const int pitch = w * 4;
+        out.bytes.resize(static_cast<size_t>(pitch) * h);
+        if (!renderer.read_pixels_argb8888(out.bytes.data(), pitch, w, h)) {
+            out.bytes.clear();
             return out;
         }
 
         out.w = w;
         out.h = h;
-        out.bytes.resize(static_cast<size_t>(surface->pitch) * h);
-        std::memcpy(out.bytes.data(), surface->pixels, out.bytes.size());
-
-        SDL_FreeSurface(surface);
         return out;
     }
 
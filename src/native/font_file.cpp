@@ -0,0 +1,77 @@
+#include "mini/font_file.h"
+#include <stdexcept>
+
+#ifdef _WIN32
+#ifndef NOMINMAX
+#define NOMINMAX
+#endif
+#include <windows.h>
+#else
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
+namespace mini {
+
+    std::shared_ptr<MappedFile> MappedFile::open(const std::string& path) {
+        std::shared_ptr<MappedFile> file(new MappedFile());
+        file->path_ = path;
+        const std::string error = "font file: cannot map " + path;
+
+#ifdef _WIN32
+        HANDLE handle = CreateFileA(
+            path.c_str(), GENERIC_READ, FILE_SHARE_READ, nullptr,
+            OPEN_EXISTING, FILE_ATTRIBUTE_NORMAL, nullptr
+        );
+        if (handle == INVALID_HANDLE_VALUE) throw std::runtime_error(error);
+
+        LARGE_INTEGER size;
+        if (!GetFileSizeEx(handle, &size) || size.QuadPart == 0) {
+            CloseHandle(handle);
+            throw std::runtime_error(error);
+        }
+        // The mapping keeps the file open; the file handle isn't needed.
+        HANDLE mapping = CreateFileMappingA(handle, nullptr, PAGE_READONLY, 0, 0, nullptr);
+        CloseHandle(handle);
+        if (!mapping) throw std::runtime_error(error);
+
+        void* view = MapViewOfFile(mapping, FILE_MAP_READ, 0, 0, 0);
+        if (!view) {
+            CloseHandle(mapping);
+            throw std::runtime_error(error);
+        }
+        file->mapping_ = mapping;
+        file->data_ = static_cast<const uint8_t*>(view);
+        file->size_ = static_cast<size_t>(size.QuadPart);
+#else
+        const int fd = ::open(path.c_str(), O_RDONLY);
+        if (fd < 0) throw std::runtime_error(error);
+
+        struct stat st;
+        if (fstat(fd, &st) != 0 || st.st_size == 0) {
+            ::close(fd);
+            throw std::runtime_error(error);
+        }
+        void* view = mmap(nullptr, static_cast<size_t>(st.st_size), PROT_READ, MAP_PRIVATE, fd, 0);
+        ::close(fd);
+        if (view == MAP_FAILED) throw std::runtime_error(error);
+
+        file->data_ = static_cast<const uint8_t*>(view);
+        file->size_ = static_cast<size_t>(st.st_size);
+#endif
+        return file;
+    }
+
+    MappedFile::~MappedFile() {
+        if (!data_) return;
+#ifdef _WIN32
+        UnmapViewOfFile(data_);
+        CloseHandle(mapping_);
+#else
+        munmap(const_cast<uint8_t*>(data_), size_);
+#endif
+    }
+
+} // namespace mini
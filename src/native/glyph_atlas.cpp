@@ -0,0 +1,454 @@
+#include "mini/glyph_atlas.h"
+#include <algorithm>
+#include <cmath>
+#include <cstring>
+
+namespace mini {
+
+    uint32_t next_utf8(const char* s, size_t len, size_t& i) {
+        const auto c0 = static_cast<uint8_t>(s[i++]);
+        if (c0 < 0x80) return c0;
+
+        int extra = 0;
+        uint32_t cp = 0;
+        if ((c0 & 0xE0) == 0xC0) { extra = 1; cp = c0 & 0x1F; }
+        else if ((c0 & 0xF0) == 0xE0) { extra = 2; cp = c0 & 0x0F; }
+        else if ((c0 & 0xF8) == 0xF0) { extra = 3; cp = c0 & 0x07; }
+        else return 0xFFFD;
+
+        for (int k = 0; k < extra; ++k) {
+            if (i >= len) return 0xFFFD;
+            const auto c = static_cast<uint8_t>(s[i]);
+            if ((c & 0xC0) != 0x80) return 0xFFFD;
+            cp = (cp << 6) | (c & 0x3F);
+            ++i;
+        }
+        return cp;
+    }
+
+    GlyphAtlas::GlyphAtlas(IRenderer& renderer, TTF_Font* font, bool sdf)
+        : renderer_(renderer), font_(font), sdf_(sdf)
+        {
+            kerning_ = TTF_GetFontKerning(font_) != 0;
+            // Room for roughly 8 x 8 lines of glyphs per page; SDF glyphs
+            // carry padding and are prewarmed, so give them more.
+            const int want = sdf_
+                ? (TTF_FontHeight(font_) + 2 * kSdfSpread) * 10
+                : TTF_FontHeight(font_) * 8;
+            while (page_size_ < want && page_size_ < 2048) page_size_ *= 2;
+        }
+
+    GlyphAtlas::~GlyphAtlas() {
+        for (TextureHandle page : pages_) renderer_.destroy_texture(page);
+    }
+
+    const Glyph& GlyphAtlas::glyph(uint32_t cp) {
+        auto it = glyphs_.find(cp);
+        if (it != glyphs_.end()) return it->second;
+
+        // A worker may have rendered it already, or be rendering it now.
+        std::vector<GlyphBitmap> ready;
+        {
+            std::lock_guard<std::mutex> lock(font_mutex_);
+            ready.swap(ready_);
+            if (rendered_.insert(cp).second) {
+                ready.emplace_back();
+                render(cp, ready.back());
+            }
+        }
+        place_all(ready);
+        return glyphs_[cp];
+    }
+
+    int GlyphAtlas::kerning(uint32_t prev, uint32_t cp) const {
+        if (!kerning_ || prev == 0) return 0;
+        std::lock_guard<std::mutex> lock(font_mutex_);
+        return TTF_GetFontKerningSizeGlyphs32(font_, prev, cp);
+    }
+
+    std::pair<int,int> GlyphAtlas::measure(const std::string& text) const {
+        int w = 0, h = 0;
+        std::lock_guard<std::mutex> lock(font_mutex_);
+        if (TTF_SizeUTF8(font_, text.c_str(), &w, &h) != 0) return {0, 0};
+        return {w, h};
+    }
+
+    void GlyphAtlas::render_ahead(const char* text, size_t len) {
+        size_t i = 0;
+        while (i < len) {
+            const uint32_t cp = next_utf8(text, len, i);
+            // Locked per glyph so draws on the renderer thread aren't held
+            // up for a whole string.
+            std::lock_guard<std::mutex> lock(font_mutex_);
+            if (!rendered_.insert(cp).second) continue;
+            ready_.emplace_back();
+            render(cp, ready_.back());
+        }
+    }
+
+    void GlyphAtlas::upload_rendered() {
+        std::vector<GlyphBitmap> ready;
+        {
+            std::lock_guard<std::mutex> lock(font_mutex_);
+            ready.swap(ready_);
+        }
+        place_all(ready);
+    }
+
+    void GlyphAtlas::place_all(std::vector<GlyphBitmap>& bitmaps) {
+        for (const GlyphBitmap& bmp : bitmaps) place(bmp, glyphs_[bmp.cp]);
+    }
+
+    bool GlyphAtlas::reserve(int w, int h, Glyph& out) {
+        // One empty texel between glyphs keeps filtering from bleeding.
+        const int pw = w + 1;
+        const int ph = h + 1;
+        if (pw > page_size_ || ph > page_size_) return false;
+
+        if (shelf_x_ + pw > page_size_) {
+            shelf_y_ += shelf_h_;
+            shelf_x_ = 0;
+            shelf_h_ = 0;
+        }
+        if (pages_.empty() || shelf_y_ + ph > page_size_) {
+            staging_.assign(static_cast<size_t>(page_size_) * page_size_ * 4, 0);
+            const TextureHandle page = renderer_.create_texture_rgba(
+                page_size_, page_size_, staging_.data(), page_size_ * 4
+            );
+            if (page == 0) return false;
+            pages_.push_back(page);
+            if (sdf_) {
+                renderer_.set_texture_filter(page, true);
+                fields_.emplace_back(static_cast<size_t>(page_size_) * page_size_, 0);
+            }
+            shelf_x_ = 0;
+            shelf_y_ = 0;
+            shelf_h_ = 0;
+        }
+
+        out.page = pages_.back();
+        out.x = shelf_x_;
+        out.y = shelf_y_;
+        out.w = w;
+        out.h = h;
+        shelf_x_ += pw;
+        shelf_h_ = std::max(shelf_h_, ph);
+        return true;
+    }
+
+    void GlyphAtlas::render(uint32_t cp, GlyphBitmap& out) {
+        out.cp = cp;
+        int minx = 0, maxx = 0, miny = 0, maxy = 0, advance = 0;
+        if (TTF_GlyphMetrics32(font_, cp, &minx, &maxx, &miny, &maxy, &advance) != 0) return;
+        out.advance = advance;
+        out.minx = minx;
+
+        SDL_Surface* surf = TTF_RenderGlyph32_Blended(font_, cp, SDL_Color{255, 255, 255, 255});
+        if (!surf) return;
+        out.rgba.reset(SDL_ConvertSurfaceFormat(surf, SDL_PIXELFORMAT_RGBA32, 0));
+        SDL_FreeSurface(surf);
+        if (!out.rgba) return;
+
+        // The surface spans the whole line height; find the inked box.
+        const SDL_Surface* rgba = out.rgba.get();
+        const auto* px = static_cast<const uint8_t*>(rgba->pixels);
+        int x0 = rgba->w, y0 = rgba->h, x1 = -1, y1 = -1;
+        for (int y = 0; y < rgba->h; ++y) {
+            const uint8_t* row = px + static_cast<size_t>(y) * rgba->pitch;
+            for (int x = 0; x < rgba->w; ++x) {
+                if (row[x * 4 + 3] == 0) continue;
+                x0 = std::min(x0, x);
+                x1 = std::max(x1, x);
+                y0 = std::min(y0, y);
+                y1 = std::max(y1, y);
+            }
+        }
+        out.x0 = x0;
+        out.y0 = y0;
+        out.x1 = x1;
+        out.y1 = y1;
+    }
+
+    void GlyphAtlas::place(const GlyphBitmap& bmp, Glyph& out) {
+        out.advance = bmp.advance;
+        if (!bmp.rgba || bmp.x1 < 0) return;
+
+        const SDL_Surface* rgba = bmp.rgba.get();
+        const auto* px = static_cast<const uint8_t*>(rgba->pixels);
+        const int x0 = bmp.x0;
+        const int y0 = bmp.y0;
+        const int minx = bmp.minx;
+
+        if (sdf_) {
+            // The field reaches kSdfSpread texels past the ink box.
+            const int pad = kSdfSpread;
+            if (reserve(bmp.x1 - x0 + 1 + 2 * pad, bmp.y1 - y0 + 1 + 2 * pad, out)) {
+                out.bearing_x = x0 - pad - (minx < 0 ? -minx : 0);
+                out.bearing_y = y0 - pad;
+                build_field(px, rgba->pitch, rgba->w, rgba->h, x0 - pad, y0 - pad, out);
+            }
+            return;
+        }
+
+        const int w = bmp.x1 - x0 + 1;
+        const int h = bmp.y1 - y0 + 1;
+        if (reserve(w, h, out)) {
+            // Glyphs with a negative left bearing are shifted right by SDL_ttf.
+            out.bearing_x = x0 - (minx < 0 ? -minx : 0);
+            out.bearing_y = y0;
+
+            const size_t row_bytes = static_cast<size_t>(w) * 4;
+            staging_.resize(row_bytes * h);
+            for (int y = 0; y < h; ++y) {
+                std::memcpy(
+                    staging_.data() + row_bytes * y,
+                    px + static_cast<size_t>(y0 + y) * rgba->pitch + x0 * 4,
+                    row_bytes
+                );
+            }
+            const TextureRect rect{ out.x, out.y, w, h };
+            renderer_.update_texture(out.page, &rect, staging_.data(), static_cast<int>(row_bytes));
+        }
+    }
+
+    void GlyphAtlas::build_field(
+        const uint8_t* px, int pitch, int src_w, int src_h, int x0, int y0, Glyph& out
+    ) {
+        const int w = out.w;
+        const int h = out.h;
+        coverage_.assign(static_cast<size_t>(w) * h, 0);
+        for (int y = 0; y < h; ++y) {
+            const int sy = y0 + y;
+            if (sy < 0 || sy >= src_h) continue;
+            for (int x = 0; x < w; ++x) {
+                const int sx = x0 + x;
+                if (sx < 0 || sx >= src_w) continue;
+                coverage_[static_cast<size_t>(y) * w + x] = px[static_cast<size_t>(sy) * pitch + sx * 4 + 3];
+            }
+        }
+
+        // Brute-force distance to the nearest texel on the other side of the
+        // edge; glyph boxes are small and this only runs once per glyph.
+        const size_t page = pages_.size() - 1;
+        uint8_t* field = fields_[page].data();
+        const int r = kSdfSpread;
+        for (int y = 0; y < h; ++y) {
+            for (int x = 0; x < w; ++x) {
+                const uint8_t c = coverage_[static_cast<size_t>(y) * w + x];
+                const bool inside = c >= 128;
+                int best = (r + 1) * (r + 1);
+                for (int dy = -r; dy <= r; ++dy) {
+                    for (int dx = -r; dx <= r; ++dx) {
+                        const int d2 = dx * dx + dy * dy;
+                        if (d2 >= best) continue;
+                        const int nx = x + dx;
+                        const int ny = y + dy;
+                        const bool n_inside = nx >= 0 && nx < w && ny >= 0 && ny < h
+                            && coverage_[static_cast<size_t>(ny) * w + nx] >= 128;
+                        if (n_inside != inside) best = d2;
+                    }
+                }
+
+                float d = std::sqrt(static_cast<float>(best)) - 0.5f;
+                if (!inside) d = -d;
+                // Anti-aliased edge texels know their distance more precisely.
+                if (c > 0 && c < 255) d = (c - 127.5f) / 255.0f;
+
+                const float f = 128.0f + d * 127.0f / kSdfSpread;
+                field[static_cast<size_t>(out.y + y) * page_size_ + out.x + x] =
+                    static_cast<uint8_t>(std::clamp(f, 0.0f, 255.0f) + 0.5f);
+            }
+        }
+
+        if (threshold_scale_ > 0.0f) threshold(page, TextureRect{ out.x, out.y, w, h });
+    }
+
+    void GlyphAtlas::threshold(size_t page, const TextureRect& rect) {
+        const uint8_t* field = fields_[page].data();
+        const size_t row_bytes = static_cast<size_t>(rect.w) * 4;
+        staging_.resize(row_bytes * rect.h);
+        uint8_t* dst = staging_.data();
+        for (int y = 0; y < rect.h; ++y) {
+            const uint8_t* src = field + static_cast<size_t>(rect.y + y) * page_size_ + rect.x;
+            for (int x = 0; x < rect.w; ++x, dst += 4) {
+                dst[0] = dst[1] = dst[2] = 255;
+                dst[3] = alpha_lut_[src[x]];
+            }
+        }
+        renderer_.update_texture(pages_[page], &rect, staging_.data(), static_cast<int>(row_bytes));
+    }
+
+    void GlyphAtlas::set_threshold_scale(float scale) {
+        // A screen pixel spans kSdfOversample / scale texels; ramp coverage
+        // across one screen pixel around the edge.
+        const float ramp = kSdfOversample / scale;
+        for (int f = 0; f < 256; ++f) {
+            const float d = (f - 128) * static_cast<float>(kSdfSpread) / 127.0f;
+            const float a = std::clamp(0.5f + d / ramp, 0.0f, 1.0f);
+            alpha_lut_[f] = static_cast<uint8_t>(a * 255.0f + 0.5f);
+        }
+        threshold_scale_ = scale;
+        for (size_t page = 0; page < pages_.size(); ++page) {
+            threshold(page, TextureRect{ 0, 0, page_size_, page_size_ });
+        }
+    }
+
+    void GlyphAtlas::draw_sdf(const char* text, size_t len, float x, float y, ColorRGBA tint) {
+        const Viewport vp = renderer_.viewport();
+        if (vp.scale != threshold_scale_) set_threshold_scale(vp.scale);
+
+        // Quads scale with the viewport and bilinear filtering does the rest;
+        // only the line origin is snapped so moving text doesn't shimmer.
+        const float inv = 1.0f / kSdfOversample;
+        x = (std::round(vp.ox + x * vp.scale) - vp.ox) / vp.scale;
+        y = (std::round(vp.oy + y * vp.scale) - vp.oy) / vp.scale;
+        int pen = 0;
+        uint32_t prev = 0;
+        size_t i = 0;
+        while (i < len) {
+            const uint32_t cp = next_utf8(text, len, i);
+            pen += kerning(prev, cp);
+            const Glyph& g = glyph(cp);
+            if (g.page != 0) {
+                renderer_.draw_texture_region(
+                    g.page,
+                    static_cast<float>(g.x), static_cast<float>(g.y),
+                    static_cast<float>(g.w), static_cast<float>(g.h),
+                    x + (pen + g.bearing_x) * inv,
+                    y + g.bearing_y * inv,
+                    g.w * inv, g.h * inv,
+                    0.0, tint
+                );
+            }
+            pen += g.advance;
+            prev = cp;
+        }
+    }
+
+    void GlyphAtlas::draw(const char* text, size_t len, float x, float y, ColorRGBA tint) {
+        if (sdf_) {
+            draw_sdf(text, len, x, y, tint);
+            return;
+        }
+        // Glyph bitmaps are already screen-sized: snap the pen to whole
+        // screen pixels and hand the renderer virtual sizes that map back
+        // to the exact bitmap size.
+        const Viewport vp = renderer_.viewport();
+        const float inv = 1.0f / vp.scale;
+        const float left = std::round(vp.ox + x * vp.scale);
+        const float top = std::round(vp.oy + y * vp.scale);
+
+        int pen = 0;
+        uint32_t prev = 0;
+        size_t i = 0;
+        while (i < len) {
+            const uint32_t cp = next_utf8(text, len, i);
+            pen += kerning(prev, cp);
+            const Glyph& g = glyph(cp);
+            if (g.page != 0) {
+                renderer_.draw_texture_region(
+                    g.page,
+                    static_cast<float>(g.x), static_cast<float>(g.y),
+                    static_cast<float>(g.w), static_cast<float>(g.h),
+                    (left + pen + g.bearing_x - vp.ox) * inv,
+                    (top + g.bearing_y - vp.oy) * inv,
+                    g.w * inv, g.h * inv,
+                    0.0, tint
+                );
+            }
+            pen += g.advance;
+            prev = cp;
+        }
+    }
+
+    void GlyphAtlas::layout(const std::string& text, int max_width, TextAlign align, TextLayout& out) {
+        out.lines.clear();
+        out.width = 0;
+        const int unit = units();
+        if (max_width > 0) max_width *= unit;
+
+        const char* s = text.data();
+        const size_t len = text.size();
+        const int skip = TTF_FontLineSkip(font_);
+        constexpr size_t kNone = static_cast<size_t>(-1);
+
+        // Scan state; `brk` is the last space seen on the current line.
+        size_t line_start = 0, i = 0, brk = kNone, after_brk = 0;
+        uint32_t line_start_cp = 0, cp_index = 0, brk_cp = 0, after_brk_cp = 0;
+        uint32_t prev = 0;
+        int pen = 0, brk_width = 0;
+
+        auto emit = [&](size_t b0, uint32_t c0, size_t b1, uint32_t c1, int width) {
+            TextLine line;
+            line.start = c0;
+            line.end = c1;
+            line.bytes_start = static_cast<uint32_t>(b0);
+            line.bytes_end = static_cast<uint32_t>(b1);
+            line.y = static_cast<int>(out.lines.size()) * skip;
+            line.width = width;
+            out.lines.push_back(line);
+            out.width = std::max(out.width, width);
+        };
+        auto restart = [&](size_t b, uint32_t c) {
+            line_start = i = b;
+            line_start_cp = cp_index = c;
+            brk = kNone;
+            prev = 0;
+            pen = 0;
+        };
+
+        while (i < len) {
+            const size_t at = i;
+            const uint32_t at_cp = cp_index;
+            const uint32_t cp = next_utf8(s, len, i);
+            ++cp_index;
+
+            if (cp == '\n') {
+                emit(line_start, line_start_cp, at, at_cp, pen);
+                restart(i, cp_index);
+                continue;
+            }
+
+            const int adv = kerning(prev, cp) + glyph(cp).advance;
+            if (cp == ' ') {
+                brk = at;
+                brk_cp = at_cp;
+                brk_width = pen;
+                after_brk = i;
+                after_brk_cp = cp_index;
+            } else if (max_width > 0 && pen + adv > max_width && at > line_start) {
+                if (brk != kNone) {
+                    emit(line_start, line_start_cp, brk, brk_cp, brk_width);
+                    restart(after_brk, after_brk_cp);
+                } else {
+                    // A single word wider than the line breaks anywhere.
+                    emit(line_start, line_start_cp, at, at_cp, pen);
+                    restart(at, at_cp);
+                }
+                continue;
+            }
+            pen += adv;
+            prev = cp;
+        }
+        emit(line_start, line_start_cp, len, cp_index, pen);
+
+        const int block = max_width > 0 ? max_width : out.width;
+        for (TextLine& line : out.lines) {
+            if (align == TextAlign::Center) line.x = (block - line.width) / 2;
+            else if (align == TextAlign::Right) line.x = block - line.width;
+        }
+        out.height = static_cast<int>(out.lines.size()) * skip;
+
+        if (unit > 1) {
+            auto to_units = [unit](int v) { return (v + unit / 2) / unit; };
+            for (TextLine& line : out.lines) {
+                line.x = to_units(line.x);
+                line.y = to_units(line.y);
+                line.width = to_units(line.width);
+            }
+            out.width = to_units(out.width);
+            out.height = to_units(out.height);
+        }
+    }
+
+} // namespace mini
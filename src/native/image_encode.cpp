@@ -0,0 +1,102 @@
+#include "mini/image_encode.h"
+#include <cstddef>
+
+namespace mini {
+namespace {
+
+constexpr uint8_t QOI_OP_INDEX = 0x00;
+constexpr uint8_t QOI_OP_DIFF  = 0x40;
+constexpr uint8_t QOI_OP_LUMA  = 0x80;
+constexpr uint8_t QOI_OP_RUN   = 0xc0;
+constexpr uint8_t QOI_OP_RGB   = 0xfe;
+constexpr uint8_t QOI_OP_RGBA  = 0xff;
+constexpr int QOI_MAX_RUN = 62;
+
+struct Px {
+    uint8_t r = 0, g = 0, b = 0, a = 0;
+    bool operator==(const Px& o) const { return r == o.r && g == o.g && b == o.b && a == o.a; }
+};
+
+inline int qoi_hash(const Px& p) {
+    return (p.r * 3 + p.g * 5 + p.b * 7 + p.a * 11) % 64;
+}
+
+void put_u32_be(std::vector<uint8_t>& out, uint32_t v) {
+    out.push_back(static_cast<uint8_t>(v >> 24));
+    out.push_back(static_cast<uint8_t>(v >> 16));
+    out.push_back(static_cast<uint8_t>(v >> 8));
+    out.push_back(static_cast<uint8_t>(v));
+}
+
+} // namespace
+
+    std::vector<uint8_t> encode_qoi(const uint8_t* rgba, int w, int h, int pitch) {
+        std::vector<uint8_t> out;
+        // Worst case is 5 bytes per pixel plus header and end marker.
+        out.reserve(14 + static_cast<size_t>(w) * h * 5 + 8);
+
+        out.insert(out.end(), { 'q', 'o', 'i', 'f' });
+        put_u32_be(out, static_cast<uint32_t>(w));
+        put_u32_be(out, static_cast<uint32_t>(h));
+        out.push_back(4); // channels: RGBA
+        out.push_back(0); // colorspace: sRGB with linear alpha
+
+        Px index[64];
+        Px prev{ 0, 0, 0, 255 };
+        int run = 0;
+
+        for (int y = 0; y < h; ++y) {
+            const uint8_t* row = rgba + static_cast<size_t>(y) * pitch;
+            for (int x = 0; x < w; ++x) {
+                const uint8_t* p = row + static_cast<size_t>(x) * 4;
+                const Px px{ p[0], p[1], p[2], p[3] };
+
+                if (px == prev) {
+                    if (++run == QOI_MAX_RUN) {
+                        out.push_back(static_cast<uint8_t>(QOI_OP_RUN | (run - 1)));
+                        run = 0;
+                    }
+                    continue;
+                }
+                if (run > 0) {
+                    out.push_back(static_cast<uint8_t>(QOI_OP_RUN | (run - 1)));
+                    run = 0;
+                }
+
+                const int slot = qoi_hash(px);
+                if (index[slot] == px) {
+                    out.push_back(static_cast<uint8_t>(QOI_OP_INDEX | slot));
+                } else {
+                    index[slot] = px;
+                    if (px.a == prev.a) {
+                        const int dr = static_cast<int8_t>(px.r - prev.r);
+                        const int dg = static_cast<int8_t>(px.g - prev.g);
+                        const int db = static_cast<int8_t>(px.b - prev.b);
+                        const int dr_dg = dr - dg;
+                        const int db_dg = db - dg;
+                        if (dr > -3 && dr < 2 && dg > -3 && dg < 2 && db > -3 && db < 2) {
+                            out.push_back(static_cast<uint8_t>(
+                                QOI_OP_DIFF | (dr + 2) << 4 | (dg + 2) << 2 | (db + 2)
+                            ));
+                        } else if (dr_dg > -9 && dr_dg < 8 && dg > -33 && dg < 32 && db_dg > -9 && db_dg < 8) {
+                            out.push_back(static_cast<uint8_t>(QOI_OP_LUMA | (dg + 32)));
+                            out.push_back(static_cast<uint8_t>((dr_dg + 8) << 4 | (db_dg + 8)));
+                        } else {
+                            out.insert(out.end(), { QOI_OP_RGB, px.r, px.g, px.b });
+                        }
+                    } else {
+                        out.insert(out.end(), { QOI_OP_RGBA, px.r, px.g, px.b, px.a });
+                    }
+                }
+                prev = px;
+            }
+        }
+        if (run > 0) {
+            out.push_back(static_cast<uint8_t>(QOI_OP_RUN | (run - 1)));
+        }
+
+        out.insert(out.end(), { 0, 0, 0, 0, 0, 0, 0, 1 });
+        return out;
+    }
+
+} // namespace mini
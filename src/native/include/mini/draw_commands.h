@@ -0,0 +1,112 @@
+#pragma once
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+#include <stdexcept>
+#include "color.h"
+
+namespace mini {
+
+// Packed draw-command stream shared with Python (draw_commands.py).
+// Every record is a little-endian uint32 opcode followed by the payload
+// struct for that opcode. Payloads are tightly packed (no padding), so the
+// Python side can mirror them with plain struct formats.
+enum class DrawOp : uint32_t {
+    Rect = 1,
+    Line = 2,
+    Texture = 3,
+    ClipRect = 4,
+    ClearClipRect = 5,
+    Circle = 6,
+    Poly = 7,
+    TextureRegion = 8,
+    Text = 9,
+    TextBlock = 10,
+};
+
+struct RectCmd {
+    float x, y, w, h;
+    ColorRGBA color;
+};
+
+struct LineCmd {
+    float x1, y1, x2, y2;
+    ColorRGBA color;
+    int32_t thickness;
+};
+
+struct TextureCmd {
+    uint32_t tex;
+    float x, y, w, h;
+    float angle_deg;
+    ColorRGBA tint;
+};
+
+// Source rect in texels, destination in pixels.
+struct TextureRegionCmd {
+    uint32_t tex;
+    float sx, sy, sw, sh;
+    float x, y, w, h;
+    float angle_deg;
+};
+
+struct ClipRectCmd {
+    float x, y, w, h;
+};
+
+struct CircleCmd {
+    float x, y, radius;
+    ColorRGBA color;
+};
+
+// Followed by `count` interleaved float32 x, y vertices.
+struct PolyCmd {
+    ColorRGBA color;
+    uint32_t count;
+    uint32_t filled;
+};
+
+// Followed by `length` bytes of UTF-8 text. Drawn with the line top-left at
+// (x, y); font_id < 0 selects the default font.
+struct TextCmd {
+    int32_t font_id;
+    float x, y;
+    ColorRGBA color;
+    uint32_t length;
+};
+
+// Text laid out by ITextRenderer::layout_utf8, followed by `length` bytes
+// of UTF-8. max_width is in screen pixels (0 = no wrapping).
+struct TextBlockCmd {
+    int32_t font_id;
+    float x, y;
+    ColorRGBA color;
+    int32_t max_width;
+    uint32_t align;
+    uint32_t length;
+};
+
+static_assert(sizeof(RectCmd) == 20, "RectCmd layout must match Python");
+static_assert(sizeof(LineCmd) == 24, "LineCmd layout must match Python");
+static_assert(sizeof(TextureCmd) == 28, "TextureCmd layout must match Python");
+static_assert(sizeof(TextureRegionCmd) == 40, "TextureRegionCmd layout must match Python");
+static_assert(sizeof(ClipRectCmd) == 16, "ClipRectCmd layout must match Python");
+static_assert(sizeof(CircleCmd) == 16, "CircleCmd layout must match Python");
+static_assert(sizeof(PolyCmd) == 12, "PolyCmd layout must match Python");
+static_assert(sizeof(TextCmd) == 20, "TextCmd layout must match Python");
+static_assert(sizeof(TextBlockCmd) == 28, "TextBlockCmd layout must match Python");
+
+// Copy the next record out of the stream and advance the cursor.
+// Records may be unaligned inside a Python bytearray, hence memcpy.
+template <typename T>
+T read_command(const uint8_t*& cursor, const uint8_t* end) {
+    if (static_cast<size_t>(end - cursor) < sizeof(T)) {
+        throw std::runtime_error("submit: truncated draw command buffer");
+    }
+    T out;
+    std::memcpy(&out, cursor, sizeof(T));
+    cursor += sizeof(T);
+    return out;
+}
+
+} // namespace mini
@@ -1,4 +1,5 @@
 #pragma once
+#include <cstdint>
 #include <string>
 
 namespace mini {
@@ -42,4 +43,27 @@ struct Event {
     std::string text;
 };
 
+// Fixed-size event record for packed polling; the layout must match
+// EVENT_FIELDS in mapping/events.py. Text lives in a separate UTF-8 arena.
+struct PackedEvent {
+    int32_t type = 0;
+    int32_t key = 0;
+    int32_t scancode = 0;
+    int32_t mod = 0;
+    int32_t repeat = 0;
+    int32_t x = 0;
+    int32_t y = 0;
+    int32_t dx = 0;
+    int32_t dy = 0;
+    int32_t button = 0;
+    int32_t wheel_x = 0;
+    int32_t wheel_y = 0;
+    int32_t width = 0;
+    int32_t height = 0;
+    uint32_t text_offset = 0; // byte offset into the text arena
+    uint32_t text_length = 0;
+};
+
+static_assert(sizeof(PackedEvent) == 64, "PackedEvent layout must match Python");
+
 } // namespace mini
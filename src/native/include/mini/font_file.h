@@ -0,0 +1,36 @@
+#pragma once
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <string>
+
+namespace mini {
+
+// Read-only memory mapping of a font file. Every size of a font is opened
+// from the same mapping, so the file is read from disk (lazily, by the OS)
+// at most once however many sizes are used.
+class MappedFile {
+    public:
+        // Throws std::runtime_error if the file can't be opened or mapped.
+        static std::shared_ptr<MappedFile> open(const std::string& path);
+        ~MappedFile();
+
+        MappedFile(const MappedFile&) = delete;
+        MappedFile& operator=(const MappedFile&) = delete;
+
+        const uint8_t* data() const { return data_; }
+        size_t size() const { return size_; }
+        const std::string& path() const { return path_; }
+
+    private:
+        MappedFile() = default;
+
+        std::string path_;
+        const uint8_t* data_ = nullptr;
+        size_t size_ = 0;
+#ifdef _WIN32
+        void* mapping_ = nullptr;
+#endif
+};
+
+} // namespace mini
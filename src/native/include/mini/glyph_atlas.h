@@ -0,0 +1,134 @@
+#pragma once
+#include <SDL_ttf.h>
+#include <cstdint>
+#include <memory>
+#include <mutex>
+#include <unordered_map>
+#include <unordered_set>
+#include <utility>
+#include <vector>
+#include "renderer.h"
+#include "text.h"
+
+namespace mini {
+
+// Decode the next code point of a UTF-8 string and advance `i`.
+// Malformed sequences decode as U+FFFD.
+uint32_t next_utf8(const char* s, size_t len, size_t& i);
+
+// Signed distance field atlases rasterize fonts at kSdfOversample times the
+// requested size and store distances up to kSdfSpread texels from the edge.
+constexpr int kSdfOversample = 2;
+constexpr int kSdfSpread = 4;
+
+// Placement of one rasterized glyph.
+struct Glyph {
+    TextureHandle page = 0; // 0 for glyphs without ink (spaces)
+    int x = 0, y = 0;       // texel position inside the page
+    int w = 0, h = 0;
+    int bearing_x = 0;      // ink offset from the pen position
+    int bearing_y = 0;      // ink offset from the line top
+    int advance = 0;
+};
+
+struct SurfaceDeleter {
+    void operator()(SDL_Surface* s) const { SDL_FreeSurface(s); }
+};
+
+// A glyph rendered by SDL_ttf but not placed in a page yet.
+struct GlyphBitmap {
+    uint32_t cp = 0;
+    int advance = 0;
+    int minx = 0;
+    // Inked box inside `rgba`; x1 < 0 for glyphs without ink.
+    int x0 = 0, y0 = 0, x1 = -1, y1 = -1;
+    std::unique_ptr<SDL_Surface, SurfaceDeleter> rgba; // null if not rendered
+};
+
+// Glyph cache for one TTF_Font: every glyph is rasterized once as a white
+// coverage mask into shared pages, so strings are drawn as tinted quads
+// that the renderer batches per page.
+//
+// Bitmap atlases hold glyphs at screen size and are pixel-snapped. SDF
+// atlases keep a distance field per page instead; it is thresholded into
+// coverage for the current viewport scale, so a rescale costs one pass over
+// the pages and glyphs are never rasterized again. Metrics and layouts of
+// SDF atlases are in virtual units rather than screen pixels.
+//
+// Rendering glyph bitmaps only needs the font, so render_ahead() may run on
+// any thread; every use of the TTF_Font holds a per-font lock. Placing the
+// bitmaps into pages goes through the renderer and stays on its thread.
+class GlyphAtlas {
+    public:
+        GlyphAtlas(IRenderer& renderer, TTF_Font* font, bool sdf = false);
+        ~GlyphAtlas();
+
+        GlyphAtlas(const GlyphAtlas&) = delete;
+        GlyphAtlas& operator=(const GlyphAtlas&) = delete;
+
+        // Rasterized on first use. Code points the font can't measure get
+        // an empty glyph so they are not retried every frame.
+        const Glyph& glyph(uint32_t cp);
+        // Extra advance between two consecutive code points.
+        int kerning(uint32_t prev, uint32_t cp) const;
+        // Size of UTF-8 text in font units, or {0, 0} on error.
+        std::pair<int,int> measure(const std::string& text) const;
+
+        // Render the missing glyphs of UTF-8 text without placing them.
+        // Safe to call from any thread.
+        void render_ahead(const char* text, size_t len);
+        // Place glyphs rendered ahead into the pages. Renderer thread only.
+        void upload_rendered();
+
+        // Draw UTF-8 text with its line top-left at virtual (x, y).
+        void draw(const char* text, size_t len, float x, float y, ColorRGBA tint);
+        // Break and align text into `out` (see ITextRenderer::layout_utf8).
+        void layout(const std::string& text, int max_width, TextAlign align, TextLayout& out);
+
+        bool sdf() const { return sdf_; }
+        // Font units per layout unit: the oversampling of SDF atlases.
+        int units() const { return sdf_ ? kSdfOversample : 1; }
+        size_t glyph_count() const { return glyphs_.size(); }
+        size_t page_count() const { return pages_.size(); }
+
+    private:
+        // Callers hold font_mutex_.
+        void render(uint32_t cp, GlyphBitmap& out);
+        void place(const GlyphBitmap& bmp, Glyph& out);
+        void place_all(std::vector<GlyphBitmap>& bitmaps);
+        bool reserve(int w, int h, Glyph& out);
+        void build_field(const uint8_t* px, int pitch, int src_w, int src_h, int x0, int y0, Glyph& out);
+        void threshold(size_t page, const TextureRect& rect);
+        void set_threshold_scale(float scale);
+        void draw_sdf(const char* text, size_t len, float x, float y, ColorRGBA tint);
+
+        IRenderer& renderer_;
+        TTF_Font* font_;
+        bool kerning_ = false;
+        bool sdf_ = false;
+        int page_size_ = 256;
+
+        // SDF mode: one distance field per page and the field-to-alpha
+        // table for the viewport scale the pages were thresholded at.
+        std::vector<std::vector<uint8_t>> fields_;
+        uint8_t alpha_lut_[256] = {};
+        float threshold_scale_ = 0.0f;
+
+        std::unordered_map<uint32_t, Glyph> glyphs_;
+
+        // Guards font_ and the glyphs rendered but not placed yet. Code
+        // points enter rendered_ with their bitmap, so each is rendered once.
+        mutable std::mutex font_mutex_;
+        std::unordered_set<uint32_t> rendered_;
+        std::vector<GlyphBitmap> ready_;
+
+        std::vector<TextureHandle> pages_;
+        // Shelf packer state for the newest page.
+        int shelf_x_ = 0;
+        int shelf_y_ = 0;
+        int shelf_h_ = 0;
+        std::vector<uint8_t> staging_;
+        std::vector<uint8_t> coverage_;
+};
+
+} // namespace mini
@@ -0,0 +1,11 @@
+#pragma once
+#include <cstdint>
+#include <vector>
+
+namespace mini {
+
+// Encode `h` rows of `w` RGBA texels (`pitch` bytes apart) as a QOI image
+// (https://qoiformat.org). Pure CPU work: safe to call off the render thread.
+std::vector<uint8_t> encode_qoi(const uint8_t* rgba, int w, int h, int pitch);
+
+} // namespace mini
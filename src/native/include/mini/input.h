@@ -1,4 +1,7 @@
 #pragma once
+#include <SDL.h>
+#include <cstddef>
+#include <string>
 #include <vector>
 #include "event.h"
 #include "window.h"
@@ -6,9 +9,60 @@
 
 namespace mini {
 
+struct PackedPoll {
+    size_t count = 0;      // records polled
+    size_t text_bytes = 0; // bytes of text arena used
+    bool fits = true;      // false: nothing copied, retry with bigger buffers
+};
+
+struct MouseState {
+    int x = 0, y = 0;     // drawable pixels, like mouse events
+    uint32_t buttons = 0; // SDL_BUTTON() mask
+};
+
 class Input {
 public:
     std::vector<Event> poll(Window& window, IRenderer& renderer);
+
+    // Drop events of a type. Types backed by SDL events are also disabled
+    // with SDL_EventState, so they never reach the queue.
+    void set_event_enabled(EventType type, bool enabled);
+    bool event_enabled(EventType type) const;
+    // Merge runs of consecutive MouseMotion events into one carrying the
+    // last position and the summed deltas.
+    void set_coalesce_motion(bool enabled) { coalesce_motion_ = enabled; }
+    bool coalesce_motion() const { return coalesce_motion_; }
+
+    // SDL's pressed flags indexed by scancode. The array is owned by SDL,
+    // stays valid until SDL_Quit and is updated whenever events are pumped.
+    const uint8_t* keyboard_state(int& count) const;
+    // Mouse position and buttons as of the last poll, scaled like events.
+    MouseState mouse_state(Window& window, IRenderer& renderer);
+
+    // Poll into caller-owned buffers. Events that don't fit wait in a
+    // reused staging buffer until the next call, so none are lost.
+    PackedPoll poll_into(
+        Window& window, IRenderer& renderer,
+        PackedEvent* records, size_t capacity,
+        char* text, size_t text_capacity
+    );
+
+private:
+    bool translate(const SDL_Event& e, Window& window, IRenderer& renderer,
+                   PackedEvent& ev, const char*& text);
+    void update_scale(Window& window, IRenderer& renderer);
+    void scale_mouse(Window& window, IRenderer& renderer, PackedEvent& ev);
+    bool merge_motion(PackedEvent& last, const PackedEvent& ev) const;
+
+    std::vector<PackedEvent> staged_;
+    std::string staged_text_;
+
+    uint32_t enabled_ = ~0u; // bit per EventType
+    bool coalesce_motion_ = false;
+    // Window-to-drawable mouse scale, recomputed after window size changes.
+    bool scale_valid_ = false;
+    float scale_x_ = 1.0f;
+    float scale_y_ = 1.0f;
 };
 
 } // namespace mini
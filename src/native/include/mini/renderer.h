@@ -1,12 +1,58 @@
 #pragma once
+#include <cstddef>
 #include <cstdint>
 #include <utility>
+#include <vector>
 #include "color.h"
 
 namespace mini {
 
+class ITextRenderer;
+
 using TextureHandle = uint32_t;
 
+// Texture memory accounting (bytes are estimated as w * h * 4).
+struct TextureStats {
+    uint32_t count = 0;           // live textures
+    uint64_t bytes = 0;           // bytes held by live textures
+    uint64_t evictable_bytes = 0; // part of `bytes` that may be evicted
+    uint64_t budget = 0;          // 0 = unlimited
+    uint64_t evictions = 0;       // textures dropped to honor the budget
+};
+
+// Integer pixel rect inside a texture.
+struct TextureRect {
+    int x = 0;
+    int y = 0;
+    int w = 0;
+    int h = 0;
+};
+
+// Byte order of 4-byte texels read back from the framebuffer, e.g. RGBA
+// stores R at the lowest address regardless of host endianness.
+enum class PixelFormat : uint32_t {
+    RGBA = 0,
+    BGRA = 1,
+    ARGB = 2,
+};
+
+// Counters for the renderer's redundant-state filter.
+struct RenderStats {
+    uint64_t state_changes = 0;    // state calls actually sent to the driver
+    uint64_t state_skipped = 0;    // state calls dropped because nothing changed
+    uint64_t texture_switches = 0; // texture draws using a different texture than the last one
+};
+
+// Virtual-to-screen mapping the renderer applies to every draw call:
+// screen = offset + virtual * scale for positions, virtual * scale for sizes.
+struct Viewport {
+    float ox = 0.0f;
+    float oy = 0.0f;
+    float scale = 1.0f;
+};
+
+// All draw, clip and texture-destination coordinates are virtual units,
+// mapped through the current Viewport.
 class IRenderer {
     public:
         virtual ~IRenderer() = default;
@@ -15,31 +61,105 @@ class IRenderer {
         virtual void begin_frame() = 0;
         virtual void end_frame() = 0;
 
-        virtual void draw_rect(int x,int y,int w,int h, ColorRGBA c) = 0;
-        virtual void draw_line(int x1,int y1,int x2,int y2, ColorRGBA c, int thickness) = 0;
-        virtual void draw_circle(int x, int y, int radius, ColorRGBA c) = 0;
-        virtual void draw_poly(const std::pair<int,int>* points, size_t count, ColorRGBA c) = 0;
+        virtual void set_viewport(const Viewport& vp) = 0;
+        virtual Viewport viewport() const = 0;
 
-        virtual void set_clip_rect(int x,int y,int w,int h) = 0;
+        virtual void draw_rect(float x, float y, float w, float h, ColorRGBA c) = 0;
+        virtual void draw_line(float x1, float y1, float x2, float y2, ColorRGBA c, int thickness) = 0;
+        virtual void draw_circle(float x, float y, float radius, ColorRGBA c) = 0;
+        // `xy` holds `count` interleaved x, y vertices.
+        virtual void draw_poly(const float* xy, size_t count, ColorRGBA c, bool filled) = 0;
+
+        // Batched primitives. `colors` holds either one color applied to every
+        // item (color_count == 1) or one color per item (color_count == count).
+        virtual void draw_rects(const float* xywh, size_t count, const ColorRGBA* colors, size_t color_count) = 0;
+        virtual void draw_lines(const float* segments, size_t count, const ColorRGBA* colors, size_t color_count) = 0;
+        virtual void draw_points(const float* xy, size_t count, const ColorRGBA* colors, size_t color_count) = 0;
+
+        virtual void set_clip_rect(float x, float y, float w, float h) = 0;
         virtual void clear_clip_rect() = 0;
 
         virtual std::pair<int,int> drawable_size() const = 0;
 
+        // Replay a packed draw-command stream (see draw_commands.h). Text
+        // records are drawn through `text`; they are rejected if it's null.
+        virtual void submit(const uint8_t* data, size_t size, ITextRenderer* text) = 0;
+
         // Texture API (needed for text now, sprites later)
         virtual TextureHandle create_texture_rgba(int w, int h, const void* pixels, int pitch) = 0;
+        // `tint` multiplies the texture colors, so white masks can be drawn
+        // in any color without re-uploading them.
         virtual void draw_texture(
             TextureHandle tex,
-            int x,
-            int y,
-            int w,
-            int h,
-            double angle_deg = 0.0
+            float x,
+            float y,
+            float w,
+            float h,
+            double angle_deg = 0.0,
+            ColorRGBA tint = ColorRGBA{255,255,255,255}
+        ) = 0;
+        // Draw the (sx, sy, sw, sh) texel rect of `tex` into (x, y, w, h).
+        // Consecutive draws from the same texture may be batched, so they
+        // only reach the driver on the next non-sprite call or end_frame.
+        virtual void draw_texture_region(
+            TextureHandle tex,
+            float sx, float sy, float sw, float sh,
+            float x, float y, float w, float h,
+            double angle_deg = 0.0,
+            ColorRGBA tint = ColorRGBA{255,255,255,255}
+        ) = 0;
+        // Draw `count` copies of `tex` in one batch. `xywha` holds x, y, w, h
+        // and a clockwise angle in degrees per instance; `colors` tints them
+        // (one shared or one per instance, as for draw_rects). `src` is an
+        // optional sx, sy, sw, sh texel rect shared by every instance.
+        virtual void draw_texture_instances(
+            TextureHandle tex,
+            const float* src,
+            const float* xywha,
+            size_t count,
+            const ColorRGBA* colors,
+            size_t color_count
         ) = 0;
         virtual void destroy_texture(TextureHandle tex) = 0;
-        virtual void draw_texture_tiled_y(TextureHandle tex, int x, int y, int w, int h) = 0;
+        // Sample with bilinear filtering instead of nearest texels.
+        virtual void set_texture_filter(TextureHandle tex, bool linear) = 0;
+
+        // Streaming textures: contents are expected to change often.
+        // `rect` selects a sub-area; nullptr means the whole texture.
+        virtual TextureHandle create_texture_streaming(int w, int h) = 0;
+        virtual bool update_texture(TextureHandle tex, const TextureRect* rect, const void* pixels, int pitch) = 0;
+        // Map texture memory for writing. Only valid until unlock_texture;
+        // the previous contents are undefined, so every texel must be written.
+        virtual bool lock_texture(TextureHandle tex, const TextureRect* rect, void** pixels, int* pitch) = 0;
+        virtual void unlock_texture(TextureHandle tex) = 0;
+        // Render targets: textures that can be drawn into. Handle 0 selects
+        // the window again. clear() fills the current target.
+        virtual TextureHandle create_render_target(int w, int h) = 0;
+        virtual bool set_render_target(TextureHandle tex) = 0;
+        virtual TextureHandle render_target() const = 0;
+        virtual void clear(ColorRGBA c) = 0;
+
+        // Optional texture memory budget. When creating a texture pushes the
+        // total past it, evictable textures not drawn during the current
+        // frame are destroyed, least recently drawn first. Their handles are
+        // reported once by take_evicted_textures().
+        virtual void set_texture_budget(uint64_t bytes) = 0;
+        virtual void set_texture_evictable(TextureHandle tex, bool evictable) = 0;
+        virtual TextureStats texture_stats() const = 0;
+        virtual std::vector<TextureHandle> take_evicted_textures() = 0;
+
+        // {0, 0} for unknown handles.
+        virtual std::pair<int,int> texture_size(TextureHandle tex) const = 0;
+        virtual void draw_texture_tiled_y(TextureHandle tex, float x, float y, float w, float h) = 0;
+
+        virtual RenderStats stats() const = 0;
+        virtual void reset_stats() = 0;
 
         // Capture hook (ARGB8888)
         virtual bool read_pixels_argb8888(void* dst, int pitch, int w, int h) = 0;
+        // Read `rect` (output pixels, nullptr = whole target) of the current
+        // render target straight into `dst`, `pitch` bytes per row.
+        virtual bool read_pixels(const TextureRect* rect, PixelFormat format, void* dst, int pitch) = 0;
 };
 
 } // namespace mini
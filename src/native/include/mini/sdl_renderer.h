@@ -1,7 +1,7 @@
 #pragma once
 #include <SDL.h>
+#include <string>
 #include <vector>
-#include <unordered_map>
 #include "renderer.h"
 #include "window.h"
 
@@ -16,44 +16,175 @@ class SdlRenderer final : public IRenderer {
         void begin_frame() override;
         void end_frame() override;
 
-        void draw_rect(int x,int y,int w,int h, ColorRGBA c) override;
-        void draw_line(int x1,int y1,int x2,int y2, ColorRGBA c, int thickness) override;
-        void draw_circle(int x, int y, int radius, ColorRGBA c) override;
-        void draw_poly(const std::pair<int,int>* points, size_t count, ColorRGBA c) override;
+        void set_viewport(const Viewport& vp) override { vp_ = vp; }
+        Viewport viewport() const override { return vp_; }
 
-        void set_clip_rect(int x,int y,int w,int h) override;
+        void draw_rect(float x, float y, float w, float h, ColorRGBA c) override;
+        void draw_line(float x1, float y1, float x2, float y2, ColorRGBA c, int thickness) override;
+        void draw_circle(float x, float y, float radius, ColorRGBA c) override;
+        void draw_poly(const float* xy, size_t count, ColorRGBA c, bool filled) override;
+
+        void draw_rects(const float* xywh, size_t count, const ColorRGBA* colors, size_t color_count) override;
+        void draw_lines(const float* segments, size_t count, const ColorRGBA* colors, size_t color_count) override;
+        void draw_points(const float* xy, size_t count, const ColorRGBA* colors, size_t color_count) override;
+
+        void set_clip_rect(float x, float y, float w, float h) override;
         void clear_clip_rect() override;
 
         std::pair<int,int> drawable_size() const override;
 
+        void submit(const uint8_t* data, size_t size, ITextRenderer* text) override;
+
         TextureHandle create_texture_rgba(int w, int h, const void* pixels, int pitch) override;
         void draw_texture(
             TextureHandle tex,
-            int x,
-            int y,
-            int w,
-            int h,
-            double angle_deg = 0.0
+            float x,
+            float y,
+            float w,
+            float h,
+            double angle_deg = 0.0,
+            ColorRGBA tint = ColorRGBA{255,255,255,255}
+        ) override;
+        void draw_texture_region(
+            TextureHandle tex,
+            float sx, float sy, float sw, float sh,
+            float x, float y, float w, float h,
+            double angle_deg = 0.0,
+            ColorRGBA tint = ColorRGBA{255,255,255,255}
+        ) override;
+        void draw_texture_instances(
+            TextureHandle tex,
+            const float* src,
+            const float* xywha,
+            size_t count,
+            const ColorRGBA* colors,
+            size_t color_count
         ) override;
         void destroy_texture(TextureHandle tex) override;
-        void draw_texture_tiled_y(TextureHandle tex, int x, int y, int w, int h) override;
+
+        TextureHandle create_texture_streaming(int w, int h) override;
+        void set_texture_filter(TextureHandle tex, bool linear) override;
+        bool update_texture(TextureHandle tex, const TextureRect* rect, const void* pixels, int pitch) override;
+        bool lock_texture(TextureHandle tex, const TextureRect* rect, void** pixels, int* pitch) override;
+        void unlock_texture(TextureHandle tex) override;
+        std::pair<int,int> texture_size(TextureHandle tex) const override;
+
+        TextureHandle create_render_target(int w, int h) override;
+        bool set_render_target(TextureHandle tex) override;
+        TextureHandle render_target() const override { return target_; }
+        void clear(ColorRGBA c) override;
+
+        void set_texture_budget(uint64_t bytes) override;
+        void set_texture_evictable(TextureHandle tex, bool evictable) override;
+        TextureStats texture_stats() const override;
+        std::vector<TextureHandle> take_evicted_textures() override;
+        void draw_texture_tiled_y(TextureHandle tex, float x, float y, float w, float h) override;
 
         bool read_pixels_argb8888(void* dst, int pitch, int w, int h) override;
-        
+        bool read_pixels(const TextureRect* rect, PixelFormat format, void* dst, int pitch) override;
+
+        RenderStats stats() const override { return stats_; }
+        void reset_stats() override { stats_ = RenderStats{}; }
 
         SDL_Renderer* sdl() const { return renderer_; }
 
     private:
+        struct TextureEntry {
+            SDL_Texture* tex = nullptr;
+            int w = 0;
+            int h = 0;
+            ColorRGBA mod{255,255,255,255}; // last color/alpha mod sent to SDL
+            uint32_t generation = 1;        // bumped each time the slot is freed
+            uint64_t bytes = 0;
+            bool evictable = false;
+            uint64_t last_used = 0;         // frame the texture was last drawn
+        };
+
+        // Handles pack the slot index + 1 (so 0 stays invalid) in the low
+        // bits and the slot generation above it, so a stale handle never
+        // reaches a newer texture in the same slot. Generations stay below
+        // 2^11 to keep handles positive Python ints.
+        static constexpr uint32_t kSlotBits = 20;
+        static constexpr uint32_t kSlotMask = (1u << kSlotBits) - 1;
+        static constexpr uint32_t kMaxGeneration = 0x7FF;
+
+        TextureEntry* find_texture(TextureHandle tex);
+        const TextureEntry* find_texture(TextureHandle tex) const;
+        TextureHandle handle_of(size_t slot) const;
+        void release_texture(size_t slot);
+        void enforce_texture_budget();
+
         void flush_destroyed_textures();
 
+        // Viewport mapping. map_rect rounds to whole pixels, like the
+        // integer SDL calls it feeds.
+        float map_x(float x) const { return vp_.ox + x * vp_.scale; }
+        float map_y(float y) const { return vp_.oy + y * vp_.scale; }
+        SDL_Rect map_rect(float x, float y, float w, float h) const;
+        // Map `count` rows laid out as `layout` ('x', 'y' positions, 's'
+        // sizes). Returns `src` itself when the viewport is the identity.
+        const float* map_rows(const float* src, size_t count, const char* layout);
+        TextureHandle create_texture(int w, int h, int access, const void* pixels, int pitch);
+        // Look up a live texture and flush queued sprites that still read it,
+        // so they render with the contents they were drawn with.
+        TextureEntry* texture_for_write(TextureHandle tex);
+
+        // Redundant-state filter: only forward values that differ from the
+        // last ones sent to SDL.
+        void set_blend_mode(SDL_BlendMode mode);
+        void set_draw_color(ColorRGBA c);
+        void set_clip(const SDL_Rect* rect);
+        void set_texture_mod(TextureEntry& entry, ColorRGBA mod);
+        void use_texture(SDL_Texture* tex);
+
+        // Sprite batch: textured quads from one texture, submitted as a
+        // single SDL_RenderGeometry call when anything else is drawn.
+        // Make `entry` the batch texture; returns false if it has no texels.
+        bool begin_sprites(TextureEntry& entry);
+        void queue_sprite(
+            float u0, float v0, float u1, float v1,
+            float x, float y, float w, float h,
+            double angle_deg, ColorRGBA tint
+        );
+        void flush_sprites();
+
         Window& window_;
         SDL_Renderer* renderer_ = nullptr;
         ColorRGBA clear_{0,0,0,255};
         bool in_frame_ = false;
+        Viewport vp_;
+        TextureHandle target_ = 0;
 
-        TextureHandle next_tex_id_ = 1;
-        std::unordered_map<TextureHandle, SDL_Texture*> textures_;
+        std::vector<TextureEntry> slots_;
+        std::vector<uint32_t> free_slots_;
         std::vector<SDL_Texture*> pending_destroy_;
+        TextureStats texture_stats_;
+        std::vector<TextureHandle> evicted_;
+        std::vector<size_t> evict_order_;
+        uint64_t frame_ = 0;
+
+        bool blend_known_ = false;
+        SDL_BlendMode blend_ = SDL_BLENDMODE_NONE;
+        bool color_known_ = false;
+        ColorRGBA color_{};
+        bool clip_known_ = false;
+        bool clip_enabled_ = false;
+        SDL_Rect clip_{0,0,0,0};
+        SDL_Texture* last_texture_ = nullptr;
+        RenderStats stats_;
+
+        // Scratch buffers for SDL_RenderGeometry, reused across calls.
+        std::vector<SDL_Vertex> geom_vertices_;
+        std::vector<int> geom_indices_;
+        std::vector<int> poly_remaining_;
+        std::vector<SDL_FPoint> poly_outline_;
+        std::vector<float> cmd_floats_;
+        std::string cmd_text_;
+        std::vector<float> mapped_;
+
+        SDL_Texture* sprite_tex_ = nullptr;
+        std::vector<SDL_Vertex> sprite_vertices_;
+        std::vector<int> sprite_indices_;
 };
 
 } // namespace mini
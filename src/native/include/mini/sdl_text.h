@@ -1,34 +1,99 @@
 #pragma once
 #include <SDL_ttf.h>
+#include <list>
+#include <memory>
+#include <mutex>
+#include <unordered_map>
 #include <vector>
+#include "font_file.h"
+#include "glyph_atlas.h"
 #include "text.h"
 #include "renderer.h"
 
 namespace mini {
 
-// Uses SDL_ttf to rasterize to pixels, then uses IRenderer texture API to draw.
+// Uses SDL_ttf to rasterize glyphs into per-font atlases, then draws strings
+// as batched quads through the IRenderer texture API.
+//
+// Fonts are a registry: each file is memory-mapped once and every size is
+// opened from the shared mapping. Loading the same (path, size) again
+// returns the existing id. Loading only maps the file and checks its header;
+// each size's face is opened on first use.
+//
+// rasterize_utf8() may be called from any thread; everything else belongs
+// to the renderer's thread.
 class SdlTextRenderer final : public ITextRenderer {
     public:
         explicit SdlTextRenderer(IRenderer& renderer);
         ~SdlTextRenderer() override;
 
         int load_font(const std::string& path, int pt) override;
+        int load_sdf_font(const std::string& path, int pt) override;
         std::pair<int,int> measure_utf8(const std::string& text, int font_id) override;
+        void prewarm_utf8(const std::string& text, int font_id) override;
+        void rasterize_utf8(const std::string& text, int font_id) override;
+        void upload_rasterized() override;
 
         void draw_utf8(
             const std::string& text,
-            int x, int y,
+            float x, float y,
+            int r, int g, int b, int a,
+            int font_id
+        ) override;
+
+        const TextLayout& layout_utf8(
+            const std::string& text, int max_width, TextAlign align, int font_id
+        ) override;
+        void draw_layout_utf8(
+            const std::string& text,
+            float x, float y,
+            int max_width, TextAlign align,
             int r, int g, int b, int a,
             int font_id
         ) override;
 
         int default_font_id() const { return default_font_id_; }
         void set_default_font(int id) { default_font_id_ = id; }
+        // Font used for font_id < 0, registered the first time it's needed.
+        void set_default_font_path(const std::string& path, int pt);
 
     private:
+        struct FontEntry {
+            int id = 0;
+            std::shared_ptr<MappedFile> file;
+            int pt = 0;
+            bool sdf = false;
+            TTF_Font* font = nullptr; // opened on first use
+            std::unique_ptr<GlyphAtlas> atlas;
+        };
+
+        // Opens the font if needed; nullptr for unknown ids.
+        FontEntry* font_entry(int font_id);
+        int register_font(const std::string& path, int pt, bool sdf);
+
         IRenderer& renderer_;
-        std::vector<TTF_Font*> fonts_;
+        // Entries never move, so workers can use them after the lookup.
+        std::vector<std::unique_ptr<FontEntry>> fonts_;
+        // Guards fonts_ and lazy opening against rasterize_utf8() lookups.
+        std::mutex fonts_mutex_;
         int default_font_id_ = -1;
+        std::string default_path_;
+        int default_pt_ = 0;
+        std::once_flag default_once_;
+        // Serializes register_font(), which the default font can reach
+        // from any thread.
+        std::mutex registry_mutex_;
+        // Mappings by canonical path, and font ids by "sdf:size:path".
+        std::unordered_map<std::string, std::shared_ptr<MappedFile>> files_;
+        std::unordered_map<std::string, int> font_ids_;
+
+        // LRU of layouts keyed on (font, max width, align, text).
+        static constexpr size_t kMaxLayouts = 256;
+        using LayoutLru = std::list<std::pair<std::string, TextLayout>>;
+        LayoutLru layouts_;
+        std::unordered_map<std::string, LayoutLru::iterator> layout_index_;
+        std::string layout_key_;
+        TextLayout empty_layout_;
 };
 
 } // namespace mini
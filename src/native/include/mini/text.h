@@ -1,18 +1,66 @@
 #pragma once
+#include <cstdint>
 #include <string>
 #include <utility>
+#include <vector>
 
 namespace mini {
 
+enum class TextAlign : uint32_t {
+    Left = 0,
+    Center = 1,
+    Right = 2,
+};
+
+// One laid-out line. Ranges are code point indices into the source text
+// (bytes_* are the matching UTF-8 byte offsets); positions are pixels
+// relative to the block's top-left (virtual units for SDF fonts).
+struct TextLine {
+    uint32_t start = 0, end = 0;
+    uint32_t bytes_start = 0, bytes_end = 0;
+    int x = 0, y = 0;
+    int width = 0;
+};
+
+struct TextLayout {
+    std::vector<TextLine> lines;
+    int width = 0;  // widest line
+    int height = 0; // lines * line skip
+};
+
 class ITextRenderer {
 public:
     virtual ~ITextRenderer() = default;
 
     virtual int load_font(const std::string& path, int pt) = 0;
+    // Signed distance field font: sized in virtual units and drawn crisply
+    // at any viewport scale from one atlas. Its measurements and layouts are
+    // virtual units too.
+    virtual int load_sdf_font(const std::string& path, int pt) = 0;
     virtual std::pair<int,int> measure_utf8(const std::string& text, int font_id) = 0;
+    // Rasterize the glyphs of `text` now rather than on first draw.
+    virtual void prewarm_utf8(const std::string& text, int font_id) = 0;
+    // Render the glyphs of `text` without touching the renderer, so it can
+    // run on a worker thread; upload_rasterized() then places them.
+    virtual void rasterize_utf8(const std::string& text, int font_id) = 0;
+    virtual void upload_rasterized() = 0;
     virtual void draw_utf8(
         const std::string& text,
-        int x, int y,
+        float x, float y,
+        int r, int g, int b, int a,
+        int font_id
+    ) = 0;
+
+    // Break text at '\n' and, when max_width > 0, wrap it at spaces (or
+    // anywhere for words wider than max_width). Results are cached, and the
+    // reference stays valid until the next layout call.
+    virtual const TextLayout& layout_utf8(
+        const std::string& text, int max_width, TextAlign align, int font_id
+    ) = 0;
+    virtual void draw_layout_utf8(
+        const std::string& text,
+        float x, float y,
+        int max_width, TextAlign align,
         int r, int g, int b, int a,
         int font_id
     ) = 0;
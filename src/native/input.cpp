@@ -1,113 +1,259 @@
 #include "mini/input.h"
 #include <SDL.h>
 #include <cmath>
+#include <cstring>
 
 namespace mini {
 
-    static void scale_mouse(
-        Window& window,
-        IRenderer& renderer,
-        int& x, int& y, int& dx, int& dy
-    ) {
+    namespace {
+
+        // SDL event type behind each EventType, for SDL_EventState. Quit,
+        // window and unknown events stay queued and are dropped after
+        // translation; window events also keep the mouse scale current.
+        int sdl_types_for(EventType type, uint32_t out[2]) {
+            switch (type) {
+                case EventType::KeyDown: out[0] = SDL_KEYDOWN; return 1;
+                case EventType::KeyUp: out[0] = SDL_KEYUP; return 1;
+                case EventType::MouseMotion: out[0] = SDL_MOUSEMOTION; return 1;
+                case EventType::MouseButtonDown: out[0] = SDL_MOUSEBUTTONDOWN; return 1;
+                case EventType::MouseButtonUp: out[0] = SDL_MOUSEBUTTONUP; return 1;
+                case EventType::MouseWheel: out[0] = SDL_MOUSEWHEEL; return 1;
+                case EventType::TextInput: out[0] = SDL_TEXTINPUT; return 1;
+                default: return 0;
+            }
+        }
+
+        uint32_t type_bit(EventType type) {
+            return 1u << static_cast<uint32_t>(type);
+        }
+
+    } // namespace
+
+    void Input::set_event_enabled(EventType type, bool enabled) {
+        if (enabled) enabled_ |= type_bit(type);
+        else enabled_ &= ~type_bit(type);
+
+        uint32_t sdl_types[2];
+        const int n = sdl_types_for(type, sdl_types);
+        for (int i = 0; i < n; ++i) {
+            SDL_EventState(sdl_types[i], enabled ? SDL_ENABLE : SDL_IGNORE);
+        }
+    }
+
+    bool Input::event_enabled(EventType type) const {
+        return (enabled_ & type_bit(type)) != 0;
+    }
+
+    void Input::update_scale(Window& window, IRenderer& renderer) {
+        if (scale_valid_) return;
         auto [ww, wh] = window.size();
         auto [rw, rh] = renderer.drawable_size();
+        scale_x_ = ww > 0 ? (float)rw / (float)ww : 1.0f;
+        scale_y_ = wh > 0 ? (float)rh / (float)wh : 1.0f;
+        scale_valid_ = true;
+    }
 
-        if (ww > 0 && wh > 0) {
-            float sx = (float)rw / (float)ww;
-            float sy = (float)rh / (float)wh;
-            x  = (int)lroundf(x  * sx);
-            y  = (int)lroundf(y  * sy);
-            dx = (int)lroundf(dx * sx);
-            dy = (int)lroundf(dy * sy);
-        }
+    void Input::scale_mouse(Window& window, IRenderer& renderer, PackedEvent& ev) {
+        update_scale(window, renderer);
+        if (scale_x_ == 1.0f && scale_y_ == 1.0f) return;
+
+        ev.x  = (int)lroundf(ev.x  * scale_x_);
+        ev.y  = (int)lroundf(ev.y  * scale_y_);
+        ev.dx = (int)lroundf(ev.dx * scale_x_);
+        ev.dy = (int)lroundf(ev.dy * scale_y_);
     }
 
-    std::vector<Event> Input::poll(Window& window, IRenderer& renderer) {
-        std::vector<Event> events;
-        SDL_Event e;
+    // Fill `ev` from an SDL event; `text` points at the event's UTF-8 text
+    // (if any). Returns false for events that are dropped.
+    bool Input::translate(
+        const SDL_Event& e,
+        Window& window,
+        IRenderer& renderer,
+        PackedEvent& ev,
+        const char*& text
+    ) {
+        ev = PackedEvent{};
+        text = nullptr;
 
-        while (SDL_PollEvent(&e)) {
-            Event ev;
+        switch (e.type) {
+            case SDL_QUIT:
+                ev.type = (int32_t)EventType::Quit;
+                break;
+
+            case SDL_KEYDOWN:
+                ev.type = (int32_t)EventType::KeyDown;
+                ev.key = e.key.keysym.sym;
+                ev.scancode = (int)e.key.keysym.scancode;
+                ev.mod = (int)e.key.keysym.mod;
+                ev.repeat = (int)e.key.repeat;
+                break;
+
+            case SDL_KEYUP:
+                ev.type = (int32_t)EventType::KeyUp;
+                ev.key = e.key.keysym.sym;
+                ev.scancode = (int)e.key.keysym.scancode;
+                ev.mod = (int)e.key.keysym.mod;
+                ev.repeat = 0;
+                break;
+
+            case SDL_MOUSEMOTION:
+                ev.type = (int32_t)EventType::MouseMotion;
+                ev.x = e.motion.x;
+                ev.y = e.motion.y;
+                ev.dx = e.motion.xrel;
+                ev.dy = e.motion.yrel;
+                scale_mouse(window, renderer, ev);
+                break;
 
-            switch (e.type) {
-                case SDL_QUIT:
-                    ev.type = EventType::Quit;
-                    break;
-
-                case SDL_KEYDOWN:
-                    ev.type = EventType::KeyDown;
-                    ev.key = e.key.keysym.sym;
-                    ev.scancode = (int)e.key.keysym.scancode;
-                    ev.mod = (int)e.key.keysym.mod;
-                    ev.repeat = (int)e.key.repeat;
-                    break;
-
-                case SDL_KEYUP:
-                    ev.type = EventType::KeyUp;
-                    ev.key = e.key.keysym.sym;
-                    ev.scancode = (int)e.key.keysym.scancode;
-                    ev.mod = (int)e.key.keysym.mod;
-                    ev.repeat = 0;
-                    break;
-
-                case SDL_MOUSEMOTION:
-                    ev.type = EventType::MouseMotion;
-                    ev.x = e.motion.x;
-                    ev.y = e.motion.y;
-                    ev.dx = e.motion.xrel;
-                    ev.dy = e.motion.yrel;
-                    scale_mouse(window, renderer, ev.x, ev.y, ev.dx, ev.dy);
-                    break;
-
-                case SDL_MOUSEBUTTONDOWN:
-                    ev.type = EventType::MouseButtonDown;
-                    ev.button = (int)e.button.button;
-                    ev.x = e.button.x;
-                    ev.y = e.button.y;
-                    // scale x/y consistently (important for HiDPI)
-                    scale_mouse(window, renderer, ev.x, ev.y, ev.dx, ev.dy);
-                    break;
-
-                case SDL_MOUSEBUTTONUP:
-                    ev.type = EventType::MouseButtonUp;
-                    ev.button = (int)e.button.button;
-                    ev.x = e.button.x;
-                    ev.y = e.button.y;
-                    scale_mouse(window, renderer, ev.x, ev.y, ev.dx, ev.dy);
-                    break;
-
-                case SDL_MOUSEWHEEL:
-                    ev.type = EventType::MouseWheel;
-                    ev.wheel_x = e.wheel.x;
-                    ev.wheel_y = e.wheel.y;
-                    break;
-
-                case SDL_TEXTINPUT:
-                    ev.type = EventType::TextInput;
-                    ev.text = e.text.text;
-                    break;
-
-                case SDL_WINDOWEVENT:
-                    if (e.window.event == SDL_WINDOWEVENT_RESIZED ||
-                        e.window.event == SDL_WINDOWEVENT_SIZE_CHANGED) {
-                    ev.type = EventType::WindowResized;
+            case SDL_MOUSEBUTTONDOWN:
+            case SDL_MOUSEBUTTONUP:
+                ev.type = (int32_t)(e.type == SDL_MOUSEBUTTONDOWN
+                    ? EventType::MouseButtonDown
+                    : EventType::MouseButtonUp);
+                ev.button = (int)e.button.button;
+                ev.x = e.button.x;
+                ev.y = e.button.y;
+                // scale x/y consistently (important for HiDPI)
+                scale_mouse(window, renderer, ev);
+                break;
+
+            case SDL_MOUSEWHEEL:
+                ev.type = (int32_t)EventType::MouseWheel;
+                ev.wheel_x = e.wheel.x;
+                ev.wheel_y = e.wheel.y;
+                break;
+
+            case SDL_TEXTINPUT:
+                ev.type = (int32_t)EventType::TextInput;
+                text = e.text.text;
+                break;
+
+            case SDL_WINDOWEVENT:
+                if (e.window.event == SDL_WINDOWEVENT_DISPLAY_CHANGED) {
+                    // Moving to another display can change the DPI.
+                    scale_valid_ = false;
+                    return false;
+                }
+                if (e.window.event != SDL_WINDOWEVENT_RESIZED &&
+                    e.window.event != SDL_WINDOWEVENT_SIZE_CHANGED) {
+                    return false;
+                }
+                scale_valid_ = false;
+                {
+                    ev.type = (int32_t)EventType::WindowResized;
                     auto [rw, rh] = renderer.drawable_size();
                     ev.width = rw;
                     ev.height = rh;
-            } else {
-                continue;
-            }
-            break;
+                }
+                break;
 
             default:
-                ev.type = EventType::Unknown;
+                ev.type = (int32_t)EventType::Unknown;
                 break;
+        }
+        return (enabled_ & (1u << (uint32_t)ev.type)) != 0;
+    }
+
+    bool Input::merge_motion(PackedEvent& last, const PackedEvent& ev) const {
+        const auto motion = (int32_t)EventType::MouseMotion;
+        if (!coalesce_motion_ || ev.type != motion || last.type != motion) return false;
+        last.x = ev.x;
+        last.y = ev.y;
+        last.dx += ev.dx;
+        last.dy += ev.dy;
+        return true;
+    }
+
+    const uint8_t* Input::keyboard_state(int& count) const {
+        return SDL_GetKeyboardState(&count);
+    }
+
+    MouseState Input::mouse_state(Window& window, IRenderer& renderer) {
+        MouseState out;
+        out.buttons = SDL_GetMouseState(&out.x, &out.y);
+        update_scale(window, renderer);
+        out.x = (int)lroundf(out.x * scale_x_);
+        out.y = (int)lroundf(out.y * scale_y_);
+        return out;
+    }
+
+    std::vector<Event> Input::poll(Window& window, IRenderer& renderer) {
+        std::vector<Event> events;
+        SDL_Event e;
+        PackedEvent p;
+        PackedEvent last;
+        const char* text = nullptr;
+
+        while (SDL_PollEvent(&e)) {
+            if (!translate(e, window, renderer, p, text)) continue;
+            if (!events.empty() && merge_motion(last, p)) {
+                Event& prev = events.back();
+                prev.x = last.x;
+                prev.y = last.y;
+                prev.dx = last.dx;
+                prev.dy = last.dy;
+                continue;
             }
+            last = p;
 
+            Event ev;
+            ev.type = (EventType)p.type;
+            ev.key = p.key;
+            ev.scancode = p.scancode;
+            ev.mod = p.mod;
+            ev.repeat = p.repeat;
+            ev.x = p.x;
+            ev.y = p.y;
+            ev.dx = p.dx;
+            ev.dy = p.dy;
+            ev.button = p.button;
+            ev.wheel_x = p.wheel_x;
+            ev.wheel_y = p.wheel_y;
+            ev.width = p.width;
+            ev.height = p.height;
+            if (text) ev.text = text;
             events.push_back(std::move(ev));
         }
 
         return events;
     }
 
+    PackedPoll Input::poll_into(
+        Window& window, IRenderer& renderer,
+        PackedEvent* records, size_t capacity,
+        char* text, size_t text_capacity
+    ) {
+        // Only pump SDL once the previous batch has been handed out.
+        if (staged_.empty()) {
+            SDL_Event e;
+            PackedEvent p;
+            const char* t = nullptr;
+            while (SDL_PollEvent(&e)) {
+                if (!translate(e, window, renderer, p, t)) continue;
+                if (!staged_.empty() && merge_motion(staged_.back(), p)) continue;
+                if (t) {
+                    p.text_offset = (uint32_t)staged_text_.size();
+                    p.text_length = (uint32_t)std::strlen(t);
+                    staged_text_.append(t, p.text_length);
+                }
+                staged_.push_back(p);
+            }
+        }
+
+        PackedPoll out;
+        out.count = staged_.size();
+        out.text_bytes = staged_text_.size();
+        if (out.count > capacity || out.text_bytes > text_capacity) {
+            out.fits = false;
+            return out;
+        }
+
+        if (out.count) std::memcpy(records, staged_.data(), out.count * sizeof(PackedEvent));
+        if (out.text_bytes) std::memcpy(text, staged_text_.data(), out.text_bytes);
+        // clear() keeps the capacity, so steady-state polling doesn't allocate.
+        staged_.clear();
+        staged_text_.clear();
+        return out;
+    }
+
 } // namespace mini
@@ -1,8 +1,11 @@
 #include "mini/sdl_renderer.h"
+#include "mini/draw_commands.h"
+#include "mini/text.h"
 #include <stdexcept>
 #include <string>
 #include <cmath>
 #include <algorithm>
+#include <cstring>
 #include <vector>
 
 namespace mini {
@@ -13,6 +16,61 @@ namespace mini {
         return static_cast<uint8_t>(v);
     }
 
+    static constexpr double kPi = 3.14159265358979323846;
+
+    static float cross(const float* xy, int a, int b, int c) {
+        const float ax = xy[a * 2], ay = xy[a * 2 + 1];
+        return (xy[b * 2] - ax) * (xy[c * 2 + 1] - ay) - (xy[b * 2 + 1] - ay) * (xy[c * 2] - ax);
+    }
+
+    // Ear-clipping triangulation of a simple polygon into triangle indices.
+    // Self-intersecting leftovers are fanned so something is always drawn.
+    static void triangulate_polygon(
+        const float* xy, size_t count, std::vector<int>& remaining, std::vector<int>& indices
+    ) {
+        indices.clear();
+        remaining.resize(count);
+        for (size_t i = 0; i < count; ++i) remaining[i] = static_cast<int>(i);
+
+        double area2 = 0.0;
+        for (size_t i = 0, j = count - 1; i < count; j = i++) {
+            area2 += static_cast<double>(xy[j * 2]) * xy[i * 2 + 1] - static_cast<double>(xy[i * 2]) * xy[j * 2 + 1];
+        }
+        const float orient = area2 >= 0.0 ? 1.0f : -1.0f;
+
+        while (remaining.size() > 3) {
+            const size_t m = remaining.size();
+            bool clipped = false;
+            for (size_t i = 0; i < m; ++i) {
+                const int prev = remaining[(i + m - 1) % m];
+                const int cur = remaining[i];
+                const int next = remaining[(i + 1) % m];
+                if (orient * cross(xy, prev, cur, next) <= 0.0f) continue; // reflex or flat
+
+                bool contains_other = false;
+                for (size_t k = 0; k < m && !contains_other; ++k) {
+                    const int p = remaining[k];
+                    if (p == prev || p == cur || p == next) continue;
+                    contains_other =
+                        orient * cross(xy, prev, cur, p) >= 0.0f &&
+                        orient * cross(xy, cur, next, p) >= 0.0f &&
+                        orient * cross(xy, next, prev, p) >= 0.0f;
+                }
+                if (contains_other) continue;
+
+                indices.insert(indices.end(), { prev, cur, next });
+                remaining.erase(remaining.begin() + static_cast<std::ptrdiff_t>(i));
+                clipped = true;
+                break;
+            }
+            if (!clipped) break;
+        }
+
+        for (size_t i = 1; i + 1 < remaining.size(); ++i) {
+            indices.insert(indices.end(), { remaining[0], remaining[i], remaining[i + 1] });
+        }
+    }
+
     SdlRenderer::SdlRenderer(Window& window)
         : window_(window)
         {
@@ -20,16 +78,17 @@ namespace mini {
             if (!renderer_) {
                 throw std::runtime_error(std::string("SDL_CreateRenderer Error: ") + SDL_GetError());
             }
-            SDL_SetRenderDrawBlendMode(renderer_, SDL_BLENDMODE_BLEND);
+            set_blend_mode(SDL_BLENDMODE_BLEND);
         }
 
     SdlRenderer::~SdlRenderer() {
         flush_destroyed_textures();
     // destroy textures first
-        for (auto& kv : textures_) {
-            if (kv.second) SDL_DestroyTexture(kv.second);
+        for (auto& entry : slots_) {
+            if (entry.tex) SDL_DestroyTexture(entry.tex);
         }
-        textures_.clear();
+        slots_.clear();
+        free_slots_.clear();
 
         if (renderer_) {
             SDL_DestroyRenderer(renderer_);
@@ -48,29 +107,142 @@ namespace mini {
         pending_destroy_.clear();
     }
 
+    void SdlRenderer::set_blend_mode(SDL_BlendMode mode) {
+        if (blend_known_ && blend_ == mode) {
+            ++stats_.state_skipped;
+            return;
+        }
+        SDL_SetRenderDrawBlendMode(renderer_, mode);
+        blend_ = mode;
+        blend_known_ = true;
+        ++stats_.state_changes;
+    }
+
+    void SdlRenderer::set_draw_color(ColorRGBA c) {
+        if (color_known_ && color_.r == c.r && color_.g == c.g && color_.b == c.b && color_.a == c.a) {
+            ++stats_.state_skipped;
+            return;
+        }
+        SDL_SetRenderDrawColor(renderer_, c.r, c.g, c.b, c.a);
+        color_ = c;
+        color_known_ = true;
+        ++stats_.state_changes;
+    }
+
+    void SdlRenderer::set_clip(const SDL_Rect* rect) {
+        const bool enabled = rect != nullptr;
+        if (clip_known_ && clip_enabled_ == enabled &&
+            (!enabled || (clip_.x == rect->x && clip_.y == rect->y &&
+                          clip_.w == rect->w && clip_.h == rect->h))) {
+            ++stats_.state_skipped;
+            return;
+        }
+        SDL_RenderSetClipRect(renderer_, rect);
+        clip_enabled_ = enabled;
+        if (enabled) clip_ = *rect;
+        clip_known_ = true;
+        ++stats_.state_changes;
+    }
+
+    void SdlRenderer::set_texture_mod(TextureEntry& entry, ColorRGBA mod) {
+        const ColorRGBA cur = entry.mod;
+        if (cur.r != mod.r || cur.g != mod.g || cur.b != mod.b) {
+            SDL_SetTextureColorMod(entry.tex, mod.r, mod.g, mod.b);
+            ++stats_.state_changes;
+        } else {
+            ++stats_.state_skipped;
+        }
+        if (cur.a != mod.a) {
+            SDL_SetTextureAlphaMod(entry.tex, mod.a);
+            ++stats_.state_changes;
+        } else {
+            ++stats_.state_skipped;
+        }
+        entry.mod = mod;
+    }
+
+    void SdlRenderer::use_texture(SDL_Texture* tex) {
+        if (tex != last_texture_) {
+            ++stats_.texture_switches;
+            last_texture_ = tex;
+        }
+    }
+
+    void SdlRenderer::flush_sprites() {
+        if (!sprite_indices_.empty()) {
+            SDL_RenderGeometry(
+                renderer_, sprite_tex_,
+                sprite_vertices_.data(), static_cast<int>(sprite_vertices_.size()),
+                sprite_indices_.data(), static_cast<int>(sprite_indices_.size())
+            );
+            sprite_vertices_.clear();
+            sprite_indices_.clear();
+        }
+        sprite_tex_ = nullptr;
+    }
+
+    SDL_Rect SdlRenderer::map_rect(float x, float y, float w, float h) const {
+        return SDL_Rect{
+            static_cast<int>(std::lround(map_x(x))),
+            static_cast<int>(std::lround(map_y(y))),
+            static_cast<int>(std::lround(w * vp_.scale)),
+            static_cast<int>(std::lround(h * vp_.scale))
+        };
+    }
+
+    const float* SdlRenderer::map_rows(const float* src, size_t count, const char* layout) {
+        if (vp_.ox == 0.0f && vp_.oy == 0.0f && vp_.scale == 1.0f) return src;
+
+        const size_t cols = std::strlen(layout);
+        mapped_.resize(count * cols);
+        for (size_t i = 0; i < count * cols; ++i) {
+            switch (layout[i % cols]) {
+                case 'x': mapped_[i] = map_x(src[i]); break;
+                case 'y': mapped_[i] = map_y(src[i]); break;
+                default:  mapped_[i] = src[i] * vp_.scale; break;
+            }
+        }
+        return mapped_.data();
+    }
+
     void SdlRenderer::begin_frame() {
+        flush_sprites();
+        if (target_ != 0) set_render_target(0);
         flush_destroyed_textures();
+        ++frame_;
         in_frame_ = true;
-        SDL_SetRenderDrawColor(renderer_, clear_.r, clear_.g, clear_.b, clear_.a);
+        clear(clear_);
+    }
+
+    void SdlRenderer::clear(ColorRGBA c) {
+        flush_sprites();
+        set_draw_color(c);
         SDL_RenderClear(renderer_);
     }
 
     void SdlRenderer::end_frame() {
+        flush_sprites();
         SDL_RenderPresent(renderer_);
         in_frame_ = false;
         flush_destroyed_textures();
     }
 
-    void SdlRenderer::draw_rect(int x,int y,int w,int h, ColorRGBA c) {
-        SDL_Rect r{ x,y,w,h };
-        SDL_SetRenderDrawBlendMode(renderer_, SDL_BLENDMODE_BLEND);
-        SDL_SetRenderDrawColor(renderer_, c.r, c.g, c.b, c.a);
+    void SdlRenderer::draw_rect(float x, float y, float w, float h, ColorRGBA c) {
+        flush_sprites();
+        const SDL_Rect r = map_rect(x, y, w, h);
+        set_blend_mode(SDL_BLENDMODE_BLEND);
+        set_draw_color(c);
         SDL_RenderFillRect(renderer_, &r);
     }
 
-    void SdlRenderer::draw_line(int x1,int y1,int x2,int y2, ColorRGBA c, int thickness) {
-        SDL_SetRenderDrawBlendMode(renderer_, SDL_BLENDMODE_BLEND);
-        SDL_SetRenderDrawColor(renderer_, c.r, c.g, c.b, c.a);
+    void SdlRenderer::draw_line(float vx1, float vy1, float vx2, float vy2, ColorRGBA c, int thickness) {
+        flush_sprites();
+        const int x1 = static_cast<int>(std::lround(map_x(vx1)));
+        const int y1 = static_cast<int>(std::lround(map_y(vy1)));
+        const int x2 = static_cast<int>(std::lround(map_x(vx2)));
+        const int y2 = static_cast<int>(std::lround(map_y(vy2)));
+        set_blend_mode(SDL_BLENDMODE_BLEND);
+        set_draw_color(c);
         if (thickness <= 1) {
             SDL_RenderDrawLine(renderer_, x1, y1, x2, y2);
         } else {
@@ -90,70 +262,167 @@ namespace mini {
         }
     }
 
-    void SdlRenderer::draw_circle(int cx, int cy, int radius, ColorRGBA c) {
-        SDL_SetRenderDrawBlendMode(renderer_, SDL_BLENDMODE_BLEND);
-        SDL_SetRenderDrawColor(renderer_, c.r, c.g, c.b, c.a);
-
-        if (radius <= 0) return;
-
-        // Filled circle: horizontal scanlines
-        const int r2 = radius * radius;
-        for (int dy = -radius; dy <= radius; ++dy) {
-            int yy = cy + dy;
-            int dx = static_cast<int>(std::sqrt(static_cast<double>(r2 - dy * dy)));
-            SDL_RenderDrawLine(renderer_, cx - dx, yy, cx + dx, yy);
+    void SdlRenderer::draw_circle(float cx, float cy, float radius, ColorRGBA c) {
+        if (radius <= 0.0f) return;
+        flush_sprites();
+        set_blend_mode(SDL_BLENDMODE_BLEND);
+
+        // Filled circle: one triangle fan, with enough rim segments to keep
+        // the chord error under half a pixel.
+        const double r = std::max(1.0, std::round(static_cast<double>(radius) * vp_.scale));
+        int segments = static_cast<int>(std::ceil(kPi / std::acos(1.0 - 0.5 / std::max(r, 1.0))));
+        segments = std::clamp(segments, 8, 512);
+
+        const SDL_Color sc{ c.r, c.g, c.b, c.a };
+        const float fx = std::round(map_x(cx));
+        const float fy = std::round(map_y(cy));
+        geom_vertices_.resize(static_cast<size_t>(segments) + 1);
+        geom_indices_.resize(static_cast<size_t>(segments) * 3);
+        geom_vertices_[0] = SDL_Vertex{ SDL_FPoint{ fx, fy }, sc, SDL_FPoint{ 0, 0 } };
+        for (int i = 0; i < segments; ++i) {
+            const double a = 2.0 * kPi * i / segments;
+            geom_vertices_[i + 1] = SDL_Vertex{
+                SDL_FPoint{ fx + static_cast<float>(r * std::cos(a)), fy + static_cast<float>(r * std::sin(a)) },
+                sc,
+                SDL_FPoint{ 0, 0 }
+            };
+            int* idx = &geom_indices_[static_cast<size_t>(i) * 3];
+            idx[0] = 0;
+            idx[1] = i + 1;
+            idx[2] = (i + 1) % segments + 1;
         }
+        SDL_RenderGeometry(
+            renderer_, nullptr,
+            geom_vertices_.data(), static_cast<int>(geom_vertices_.size()),
+            geom_indices_.data(), static_cast<int>(geom_indices_.size())
+        );
     }
 
-    void SdlRenderer::draw_poly(const std::pair<int,int>* points, size_t count, ColorRGBA c) {
+    void SdlRenderer::draw_poly(const float* points, size_t count, ColorRGBA c, bool filled) {
         if (count < 3) return; // not a polygon
+        flush_sprites();
+        const float* xy = map_rows(points, count, "xy");
+        set_blend_mode(SDL_BLENDMODE_BLEND);
 
-        SDL_SetRenderDrawBlendMode(renderer_, SDL_BLENDMODE_BLEND);
-        SDL_SetRenderDrawColor(renderer_, c.r, c.g, c.b, c.a);
-
-        // Simple filled polygon using SDL_RenderDrawLine for horizontal scanlines
-        // This is a basic implementation and may not be the most efficient for complex polygons.
-        // For production code, consider implementing a more robust polygon filling algorithm.
+        if (!filled) {
+            // Closed outline in a single call.
+            poly_outline_.resize(count + 1);
+            for (size_t i = 0; i < count; ++i) {
+                poly_outline_[i] = SDL_FPoint{ xy[i * 2], xy[i * 2 + 1] };
+            }
+            poly_outline_[count] = poly_outline_[0];
+            set_draw_color(c);
+            SDL_RenderDrawLinesF(renderer_, poly_outline_.data(), static_cast<int>(poly_outline_.size()));
+            return;
+        }
 
-        // Find vertical bounds
-        int min_y = points[0].second;
-        int max_y = points[0].second;
-        for (size_t i = 1; i < count; ++i) {
-            if (points[i].second < min_y) min_y = points[i].second;
-            if (points[i].second > max_y) max_y = points[i].second;
+        const SDL_Color sc{ c.r, c.g, c.b, c.a };
+        geom_vertices_.resize(count);
+        for (size_t i = 0; i < count; ++i) {
+            geom_vertices_[i] = SDL_Vertex{ SDL_FPoint{ xy[i * 2], xy[i * 2 + 1] }, sc, SDL_FPoint{ 0, 0 } };
         }
+        triangulate_polygon(xy, count, poly_remaining_, geom_indices_);
+        if (geom_indices_.empty()) return;
 
-        // For each scanline, find intersections with polygon edges
-        for (int y = min_y; y <= max_y; ++y) {
-            std::vector<int> intersections;
+        SDL_RenderGeometry(
+            renderer_, nullptr,
+            geom_vertices_.data(), static_cast<int>(geom_vertices_.size()),
+            geom_indices_.data(), static_cast<int>(geom_indices_.size())
+        );
+    }
 
-            for (size_t i = 0; i < count; ++i) {
-                const auto& p1 = points[i];
-                const auto& p2 = points[(i + 1) % count];
+    void SdlRenderer::draw_rects(
+        const float* rects, size_t count, const ColorRGBA* colors, size_t color_count
+    ) {
+        if (count == 0 || color_count == 0) return;
+        flush_sprites();
+        const float* xywh = map_rows(rects, count, "xyss");
+
+        set_blend_mode(SDL_BLENDMODE_BLEND);
+        if (color_count == 1) {
+            set_draw_color(colors[0]);
+            SDL_RenderFillRectsF(
+                renderer_, reinterpret_cast<const SDL_FRect*>(xywh), static_cast<int>(count)
+            );
+            return;
+        }
 
-                if ((p1.second <= y && p2.second > y) || (p2.second <= y && p1.second > y)) {
-                    // Edge intersects with scanline
-                    int x = p1.first + (y - p1.second) * (p2.first - p1.first) / (p2.second - p1.second);
-                    intersections.push_back(x);
-                }
-            }
+        // Per-item colors: two triangles per rect, one geometry submission.
+        geom_vertices_.resize(count * 4);
+        geom_indices_.resize(count * 6);
+        for (size_t i = 0; i < count; ++i) {
+            const float* r = xywh + i * 4;
+            const ColorRGBA c = colors[i];
+            const SDL_Color sc{ c.r, c.g, c.b, c.a };
+            SDL_Vertex* v = &geom_vertices_[i * 4];
+            v[0] = SDL_Vertex{ SDL_FPoint{ r[0],        r[1]        }, sc, SDL_FPoint{ 0, 0 } };
+            v[1] = SDL_Vertex{ SDL_FPoint{ r[0] + r[2], r[1]        }, sc, SDL_FPoint{ 0, 0 } };
+            v[2] = SDL_Vertex{ SDL_FPoint{ r[0] + r[2], r[1] + r[3] }, sc, SDL_FPoint{ 0, 0 } };
+            v[3] = SDL_Vertex{ SDL_FPoint{ r[0],        r[1] + r[3] }, sc, SDL_FPoint{ 0, 0 } };
+
+            const int base = static_cast<int>(i * 4);
+            int* idx = &geom_indices_[i * 6];
+            idx[0] = base;     idx[1] = base + 1; idx[2] = base + 2;
+            idx[3] = base;     idx[4] = base + 2; idx[5] = base + 3;
+        }
+        SDL_RenderGeometry(
+            renderer_, nullptr,
+            geom_vertices_.data(), static_cast<int>(geom_vertices_.size()),
+            geom_indices_.data(), static_cast<int>(geom_indices_.size())
+        );
+    }
 
-            std::sort(intersections.begin(), intersections.end());
+    void SdlRenderer::draw_lines(
+        const float* lines, size_t count, const ColorRGBA* colors, size_t color_count
+    ) {
+        if (count == 0 || color_count == 0) return;
+        flush_sprites();
+        const float* segments = map_rows(lines, count, "xyxy");
+
+        set_blend_mode(SDL_BLENDMODE_BLEND);
+        for (size_t i = 0; i < count; ++i) {
+            set_draw_color((color_count == 1) ? colors[0] : colors[i]);
+            const float* s = segments + i * 4;
+            SDL_RenderDrawLineF(renderer_, s[0], s[1], s[2], s[3]);
+        }
+    }
+
+    void SdlRenderer::draw_points(
+        const float* xy_virtual, size_t count, const ColorRGBA* colors, size_t color_count
+    ) {
+        if (count == 0 || color_count == 0) return;
+        flush_sprites();
+        const float* xy = map_rows(xy_virtual, count, "xy");
+
+        set_blend_mode(SDL_BLENDMODE_BLEND);
+        const auto* points = reinterpret_cast<const SDL_FPoint*>(xy);
+        if (color_count == 1) {
+            set_draw_color(colors[0]);
+            SDL_RenderDrawPointsF(renderer_, points, static_cast<int>(count));
+            return;
+        }
 
-            // Draw horizontal lines between pairs of intersections
-            for (size_t i = 0; i + 1 < intersections.size(); i += 2) {
-                SDL_RenderDrawLine(renderer_, intersections[i], y, intersections[i + 1], y);
+        // Per-item colors: one SDL call per run of identical colors.
+        size_t run_start = 0;
+        for (size_t i = 1; i <= count; ++i) {
+            if (i < count && std::memcmp(&colors[i], &colors[run_start], sizeof(ColorRGBA)) == 0) {
+                continue;
             }
+            set_draw_color(colors[run_start]);
+            SDL_RenderDrawPointsF(renderer_, points + run_start, static_cast<int>(i - run_start));
+            run_start = i;
         }
     }
 
-    void SdlRenderer::set_clip_rect(int x,int y,int w,int h) {
-        SDL_Rect r{ x,y,w,h };
-        SDL_RenderSetClipRect(renderer_, &r);
+    void SdlRenderer::set_clip_rect(float x, float y, float w, float h) {
+        flush_sprites();
+        const SDL_Rect r = map_rect(x, y, w, h);
+        set_clip(&r);
     }
 
     void SdlRenderer::clear_clip_rect() {
-        SDL_RenderSetClipRect(renderer_, nullptr);
+        flush_sprites();
+        set_clip(nullptr);
     }
 
     std::pair<int,int> SdlRenderer::drawable_size() const {
@@ -163,8 +432,104 @@ namespace mini {
         return window_.drawable_size();
     }
 
-    TextureHandle SdlRenderer::create_texture_rgba(int w, int h, const void* pixels, int pitch) {
-        SDL_Texture* tex = SDL_CreateTexture(renderer_, SDL_PIXELFORMAT_RGBA32, SDL_TEXTUREACCESS_STATIC, w, h);
+    void SdlRenderer::submit(const uint8_t* data, size_t size, ITextRenderer* text) {
+        const uint8_t* cursor = data;
+        const uint8_t* end = data + size;
+
+        while (cursor < end) {
+            const auto op = static_cast<DrawOp>(read_command<uint32_t>(cursor, end));
+            switch (op) {
+                case DrawOp::Rect: {
+                    const auto cmd = read_command<RectCmd>(cursor, end);
+                    draw_rect(cmd.x, cmd.y, cmd.w, cmd.h, cmd.color);
+                    break;
+                }
+                case DrawOp::Line: {
+                    const auto cmd = read_command<LineCmd>(cursor, end);
+                    draw_line(cmd.x1, cmd.y1, cmd.x2, cmd.y2, cmd.color, cmd.thickness);
+                    break;
+                }
+                case DrawOp::Texture: {
+                    const auto cmd = read_command<TextureCmd>(cursor, end);
+                    draw_texture(cmd.tex, cmd.x, cmd.y, cmd.w, cmd.h, cmd.angle_deg, cmd.tint);
+                    break;
+                }
+                case DrawOp::TextureRegion: {
+                    const auto cmd = read_command<TextureRegionCmd>(cursor, end);
+                    draw_texture_region(
+                        cmd.tex,
+                        cmd.sx, cmd.sy, cmd.sw, cmd.sh,
+                        cmd.x, cmd.y, cmd.w, cmd.h,
+                        cmd.angle_deg
+                    );
+                    break;
+                }
+                case DrawOp::ClipRect: {
+                    const auto cmd = read_command<ClipRectCmd>(cursor, end);
+                    set_clip_rect(cmd.x, cmd.y, cmd.w, cmd.h);
+                    break;
+                }
+                case DrawOp::Circle: {
+                    const auto cmd = read_command<CircleCmd>(cursor, end);
+                    draw_circle(cmd.x, cmd.y, cmd.radius, cmd.color);
+                    break;
+                }
+                case DrawOp::Poly: {
+                    const auto cmd = read_command<PolyCmd>(cursor, end);
+                    const size_t bytes = static_cast<size_t>(cmd.count) * 2 * sizeof(float);
+                    if (static_cast<size_t>(end - cursor) < bytes) {
+                        throw std::runtime_error("submit: truncated draw command buffer");
+                    }
+                    cmd_floats_.resize(static_cast<size_t>(cmd.count) * 2);
+                    std::memcpy(cmd_floats_.data(), cursor, bytes);
+                    cursor += bytes;
+                    draw_poly(cmd_floats_.data(), cmd.count, cmd.color, cmd.filled != 0);
+                    break;
+                }
+                case DrawOp::Text: {
+                    const auto cmd = read_command<TextCmd>(cursor, end);
+                    if (static_cast<size_t>(end - cursor) < cmd.length) {
+                        throw std::runtime_error("submit: truncated draw command buffer");
+                    }
+                    if (!text) throw std::runtime_error("submit: no text renderer for text op");
+                    cmd_text_.assign(reinterpret_cast<const char*>(cursor), cmd.length);
+                    cursor += cmd.length;
+                    text->draw_utf8(
+                        cmd_text_, cmd.x, cmd.y,
+                        cmd.color.r, cmd.color.g, cmd.color.b, cmd.color.a,
+                        cmd.font_id
+                    );
+                    break;
+                }
+                case DrawOp::TextBlock: {
+                    const auto cmd = read_command<TextBlockCmd>(cursor, end);
+                    if (static_cast<size_t>(end - cursor) < cmd.length) {
+                        throw std::runtime_error("submit: truncated draw command buffer");
+                    }
+                    if (!text) throw std::runtime_error("submit: no text renderer for text op");
+                    cmd_text_.assign(reinterpret_cast<const char*>(cursor), cmd.length);
+                    cursor += cmd.length;
+                    text->draw_layout_utf8(
+                        cmd_text_, cmd.x, cmd.y,
+                        cmd.max_width, static_cast<TextAlign>(cmd.align),
+                        cmd.color.r, cmd.color.g, cmd.color.b, cmd.color.a,
+                        cmd.font_id
+                    );
+                    break;
+                }
+                case DrawOp::ClearClipRect:
+                    clear_clip_rect();
+                    break;
+                default:
+                    throw std::runtime_error(
+                        "submit: unknown draw op " + std::to_string(static_cast<uint32_t>(op))
+                    );
+            }
+        }
+    }
+
+    TextureHandle SdlRenderer::create_texture(int w, int h, int access, const void* pixels, int pitch) {
+        SDL_Texture* tex = SDL_CreateTexture(renderer_, SDL_PIXELFORMAT_RGBA32, access, w, h);
         if (!tex) return 0;
 
         SDL_SetTextureBlendMode(tex, SDL_BLENDMODE_BLEND);
@@ -176,58 +541,349 @@ namespace mini {
             }
         }
 
-        TextureHandle id = next_tex_id_++;
-        textures_[id] = tex;
+        size_t slot;
+        if (!free_slots_.empty()) {
+            slot = free_slots_.back();
+            free_slots_.pop_back();
+        } else if (slots_.size() < kSlotMask) {
+            slot = slots_.size();
+            slots_.emplace_back();
+        } else {
+            SDL_DestroyTexture(tex);
+            return 0;
+        }
+
+        TextureEntry& entry = slots_[slot];
+        entry.tex = tex;
+        entry.w = w;
+        entry.h = h;
+        entry.mod = ColorRGBA{255,255,255,255};
+        entry.bytes = static_cast<uint64_t>(w) * static_cast<uint64_t>(h) * 4;
+        entry.evictable = false;
+        entry.last_used = frame_;
+        texture_stats_.count += 1;
+        texture_stats_.bytes += entry.bytes;
+
+        const TextureHandle id = handle_of(slot);
+        enforce_texture_budget();
+        return id;
+    }
+
+    SdlRenderer::TextureEntry* SdlRenderer::find_texture(TextureHandle tex) {
+        const uint32_t slot = static_cast<uint32_t>(tex) & kSlotMask;
+        if (slot == 0 || slot > slots_.size()) return nullptr;
+        TextureEntry& entry = slots_[slot - 1];
+        if (!entry.tex || entry.generation != (static_cast<uint32_t>(tex) >> kSlotBits)) {
+            return nullptr;
+        }
+        return &entry;
+    }
+
+    const SdlRenderer::TextureEntry* SdlRenderer::find_texture(TextureHandle tex) const {
+        return const_cast<SdlRenderer*>(this)->find_texture(tex);
+    }
+
+    TextureHandle SdlRenderer::handle_of(size_t slot) const {
+        return static_cast<TextureHandle>((slots_[slot].generation << kSlotBits) | (slot + 1));
+    }
+
+    void SdlRenderer::release_texture(size_t slot) {
+        TextureEntry& entry = slots_[slot];
+        SDL_Texture* sdl_tex = entry.tex;
+        if (sdl_tex == sprite_tex_) flush_sprites();
+        if (handle_of(slot) == target_) set_render_target(0);
+        if (sdl_tex == last_texture_) last_texture_ = nullptr;
+        if (in_frame_) {
+            pending_destroy_.push_back(sdl_tex);
+        } else {
+            SDL_DestroyTexture(sdl_tex);
+        }
+
+        texture_stats_.count -= 1;
+        texture_stats_.bytes -= entry.bytes;
+        entry.tex = nullptr;
+        entry.bytes = 0;
+        entry.generation = entry.generation % kMaxGeneration + 1;
+        free_slots_.push_back(static_cast<uint32_t>(slot));
+    }
+
+    void SdlRenderer::enforce_texture_budget() {
+        const uint64_t budget = texture_stats_.budget;
+        if (budget == 0 || texture_stats_.bytes <= budget) return;
+
+        // Textures drawn (or created) this frame may still be referenced by
+        // queued work, so only older ones are candidates.
+        evict_order_.clear();
+        for (size_t i = 0; i < slots_.size(); ++i) {
+            const TextureEntry& entry = slots_[i];
+            if (entry.tex && entry.evictable && entry.last_used < frame_ && handle_of(i) != target_) {
+                evict_order_.push_back(i);
+            }
+        }
+        std::sort(evict_order_.begin(), evict_order_.end(), [this](size_t a, size_t b) {
+            return slots_[a].last_used < slots_[b].last_used;
+        });
+
+        for (size_t slot : evict_order_) {
+            if (texture_stats_.bytes <= budget) break;
+            evicted_.push_back(handle_of(slot));
+            release_texture(slot);
+            texture_stats_.evictions += 1;
+        }
+    }
+
+    void SdlRenderer::set_texture_budget(uint64_t bytes) {
+        texture_stats_.budget = bytes;
+        enforce_texture_budget();
+    }
+
+    void SdlRenderer::set_texture_evictable(TextureHandle tex, bool evictable) {
+        if (TextureEntry* entry = find_texture(tex)) entry->evictable = evictable;
+    }
+
+    TextureStats SdlRenderer::texture_stats() const {
+        TextureStats stats = texture_stats_;
+        stats.evictable_bytes = 0;
+        for (const TextureEntry& entry : slots_) {
+            if (entry.tex && entry.evictable) stats.evictable_bytes += entry.bytes;
+        }
+        return stats;
+    }
+
+    std::vector<TextureHandle> SdlRenderer::take_evicted_textures() {
+        std::vector<TextureHandle> out;
+        out.swap(evicted_);
+        return out;
+    }
+
+    TextureHandle SdlRenderer::create_texture_rgba(int w, int h, const void* pixels, int pitch) {
+        return create_texture(w, h, SDL_TEXTUREACCESS_STATIC, pixels, pitch);
+    }
+
+    TextureHandle SdlRenderer::create_texture_streaming(int w, int h) {
+        return create_texture(w, h, SDL_TEXTUREACCESS_STREAMING, nullptr, 0);
+    }
+
+    SdlRenderer::TextureEntry* SdlRenderer::texture_for_write(TextureHandle tex) {
+        TextureEntry* entry = find_texture(tex);
+        if (!entry) return nullptr;
+        if (entry->tex == sprite_tex_) flush_sprites();
+        return entry;
+    }
+
+    void SdlRenderer::set_texture_filter(TextureHandle tex, bool linear) {
+        TextureEntry* entry = find_texture(tex);
+        if (!entry) return;
+        if (entry->tex == sprite_tex_) flush_sprites();
+        SDL_SetTextureScaleMode(entry->tex, linear ? SDL_ScaleModeLinear : SDL_ScaleModeNearest);
+    }
+
+    bool SdlRenderer::update_texture(TextureHandle tex, const TextureRect* rect, const void* pixels, int pitch) {
+        TextureEntry* entry = texture_for_write(tex);
+        if (!entry || !pixels) return false;
+
+        SDL_Rect r;
+        if (rect) r = SDL_Rect{ rect->x, rect->y, rect->w, rect->h };
+        return SDL_UpdateTexture(entry->tex, rect ? &r : nullptr, pixels, pitch) == 0;
+    }
+
+    bool SdlRenderer::lock_texture(TextureHandle tex, const TextureRect* rect, void** pixels, int* pitch) {
+        TextureEntry* entry = texture_for_write(tex);
+        if (!entry) return false;
+
+        SDL_Rect r;
+        if (rect) r = SDL_Rect{ rect->x, rect->y, rect->w, rect->h };
+        return SDL_LockTexture(entry->tex, rect ? &r : nullptr, pixels, pitch) == 0;
+    }
+
+    void SdlRenderer::unlock_texture(TextureHandle tex) {
+        if (TextureEntry* entry = find_texture(tex)) SDL_UnlockTexture(entry->tex);
+    }
+
+    TextureHandle SdlRenderer::create_render_target(int w, int h) {
+        TextureHandle id = create_texture(w, h, SDL_TEXTUREACCESS_TARGET, nullptr, 0);
+        if (id == 0) return 0;
+
+        // Blending into a transparent target leaves premultiplied colors, so
+        // composite them with ONE / ONE_MINUS_SRC_ALPHA. Drivers without
+        // custom blend modes (the software renderer) keep plain alpha blending.
+        const SDL_BlendMode premultiplied = SDL_ComposeCustomBlendMode(
+            SDL_BLENDFACTOR_ONE, SDL_BLENDFACTOR_ONE_MINUS_SRC_ALPHA, SDL_BLENDOPERATION_ADD,
+            SDL_BLENDFACTOR_ONE, SDL_BLENDFACTOR_ONE_MINUS_SRC_ALPHA, SDL_BLENDOPERATION_ADD
+        );
+        SDL_Texture* tex = find_texture(id)->tex;
+        if (SDL_SetTextureBlendMode(tex, premultiplied) != 0) {
+            SDL_SetTextureBlendMode(tex, SDL_BLENDMODE_BLEND);
+        }
         return id;
     }
 
+    bool SdlRenderer::set_render_target(TextureHandle tex) {
+        SDL_Texture* sdl_tex = nullptr;
+        if (tex != 0) {
+            TextureEntry* entry = find_texture(tex);
+            if (!entry) return false;
+            sdl_tex = entry->tex;
+        }
+        if (tex == target_) return true;
+
+        flush_sprites();
+        if (SDL_SetRenderTarget(renderer_, sdl_tex) != 0) return false;
+        target_ = tex;
+        // SDL keeps a separate clip rect per target, so the cached one no
+        // longer describes what the driver is using.
+        clip_known_ = false;
+        return true;
+    }
+
+    std::pair<int,int> SdlRenderer::texture_size(TextureHandle tex) const {
+        const TextureEntry* entry = find_texture(tex);
+        if (!entry) return {0, 0};
+        return {entry->w, entry->h};
+    }
+
     void SdlRenderer::draw_texture(
         TextureHandle tex,
-        int x,
-        int y,
-        int w,
-        int h,
-        double angle_deg
+        float x,
+        float y,
+        float w,
+        float h,
+        double angle_deg,
+        ColorRGBA tint
     ) {
-        auto it = textures_.find(tex);
-        if (it == textures_.end() || !it->second) return;
+        const TextureEntry* entry = find_texture(tex);
+        if (!entry) return;
+
+        draw_texture_region(
+            tex,
+            0.0f, 0.0f, static_cast<float>(entry->w), static_cast<float>(entry->h),
+            x, y, w, h,
+            angle_deg, tint
+        );
+    }
 
-        SDL_Rect dst{ x,y,w,h };
-        if (std::abs(angle_deg) <= 0.001) {
-            SDL_RenderCopy(renderer_, it->second, nullptr, &dst);
-            return;
+    bool SdlRenderer::begin_sprites(TextureEntry& entry) {
+        if (entry.w <= 0 || entry.h <= 0) return false;
+        entry.last_used = frame_;
+        if (entry.tex != sprite_tex_) {
+            flush_sprites();
+            use_texture(entry.tex);
+            set_texture_mod(entry, ColorRGBA{255,255,255,255});
+            sprite_tex_ = entry.tex;
         }
+        return true;
+    }
 
-        SDL_Point center{w / 2, h / 2};
-        SDL_RenderCopyEx(
-            renderer_,
-            it->second,
-            nullptr,
-            &dst,
-            angle_deg,
-            &center,
-            SDL_FLIP_NONE
+    void SdlRenderer::queue_sprite(
+        float u0, float v0, float u1, float v1,
+        float x, float y, float w, float h,
+        double angle_deg, ColorRGBA tint
+    ) {
+        // Corners relative to the quad center, rotated clockwise on screen
+        // (y points down) to match SDL_RenderCopyEx.
+        const float hw = w * 0.5f;
+        const float hh = h * 0.5f;
+        const float cx = x + hw;
+        const float cy = y + hh;
+        float cs = 1.0f;
+        float sn = 0.0f;
+        if (std::abs(angle_deg) > 0.001) {
+            const double rad = angle_deg * kPi / 180.0;
+            cs = static_cast<float>(std::cos(rad));
+            sn = static_cast<float>(std::sin(rad));
+        }
+        const float corners[4][2] = { {-hw, -hh}, {hw, -hh}, {hw, hh}, {-hw, hh} };
+        const float uvs[4][2] = { {u0, v0}, {u1, v0}, {u1, v1}, {u0, v1} };
+
+        const int base = static_cast<int>(sprite_vertices_.size());
+        const SDL_Color color{ tint.r, tint.g, tint.b, tint.a };
+        for (int i = 0; i < 4; ++i) {
+            const float dx = corners[i][0];
+            const float dy = corners[i][1];
+            sprite_vertices_.push_back(SDL_Vertex{
+                SDL_FPoint{ cx + dx * cs - dy * sn, cy + dx * sn + dy * cs },
+                color,
+                SDL_FPoint{ uvs[i][0], uvs[i][1] }
+            });
+        }
+        const int quad[6] = { 0, 1, 2, 0, 2, 3 };
+        for (int i : quad) sprite_indices_.push_back(base + i);
+    }
+
+    void SdlRenderer::draw_texture_region(
+        TextureHandle tex,
+        float sx, float sy, float sw, float sh,
+        float x, float y, float w, float h,
+        double angle_deg,
+        ColorRGBA tint
+    ) {
+        TextureEntry* found = find_texture(tex);
+        if (!found) return;
+        TextureEntry& entry = *found;
+        if (!begin_sprites(entry)) return;
+
+        // Snap to whole pixels like the SDL_RenderCopy path this replaced.
+        const SDL_Rect dst = map_rect(x, y, w, h);
+        queue_sprite(
+            sx / entry.w, sy / entry.h, (sx + sw) / entry.w, (sy + sh) / entry.h,
+            static_cast<float>(dst.x), static_cast<float>(dst.y),
+            static_cast<float>(dst.w), static_cast<float>(dst.h),
+            angle_deg, tint
         );
     }
 
-    void SdlRenderer::destroy_texture(TextureHandle tex) {
-        auto it = textures_.find(tex);
-        if (it == textures_.end()) return;
-        if (it->second) {
-            if (in_frame_) {
-                pending_destroy_.push_back(it->second);
-            } else {
-                SDL_DestroyTexture(it->second);
-            }
+    void SdlRenderer::draw_texture_instances(
+        TextureHandle tex,
+        const float* src,
+        const float* xywha,
+        size_t count,
+        const ColorRGBA* colors,
+        size_t color_count
+    ) {
+        if (count == 0 || color_count == 0) return;
+        TextureEntry* found = find_texture(tex);
+        if (!found) return;
+        TextureEntry& entry = *found;
+        if (!begin_sprites(entry)) return;
+
+        float u0 = 0.0f, v0 = 0.0f, u1 = 1.0f, v1 = 1.0f;
+        if (src) {
+            u0 = src[0] / entry.w;
+            v0 = src[1] / entry.h;
+            u1 = (src[0] + src[2]) / entry.w;
+            v1 = (src[1] + src[3]) / entry.h;
+        }
+
+        sprite_vertices_.reserve(sprite_vertices_.size() + count * 4);
+        sprite_indices_.reserve(sprite_indices_.size() + count * 6);
+        for (size_t i = 0; i < count; ++i) {
+            const float* r = xywha + i * 5;
+            queue_sprite(
+                u0, v0, u1, v1,
+                map_x(r[0]), map_y(r[1]), r[2] * vp_.scale, r[3] * vp_.scale, r[4],
+                colors[color_count == 1 ? 0 : i]
+            );
         }
-        textures_.erase(it);
     }
 
-    void SdlRenderer::draw_texture_tiled_y(TextureHandle tex_id, int x, int y, int w, int h) {
-        auto it = textures_.find(tex_id);
-        if (it == textures_.end() || !it->second) return;
+    void SdlRenderer::destroy_texture(TextureHandle tex) {
+        if (find_texture(tex)) release_texture((static_cast<uint32_t>(tex) & kSlotMask) - 1);
+    }
 
-        SDL_Texture* tex = it->second;
+    void SdlRenderer::draw_texture_tiled_y(TextureHandle tex_id, float vx, float vy, float vw, float vh) {
+        TextureEntry* entry = find_texture(tex_id);
+        if (!entry) return;
+        flush_sprites();
+        entry->last_used = frame_;
+
+        SDL_Texture* tex = entry->tex;
+        const SDL_Rect area = map_rect(vx, vy, vw, vh);
+        const int x = area.x;
+        const int y = area.y;
+        const int w = area.w;
+        const int h = area.h;
+        use_texture(tex);
+        set_texture_mod(*entry, ColorRGBA{255,255,255,255});
 
         int src_w = 0;
         int src_h = 0;
@@ -265,6 +921,7 @@ namespace mini {
     }
 
     bool SdlRenderer::read_pixels_argb8888(void* dst, int pitch, int w, int h) {
+        flush_sprites();
         // Read from current render target
         // Note: This reads ARGB8888 by request (matches your previous code).
         SDL_Rect rect{0,0,w,h};
@@ -274,4 +931,22 @@ namespace mini {
         return true;
     }
 
+    bool SdlRenderer::read_pixels(const TextureRect* rect, PixelFormat format, void* dst, int pitch) {
+        flush_sprites();
+        // The *32 formats are byte-order aliases of the packed 8888 ones.
+        Uint32 sdl_format = SDL_PIXELFORMAT_RGBA32;
+        switch (format) {
+            case PixelFormat::RGBA: sdl_format = SDL_PIXELFORMAT_RGBA32; break;
+            case PixelFormat::BGRA: sdl_format = SDL_PIXELFORMAT_BGRA32; break;
+            case PixelFormat::ARGB: sdl_format = SDL_PIXELFORMAT_ARGB32; break;
+        }
+        SDL_Rect area;
+        const SDL_Rect* src = nullptr;
+        if (rect) {
+            area = SDL_Rect{ rect->x, rect->y, rect->w, rect->h };
+            src = &area;
+        }
+        return SDL_RenderReadPixels(renderer_, src, sdl_format, dst, pitch) == 0;
+    }
+
 } // namespace mini
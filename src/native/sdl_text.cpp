@@ -1,8 +1,20 @@
 #include "mini/sdl_text.h"
+#include <filesystem>
 #include <stdexcept>
 #include <string>
 
 namespace mini {
+namespace {
+    // TrueType, OpenType (CFF), Apple 'true' and collection signatures.
+    bool has_font_signature(const MappedFile& file) {
+        if (file.size() < 12) return false;
+        const uint8_t* d = file.data();
+        const uint32_t tag = (uint32_t(d[0]) << 24) | (uint32_t(d[1]) << 16)
+                           | (uint32_t(d[2]) << 8) | uint32_t(d[3]);
+        return tag == 0x00010000u || tag == 0x4F54544Fu   // 'OTTO'
+            || tag == 0x74727565u || tag == 0x74746366u;  // 'true', 'ttcf'
+    }
+} // namespace
 
     SdlTextRenderer::SdlTextRenderer(IRenderer& renderer)
         : renderer_(renderer)
@@ -10,71 +22,225 @@ namespace mini {
         }
 
     SdlTextRenderer::~SdlTextRenderer() {
-        for (auto* f : fonts_) {
-            if (f) TTF_CloseFont(f);
+        for (auto& entry : fonts_) {
+            // Pages go back to the renderer before the font closes.
+            entry->atlas.reset();
+            if (entry->font) TTF_CloseFont(entry->font);
         }
         fonts_.clear();
     }
 
-    int SdlTextRenderer::load_font(const std::string& path, int pt) {
+    int SdlTextRenderer::register_font(const std::string& path, int pt, bool sdf) {
         if (path.empty()) {
             throw std::runtime_error("load_font: path is empty");
         }
-        TTF_Font* f = TTF_OpenFont(path.c_str(), pt);
-        if (!f) {
-            throw std::runtime_error(std::string("TTF_OpenFont Error: ") + TTF_GetError());
+        if (pt <= 0) {
+            throw std::runtime_error("load_font: size must be > 0");
+        }
+
+        std::lock_guard<std::mutex> registry_lock(registry_mutex_);
+        std::error_code ec;
+        std::string canonical = std::filesystem::weakly_canonical(path, ec).string();
+        if (ec) canonical = path;
+
+        std::string key = (sdf ? "sdf:" : "bitmap:") + std::to_string(pt) + ':' + canonical;
+        auto found = font_ids_.find(key);
+        if (found != font_ids_.end()) return found->second;
+
+        std::shared_ptr<MappedFile>& file = files_[canonical];
+        const bool new_file = !file;
+        if (new_file) {
+            try {
+                file = MappedFile::open(path);
+            } catch (...) {
+                files_.erase(canonical);
+                throw;
+            }
+        }
+
+        // Only the header is checked here, so a file that isn't a font fails
+        // on load rather than mid-frame; the face itself is opened on first
+        // use and only the tables SDL_ttf reads are paged in.
+        if (new_file && !has_font_signature(*file)) {
+            files_.erase(canonical);
+            throw std::runtime_error("load_font: not a TrueType/OpenType font: " + path);
+        }
+
+        auto entry = std::make_unique<FontEntry>();
+        entry->file = file;
+        entry->pt = pt;
+        entry->sdf = sdf;
+        const int id = entry->id = static_cast<int>(fonts_.size());
+        {
+            std::lock_guard<std::mutex> lock(fonts_mutex_);
+            fonts_.push_back(std::move(entry));
+            // A configured default is registered on first use instead.
+            if (default_font_id_ < 0 && default_path_.empty()) default_font_id_ = id;
         }
-        fonts_.push_back(f);
-        int id = static_cast<int>(fonts_.size() - 1);
-        if (default_font_id_ < 0) default_font_id_ = id;
+        font_ids_.emplace(std::move(key), id);
         return id;
     }
 
-    std::pair<int,int> SdlTextRenderer::measure_utf8(const std::string& text, int font_id) {
-        int idx = font_id;
-        if (idx < 0) idx = default_font_id_;
-        if (idx < 0 || idx >= (int)fonts_.size() || !fonts_[idx]) return {0,0};
+    int SdlTextRenderer::load_font(const std::string& path, int pt) {
+        return register_font(path, pt, false);
+    }
 
-        int w=0,h=0;
+    int SdlTextRenderer::load_sdf_font(const std::string& path, int pt) {
+        const int id = register_font(path, pt, true);
+        // Distance fields are slow to build, so do printable ASCII up front.
+        FontEntry* entry = font_entry(id);
+        if (entry->atlas->glyph_count() == 0) {
+            for (uint32_t cp = 0x20; cp < 0x7F; ++cp) entry->atlas->glyph(cp);
+        }
+        return id;
+    }
+
+    std::pair<int,int> SdlTextRenderer::measure_utf8(const std::string& text, int font_id) {
         if (text.empty()) return {0,0};
-        if (TTF_SizeUTF8(fonts_[idx], text.c_str(), &w, &h) != 0) return {0,0};
-        return {w,h};
+        FontEntry* entry = font_entry(font_id);
+        if (!entry) return {0,0};
+
+        const auto [w, h] = entry->atlas->measure(text);
+        const int unit = entry->atlas->units();
+        return {(w + unit / 2) / unit, (h + unit / 2) / unit};
+    }
+
+    void SdlTextRenderer::prewarm_utf8(const std::string& text, int font_id) {
+        FontEntry* entry = font_entry(font_id);
+        if (!entry) return;
+        size_t i = 0;
+        while (i < text.size()) entry->atlas->glyph(next_utf8(text.data(), text.size(), i));
+    }
+
+    void SdlTextRenderer::rasterize_utf8(const std::string& text, int font_id) {
+        FontEntry* entry = font_entry(font_id);
+        if (!entry) return;
+        entry->atlas->render_ahead(text.data(), text.size());
+    }
+
+    void SdlTextRenderer::upload_rasterized() {
+        std::vector<GlyphAtlas*> atlases;
+        {
+            std::lock_guard<std::mutex> lock(fonts_mutex_);
+            for (auto& entry : fonts_) {
+                if (entry->atlas) atlases.push_back(entry->atlas.get());
+            }
+        }
+        for (GlyphAtlas* atlas : atlases) atlas->upload_rendered();
     }
 
     void SdlTextRenderer::draw_utf8(
-        const std::string& text, int x, int y,
+        const std::string& text, float x, float y,
         int r, int g, int b, int a,
         int font_id
     ) {
-        int idx = font_id;
-        if (idx < 0) idx = default_font_id_;
-        if (idx < 0 || idx >= (int)fonts_.size() || !fonts_[idx]) return;
         if (text.empty()) return;
+        FontEntry* entry = font_entry(font_id);
+        if (!entry) return;
 
-        SDL_Color c{
-            (Uint8) (r < 0 ? 0 : (r > 255 ? 255 : r)),
-            (Uint8) (g < 0 ? 0 : (g > 255 ? 255 : g)),
-            (Uint8) (b < 0 ? 0 : (b > 255 ? 255 : b)),
-            (Uint8) (a < 0 ? 0 : (a > 255 ? 255 : a))
+        const ColorRGBA tint{
+            (uint8_t) (r < 0 ? 0 : (r > 255 ? 255 : r)),
+            (uint8_t) (g < 0 ? 0 : (g > 255 ? 255 : g)),
+            (uint8_t) (b < 0 ? 0 : (b > 255 ? 255 : b)),
+            (uint8_t) (a < 0 ? 0 : (a > 255 ? 255 : a))
         };
+        entry->atlas->draw(text.data(), text.size(), x, y, tint);
+    }
+
+    void SdlTextRenderer::set_default_font_path(const std::string& path, int pt) {
+        default_path_ = path;
+        default_pt_ = pt;
+    }
+
+    SdlTextRenderer::FontEntry* SdlTextRenderer::font_entry(int font_id) {
+        if (font_id < 0 && !default_path_.empty()) {
+            // Text is often never drawn with the default font, so it isn't
+            // mapped until it is.
+            std::call_once(default_once_, [this] {
+                const int id = register_font(default_path_, default_pt_, false);
+                std::lock_guard<std::mutex> lock(fonts_mutex_);
+                if (default_font_id_ < 0) default_font_id_ = id;
+            });
+        }
+
+        std::lock_guard<std::mutex> lock(fonts_mutex_);
+        int idx = font_id;
+        if (idx < 0) idx = default_font_id_;
+        if (idx < 0 || idx >= (int)fonts_.size()) return nullptr;
 
-        SDL_Surface* surf = TTF_RenderUTF8_Blended(fonts_[idx], text.c_str(), c);
-        if (!surf) return;
+        FontEntry& entry = *fonts_[idx];
+        if (!entry.font) {
+            // SDL_ttf reads the face straight from the shared mapping.
+            SDL_RWops* rw = SDL_RWFromConstMem(entry.file->data(), static_cast<int>(entry.file->size()));
+            TTF_Font* f = rw ? TTF_OpenFontRW(rw, 1, entry.sdf ? entry.pt * kSdfOversample : entry.pt) : nullptr;
+            if (!f) {
+                throw std::runtime_error(
+                    std::string("TTF_OpenFontRW Error: ") + entry.file->path() + ": " + TTF_GetError()
+                );
+            }
+            entry.font = f;
+            entry.atlas = std::make_unique<GlyphAtlas>(renderer_, f, entry.sdf);
+        }
+        return &entry;
+    }
 
-        // Convert to RGBA32 so renderer texture upload is consistent
-        SDL_Surface* rgba = SDL_ConvertSurfaceFormat(surf, SDL_PIXELFORMAT_RGBA32, 0);
-        SDL_FreeSurface(surf);
-        if (!rgba) return;
+    const TextLayout& SdlTextRenderer::layout_utf8(
+        const std::string& text, int max_width, TextAlign align, int font_id
+    ) {
+        FontEntry* entry = font_entry(font_id);
+        if (!entry) return empty_layout_;
+        if (max_width < 0) max_width = 0;
 
-        TextureHandle tex = renderer_.create_texture_rgba(rgba->w, rgba->h, rgba->pixels, rgba->pitch);
-        int w = rgba->w;
-        int h = rgba->h;
-        SDL_FreeSurface(rgba);
+        layout_key_.clear();
+        layout_key_ += std::to_string(entry->id);
+        layout_key_ += ':';
+        layout_key_ += std::to_string(max_width);
+        layout_key_ += ':';
+        layout_key_ += std::to_string(static_cast<uint32_t>(align));
+        layout_key_ += ':';
+        layout_key_ += text;
 
-        if (tex == 0) return;
+        auto it = layout_index_.find(layout_key_);
+        if (it != layout_index_.end()) {
+            layouts_.splice(layouts_.begin(), layouts_, it->second);
+            return it->second->second;
+        }
+
+        if (layouts_.size() >= kMaxLayouts) {
+            layout_index_.erase(layouts_.back().first);
+            layouts_.pop_back();
+        }
+        layouts_.emplace_front(layout_key_, TextLayout{});
+        layout_index_[layout_key_] = layouts_.begin();
+        TextLayout& out = layouts_.front().second;
+        entry->atlas->layout(text, max_width, align, out);
+        return out;
+    }
 
-        renderer_.draw_texture(tex, x, y, w, h);
-        renderer_.destroy_texture(tex);
+    void SdlTextRenderer::draw_layout_utf8(
+        const std::string& text,
+        float x, float y,
+        int max_width, TextAlign align,
+        int r, int g, int b, int a,
+        int font_id
+    ) {
+        FontEntry* entry = font_entry(font_id);
+        if (!entry || text.empty()) return;
+
+        const ColorRGBA tint{
+            (uint8_t) (r < 0 ? 0 : (r > 255 ? 255 : r)),
+            (uint8_t) (g < 0 ? 0 : (g > 255 ? 255 : g)),
+            (uint8_t) (b < 0 ? 0 : (b > 255 ? 255 : b)),
+            (uint8_t) (a < 0 ? 0 : (a > 255 ? 255 : a))
+        };
+        // Bitmap line offsets are screen pixels; draw() takes virtual positions.
+        const float inv = entry->atlas->sdf() ? 1.0f : 1.0f / renderer_.viewport().scale;
+        for (const TextLine& line : layout_utf8(text, max_width, align, font_id).lines) {
+            entry->atlas->draw(
+                text.data() + line.bytes_start, line.bytes_end - line.bytes_start,
+                x + line.x * inv, y + line.y * inv, tint
+            );
+        }
     }
 
 } // namespace mini
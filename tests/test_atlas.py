@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PACKAGE_ROOT / "src"
+CORE_SRC_ROOT = PACKAGE_ROOT.parent / "mini-arcade-core" / "src"
+
+
+class _TextureBackend:
+    def __init__(self) -> None:
+        self.textures: list[tuple[int, int, bytes, int]] = []
+        self.submitted: list[bytes] = []
+
+    def create_texture_rgba(self, w, h, pixels, pitch) -> int:
+        self.textures.append((w, h, bytes(pixels), pitch))
+        return len(self.textures)
+
+    def submit(self, commands) -> None:
+        self.submitted.append(bytes(commands))
+
+
+def test_atlas_builder_packs_images_into_one_page(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.atlas import TextureAtlasBuilder
+    from mini_arcade_native_backend.ports.render import RenderPort
+
+    backend = _TextureBackend()
+    port = RenderPort(backend, ViewportTransform())
+    builder = TextureAtlasBuilder(page_size=32, padding=1)
+    builder.add("red", 4, 4, bytes((255, 0, 0, 255)) * 16)
+    builder.add("blue", 4, 2, bytes((0, 0, 255, 255)) * 8)
+    builder.add("tall", 2, 8, bytes((0, 255, 0, 255)) * 16)
+
+    atlas = builder.build(port)
+
+    assert atlas.pages == [1]
+    assert len(builder) == 0
+    page_w, page_h, pixels, pitch = backend.textures[0]
+    assert (page_w, page_h, pitch) == (32, 8, 128)
+
+    regions = [atlas["tall"], atlas["red"], atlas["blue"]]
+    assert [r.src_rect for r in regions] == [
+        (0, 0, 2, 8),
+        (3, 0, 4, 4),
+        (8, 0, 4, 2),
+    ]
+    for region in regions:
+        for j in range(region.h):
+            for i in range(region.w):
+                offset = ((region.y + j) * page_w + region.x + i) * 4
+                assert pixels[offset + 3] == 255
+
+
+def test_atlas_builder_opens_new_page_when_full(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_native_backend.atlas import TextureAtlasBuilder
+
+    backend = _TextureBackend()
+    builder = TextureAtlasBuilder(page_size=8, padding=0)
+    for i in range(3):
+        builder.add(i, 8, 4, bytes(8 * 4 * 4))
+
+    atlas = builder.build(backend)
+
+    assert atlas.pages == [1, 2]
+    assert {atlas[i].texture for i in range(3)} == {1, 2}
+
+
+def test_shelf_packer_pads_only_between_shelves(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_native_backend.atlas import ShelfPacker
+
+    packer = ShelfPacker(8, 8, padding=1)
+
+    assert packer.insert(8, 4) == (0, 0)
+    # Fits exactly: one padding row, then the last row of the page.
+    assert packer.insert(8, 3) == (0, 5)
+    assert packer.used_height == 8
+    assert packer.insert(1, 1) is None
+
+
+def test_render_port_queues_region_draws(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.atlas import AtlasRegion
+    from mini_arcade_native_backend.draw_commands import OP_TEXTURE_REGION
+    from mini_arcade_native_backend.ports.render import RenderPort
+
+    backend = _TextureBackend()
+    port = RenderPort(backend, ViewportTransform(ox=1, oy=0, s=2.0))
+    frames = AtlasRegion(4, 16, 0, 32, 16).grid(8, 8, count=5)
+
+    assert [f.src_rect for f in frames] == [
+        (16, 0, 8, 8),
+        (24, 0, 8, 8),
+        (32, 0, 8, 8),
+        (40, 0, 8, 8),
+        (16, 8, 8, 8),
+    ]
+
+    port.draw_region(frames[1], 3, 4)
+    port.flush()
+
+    assert struct.unpack("<II9f", backend.submitted[0]) == (
+        OP_TEXTURE_REGION, 4, 24, 0, 8, 8, 3, 4, 8, 8, 0
+    )
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PACKAGE_ROOT / "src"
+CORE_SRC_ROOT = PACKAGE_ROOT.parent / "mini-arcade-core" / "src"
+
+
+class _CaptureBackend:
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+
+    def submit(self, commands) -> None:
+        self.calls.append(("submit", bytes(commands)))
+
+    def output_size(self) -> tuple[int, int]:
+        return (2, 1)
+
+    def capture_into(self, buffer, rect, format_id: int):
+        self.calls.append(("capture_into", rect, format_id))
+        view = memoryview(buffer).cast("B")
+        view[:4] = bytes((1, 2, 3, 4))
+        return (2, 1) if rect is None else rect[2:]
+
+
+def test_capture_port_reads_into_caller_buffer(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_native_backend.ports.capture import CapturePort
+
+    backend = _CaptureBackend()
+    port = CapturePort(backend)
+    port._cmds.rect(0, 0, 1, 1, 255, 0, 0, 255)
+
+    pixels = bytearray(8)
+    assert port.into(pixels) == (2, 1)
+    assert port.into(pixels, (1, 0, 1, 1), format="BGRA") == (1, 1)
+
+    assert [c[0] for c in backend.calls] == [
+        "submit",
+        "capture_into",
+        "capture_into",
+    ]
+    assert backend.calls[1:] == [
+        ("capture_into", None, 0),
+        ("capture_into", (1, 0, 1, 1), 1),
+    ]
+    assert pixels[:4] == bytes((1, 2, 3, 4))
+
+    with pytest.raises(ValueError):
+        port.into(pixels, format="yuv")
+
+
+def test_capture_port_saves_screenshots_on_a_worker(
+    monkeypatch, tmp_path
+) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_native_backend import screenshots
+    from mini_arcade_native_backend.ports.capture import CapturePort
+
+    gate = threading.Event()
+    encoded: list[tuple[bytes, int, int, str]] = []
+
+    def _encode(pixels, width: int, height: int) -> bytes:
+        gate.wait(5.0)
+        thread = threading.current_thread().name
+        encoded.append((bytes(pixels), width, height, thread))
+        return b"png:" + bytes(pixels)
+
+    monkeypatch.setitem(screenshots.SCREENSHOT_ENCODERS, "png", _encode)
+
+    backend = _CaptureBackend()
+    port = CapturePort(backend, screenshot_queue=1, screenshot_policy="drop")
+    done: list[bool] = []
+
+    first = port.save_async(
+        tmp_path / "a.png", on_done=lambda f: done.append(f.result())
+    )
+    # The only slot is still encoding, so this one is dropped.
+    second = port.save_async(tmp_path / "b.png")
+    assert second.result(timeout=1.0) is False
+    assert port.screenshots_dropped == 1
+
+    gate.set()
+    assert first.result(timeout=5.0) is True
+    port.close()
+
+    assert done == [True]
+    # Dropped screenshots skip the readback too.
+    assert backend.calls == [("capture_into", None, 0)]
+    assert encoded[0][:3] == (bytes((1, 2, 3, 4, 0, 0, 0, 0)), 2, 1)
+    assert encoded[0][3].startswith("screenshot")
+    assert (tmp_path / "a.png").read_bytes() == b"png:" + encoded[0][0]
+    assert not (tmp_path / "b.png").exists()
+
+    with pytest.raises(ValueError):
+        port.save_async(tmp_path / "c.bmp", format="bmp")
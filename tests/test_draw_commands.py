@@ -0,0 +1,373 @@
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PACKAGE_ROOT / "src"
+CORE_SRC_ROOT = PACKAGE_ROOT.parent / "mini-arcade-core" / "src"
+
+
+class _SubmitBackend:
+    def __init__(self) -> None:
+        self.submitted: list[bytes] = []
+        self.destroyed: list[int] = []
+
+        self.viewports: list[tuple[float, float, float]] = []
+
+    def submit(self, commands) -> None:
+        self.submitted.append(bytes(commands))
+
+    def set_viewport(self, ox: float, oy: float, s: float) -> None:
+        self.viewports.append((ox, oy, s))
+
+    def begin_frame(self) -> None:
+        pass
+
+    def end_frame(self) -> None:
+        pass
+
+    def destroy_texture(self, texture_id: int) -> None:
+        self.destroyed.append(texture_id)
+
+
+def test_render_port_batches_primitives_into_one_submit(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.draw_commands import (
+        OP_LINE,
+        OP_RECT,
+        OP_TEXTURE,
+    )
+    from mini_arcade_native_backend.ports.render import RenderPort
+
+    backend = _SubmitBackend()
+    port = RenderPort(backend, ViewportTransform(ox=10, oy=0, s=2.0))
+
+    port.begin_frame()
+    port.draw_rect(1, 2, 3, 4, (255, 0, 0))
+    port.draw_line(0, 0, 5, 5, (0, 255, 0, 128), thickness=3)
+    port.draw_texture(7, 1, 1, 8, 8, 90.0)
+    assert backend.submitted == []
+
+    port.end_frame()
+
+    # Records keep virtual coordinates; the viewport is applied natively.
+    assert backend.viewports == [(10, 0, 2.0)]
+    assert len(backend.submitted) == 1
+    data = backend.submitted[0]
+    assert struct.unpack_from("<I4f4B", data, 0) == (
+        OP_RECT, 1.0, 2.0, 3.0, 4.0, 255, 0, 0, 255
+    )
+    assert struct.unpack_from("<I4f4Bi", data, 24) == (
+        OP_LINE, 0.0, 0.0, 5.0, 5.0, 0, 255, 0, 128, 3
+    )
+    assert struct.unpack_from("<II5f4B", data, 52) == (
+        OP_TEXTURE, 7, 1.0, 1.0, 8.0, 8.0, 90.0, 255, 255, 255, 255
+    )
+    assert len(data) == 84
+
+
+def test_render_port_flushes_before_destroying_texture(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.ports.render import RenderPort
+
+    backend = _SubmitBackend()
+    port = RenderPort(backend, ViewportTransform())
+
+    port.draw_texture(3, 0, 0, 4, 4)
+    port.destroy_texture(3)
+
+    assert len(backend.submitted) == 1
+    assert backend.destroyed == [3]
+
+
+def test_render_port_batch_draws_forward_buffers_and_colors(
+    monkeypatch,
+) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.ports.render import RenderPort
+
+    calls: list[tuple] = []
+
+    class _BatchBackend(_SubmitBackend):
+        def draw_rects(self, rects, colors) -> None:
+            calls.append(("rects", rects, colors))
+
+        def draw_points(self, points, colors) -> None:
+            calls.append(("points", points, colors))
+
+    backend = _BatchBackend()
+    port = RenderPort(backend, ViewportTransform(ox=4, oy=2, s=0.5))
+    rects = memoryview(struct.pack("<4f", 0, 0, 8, 8))
+    per_point = bytes([1, 2, 3, 4])
+
+    port.draw_rect(0, 0, 1, 1)
+    port.draw_rects(rects, (10, 20, 30))
+    port.draw_points(rects, per_point)
+
+    # Queued primitives are flushed first to keep draw order.
+    assert len(backend.submitted) == 1
+    assert calls == [
+        ("rects", rects, (10, 20, 30, 255)),
+        ("points", rects, per_point),
+    ]
+
+
+def test_render_port_queues_outline_poly_as_one_record(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.draw_commands import OP_POLY
+    from mini_arcade_native_backend.ports.render import RenderPort
+
+    backend = _SubmitBackend()
+    port = RenderPort(backend, ViewportTransform())
+
+    port.draw_poly([(0, 0), (10, 0), (5, 8)], (1, 2, 3), filled=False)
+    port.flush()
+
+    data = backend.submitted[0]
+    assert struct.unpack_from("<I4BII", data, 0) == (OP_POLY, 1, 2, 3, 255, 3, 0)
+    assert struct.unpack_from("<6f", data, 16) == (0, 0, 10, 0, 5, 8)
+    assert len(data) == 40
+
+
+def test_render_port_draw_texture_instances_uses_region_src(
+    monkeypatch,
+) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.atlas import AtlasRegion
+    from mini_arcade_native_backend.ports.render import RenderPort
+
+    calls: list[tuple] = []
+
+    class _InstanceBackend(_SubmitBackend):
+        def draw_texture_instances(self, tex, instances, colors, src) -> None:
+            calls.append((tex, instances, colors, src))
+
+    backend = _InstanceBackend()
+    port = RenderPort(backend, ViewportTransform(ox=3, oy=1, s=2.0))
+    instances = memoryview(struct.pack("<5f", 0, 0, 8, 8, 90))
+
+    port.draw_texture(2, 0, 0, 4, 4)
+    port.draw_texture_instances(AtlasRegion(5, 8, 0, 8, 8), instances)
+    port.draw_texture_instances(6, instances, (1, 2, 3, 4))
+
+    assert len(backend.submitted) == 1
+    assert calls == [
+        (5, instances, None, (8, 0, 8, 8)),
+        (6, instances, (1, 2, 3, 4), None),
+    ]
+
+
+def test_render_port_set_viewport_flushes_queued_draws_first(
+    monkeypatch,
+) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.ports.render import RenderPort
+
+    backend = _SubmitBackend()
+    vp = ViewportTransform()
+    port = RenderPort(backend, vp)
+
+    port.draw_rect(0, 0, 1, 1)
+    port.set_viewport(8, 4, 3.0)
+
+    assert len(backend.submitted) == 1
+    assert backend.viewports == [(0, 0, 1.0), (8, 4, 3.0)]
+    assert (vp.ox, vp.oy, vp.s) == (8, 4, 3.0)
+
+
+def test_text_port_queues_truetype_text_as_one_record(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.draw_commands import (
+        OP_TEXT,
+        DrawCommandBuffer,
+    )
+    from mini_arcade_native_backend.ports.text import TextPort
+
+    loaded: list[tuple[str, int]] = []
+
+    class _FontBackend(_SubmitBackend):
+        def load_font(self, path: str, pt: int) -> int:
+            loaded.append((path, pt))
+            return 4
+
+    backend = _FontBackend()
+    vp = ViewportTransform(ox=0, oy=0, s=2.0)
+    cmds = DrawCommandBuffer(backend)
+    port = TextPort(backend, vp, "font.ttf", commands=cmds)
+
+    port.draw(3, 5, "héllo", (1, 2, 3), font_size=12)
+    port.draw(3, 25, "world", (1, 2, 3), font_size=12)
+    cmds.flush()
+
+    # One font per scaled size; no per-string textures.
+    assert loaded == [("font.ttf", 24)]
+    data = backend.submitted[0]
+    assert struct.unpack_from("<Iiff4BI", data, 0) == (
+        OP_TEXT, 4, 3.0, 5.0, 1, 2, 3, 255, 6
+    )
+    assert data[24:30] == "héllo".encode("utf-8")
+    assert struct.unpack_from("<Iiff4BI", data, 30)[3] == 25.0
+
+
+def test_text_port_reuses_one_mask_texture_across_colors(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.draw_commands import DrawCommandBuffer
+    from mini_arcade_native_backend.ports.text import TextPort
+
+    uploads: list[bytes] = []
+
+    class _MaskBackend(_SubmitBackend):
+        def create_texture_rgba(self, w, h, pixels, pitch) -> int:
+            uploads.append(bytes(pixels))
+            return 9
+
+    backend = _MaskBackend()
+    cmds = DrawCommandBuffer(backend)
+    # No font path: the PIL default font goes through string textures.
+    port = TextPort(backend, ViewportTransform(), None, commands=cmds)
+
+    for alpha in (0, 128, 255):
+        port.draw(0, 0, "fade", (10, 20, 30, alpha))
+    cmds.flush()
+
+    assert len(uploads) == 1
+    assert set(uploads[0][0::4]) == {255}
+    data = backend.submitted[0]
+    tints = [struct.unpack_from("<4B", data, i * 32 + 28) for i in range(3)]
+    assert tints == [(10, 20, 30, 0), (10, 20, 30, 128), (10, 20, 30, 255)]
+
+
+def test_text_port_measures_natively_with_a_memo(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.ports.text import TextPort
+
+    calls: list[tuple[list[str], int]] = []
+
+    class _MeasureBackend(_SubmitBackend):
+        def load_font(self, path: str, pt: int) -> int:
+            return pt
+
+        def measure_text_many(self, texts, font_id):
+            calls.append((list(texts), font_id))
+            return [(10 * len(t), font_id) for t in texts]
+
+    port = TextPort(
+        _MeasureBackend(), ViewportTransform(s=2.0), "font.ttf"
+    )
+
+    assert port.measure("ab", font_size=10) == (10, 10)
+    assert port.measure_many(["ab", "cdef"], font_size=10) == [
+        (10, 10),
+        (20, 10),
+    ]
+    assert port.measure("cdef", font_size=10) == (20, 10)
+
+    assert calls == [(["ab"], 20), (["cdef"], 20)]
+
+
+def test_text_port_lays_out_and_queues_text_blocks(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.draw_commands import (
+        OP_TEXT_BLOCK,
+        DrawCommandBuffer,
+    )
+    from mini_arcade_native_backend.ports.text import TextPort
+
+    layouts: list[tuple[str, int, int, int]] = []
+
+    class _LayoutBackend(_SubmitBackend):
+        def load_font(self, path: str, pt: int) -> int:
+            return 2
+
+        def layout_text(self, text, max_width, align, font_id):
+            layouts.append((text, max_width, align, font_id))
+            return 40, 32, [(0, 5, 4, 0, 36), (6, 9, 10, 16, 24)]
+
+    backend = _LayoutBackend()
+    cmds = DrawCommandBuffer(backend)
+    port = TextPort(
+        backend, ViewportTransform(s=2.0), "font.ttf", commands=cmds
+    )
+
+    # Native pixel units come back as virtual units.
+    assert port.layout("hello you", 20, 10, align="center") == {
+        "width": 20,
+        "height": 16,
+        "lines": [(0, 5, 2.0, 0.0, 18.0), (6, 9, 5.0, 8.0, 12.0)],
+    }
+    assert layouts == [("hello you", 40, 1, 2)]
+
+    port.draw_block(3, 4, "hello you", 20, (9, 8, 7), 10, align="right")
+    cmds.flush()
+
+    data = backend.submitted[0]
+    assert struct.unpack_from("<Iiff4BiII", data, 0) == (
+        OP_TEXT_BLOCK, 2, 3.0, 4.0, 9, 8, 7, 255, 40, 2, 9
+    )
+    assert data[32:] == b"hello you"
+
+
+def test_text_port_sdf_fonts_ignore_viewport_scale(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.draw_commands import DrawCommandBuffer
+    from mini_arcade_native_backend.ports.text import TextPort
+
+    loaded: list[tuple[str, int]] = []
+
+    class _SdfBackend(_SubmitBackend):
+        def load_sdf_font(self, path: str, pt: int) -> int:
+            loaded.append((path, pt))
+            return 1
+
+        def measure_text_many(self, texts, font_id):
+            return [(7 * len(t), 12) for t in texts]
+
+    backend = _SdfBackend()
+    vp = ViewportTransform(s=2.0)
+    cmds = DrawCommandBuffer(backend)
+    port = TextPort(backend, vp, "font.ttf", commands=cmds, sdf=True)
+
+    port.draw(0, 0, "a", font_size=12)
+    vp.s = 3.5
+    port.draw(0, 0, "a", font_size=12)
+    port.draw_block(0, 0, "a b", 30, font_size=12)
+    cmds.flush()
+
+    # One font for every scale; sizes and widths stay virtual.
+    assert loaded == [("font.ttf", 12)]
+    assert port.measure("abc", font_size=12) == (21, 12)
+    assert struct.unpack_from("<i", backend.submitted[0], 70)[0] == 30
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PACKAGE_ROOT / "src"
+CORE_SRC_ROOT = PACKAGE_ROOT.parent / "mini-arcade-core" / "src"
+
+_RECORD = struct.Struct("<16i")
+
+
+class _PackedBackend:
+    """Hands out queued (type, fields, text) events like poll_events_into."""
+
+    def __init__(self, events) -> None:
+        self.events = list(events)
+        self.calls = 0
+
+    def poll_events_into(self, records, text):
+        self.calls += 1
+        arena = b"".join(t.encode("utf-8") for _, _, t in self.events)
+        if len(records) < len(self.events) * 64 or len(text) < len(arena):
+            return len(self.events), len(arena), False
+
+        offset = 0
+        for i, (etype, fields, t) in enumerate(self.events):
+            data = t.encode("utf-8")
+            values = [int(etype)] + [fields.get(name, 0) for name in _NAMES]
+            _RECORD.pack_into(
+                records, i * 64, *values, offset, len(data)
+            )
+            text[offset : offset + len(data)] = data
+            offset += len(data)
+        count, self.events = len(self.events), []
+        return count, offset, True
+
+
+_NAMES = (
+    "key",
+    "scancode",
+    "mod",
+    "repeat",
+    "x",
+    "y",
+    "dx",
+    "dy",
+    "button",
+    "wheel_x",
+    "wheel_y",
+    "width",
+    "height",
+)
+
+
+def test_input_port_polls_packed_events_lazily(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.events import EventType
+    from mini_arcade_native_backend import _native as native
+    from mini_arcade_native_backend.mapping.events import NativeEventMapper
+    from mini_arcade_native_backend.ports.input import InputPort
+
+    motion = native.EventType.MouseMotion
+    events = [(motion, {"x": i, "y": 2 * i, "dx": 1}, "") for i in range(300)]
+    events.append((native.EventType.TextInput, {}, "hé"))
+    backend = _PackedBackend(events)
+    mapper = NativeEventMapper(native)
+    port = InputPort(backend, mapper)
+
+    packed = port.poll_packed()
+
+    # Too many events for the initial buffers: grown once, nothing lost.
+    assert backend.calls == 2
+    assert len(packed) == 301
+    assert list(packed.column("x"))[:3] == [0, 1, 2]
+    assert packed[299].y == 598
+    assert packed[-1].type == EventType.TEXTINPUT
+    assert packed[-1].text == "hé"
+
+    backend.events = events[:2] + events[-1:]
+    mapped = mapper.to_core_many(port.poll_packed(), {EventType.TEXTINPUT})
+    assert [(e.type, e.text) for e in mapped] == [(EventType.TEXTINPUT, "hé")]
+
+
+class _FilterBackend:
+    def __init__(self) -> None:
+        self.enabled = {}
+        self.coalesce = None
+
+    def set_event_enabled(self, etype, enabled):
+        self.enabled[etype] = enabled
+
+    def set_coalesce_mouse_motion(self, enabled):
+        self.coalesce = enabled
+
+    def poll_events_into(self, records, text):
+        return 0, 0, True
+
+
+def test_input_port_configures_native_filtering(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.events import EventType
+    from mini_arcade_native_backend import _native as native
+    from mini_arcade_native_backend.mapping.events import NativeEventMapper
+    from mini_arcade_native_backend.ports.input import InputPort
+
+    backend = _FilterBackend()
+    port = InputPort(backend, NativeEventMapper(native))
+
+    port.set_event_enabled(EventType.MOUSEMOTION, False)
+    port.set_event_enabled(EventType.TEXTINPUT)
+    port.set_coalesce_motion()
+
+    assert backend.enabled == {
+        native.EventType.MouseMotion: False,
+        native.EventType.TextInput: True,
+    }
+    assert backend.coalesce is True
+
+
+class _StateBackend(_PackedBackend):
+    def __init__(self) -> None:
+        super().__init__([])
+        self.keys = bytearray(512)
+        self.key_calls = 0
+
+    def keyboard_state(self):
+        self.key_calls += 1
+        return memoryview(self.keys).toreadonly()
+
+    def mouse_state(self):
+        return 10, 20, 1
+
+
+def test_input_port_exposes_polled_state(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_native_backend import _native as native
+    from mini_arcade_native_backend.mapping.events import NativeEventMapper
+    from mini_arcade_native_backend.ports.input import InputPort
+
+    backend = _StateBackend()
+    port = InputPort(backend, NativeEventMapper(native))
+
+    keys = port.keyboard_state()
+    backend.keys[4] = 1
+
+    # Shared view: later state changes show through without re-fetching.
+    assert keys[4] == 1
+    assert port.keyboard_state() is keys
+    assert backend.key_calls == 1
+    assert port.mouse_state() == (10, 20, 1)
+
+
+def test_input_port_replays_recorded_frames(monkeypatch, tmp_path) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.events import EventType
+    from mini_arcade_native_backend import _native as native
+    from mini_arcade_native_backend.mapping.events import NativeEventMapper
+    from mini_arcade_native_backend.ports.input import InputPort
+
+    log = tmp_path / "session.mail"
+    backend = _PackedBackend([])
+    port = InputPort(backend, NativeEventMapper(native))
+    port.start_recording(log)
+    frames = [
+        [(native.EventType.KeyDown, {"key": 97, "scancode": 4}, "")],
+        [],
+        [
+            (native.EventType.TextInput, {}, "hé"),
+            (native.EventType.MouseMotion, {"x": 3, "y": 4}, ""),
+        ],
+    ]
+    for frame in frames:
+        backend.events = list(frame)
+        port.poll()
+    port.stop_recording()
+
+    # Live input is drained but ignored while replaying.
+    backend.events = [(native.EventType.Quit, {}, "")]
+    port.start_replay(log)
+    replayed = [port.poll() for _ in frames]
+
+    assert not port.replaying
+    assert backend.events == []
+    assert [e.key_code for e in replayed[0]] == [97]
+    assert replayed[1] == []
+    assert [(e.type, e.text) for e in replayed[2]] == [
+        (EventType.TEXTINPUT, "hé"),
+        (EventType.MOUSEMOTION, None),
+    ]
+    assert replayed[2][1].x == 3
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PACKAGE_ROOT / "src"
+
+
+def _headless_backend(monkeypatch):
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+    monkeypatch.setenv(
+        "SDL_VIDEODRIVER", os.environ.get("SDL_VIDEODRIVER", "dummy")
+    )
+    try:
+        native = importlib.import_module("mini_arcade_native_backend._native")
+    except ImportError as exc:
+        pytest.skip(f"native backend extension is unavailable: {exc}")
+
+    cfg = native.BackendConfig()
+    cfg.window.width = 64
+    cfg.window.height = 64
+    cfg.audio.enabled = False
+    try:
+        return native.Backend(cfg)
+    except RuntimeError as exc:
+        pytest.skip(f"cannot open a window here: {exc}")
+
+
+def test_end_frame_lets_background_threads_run(monkeypatch) -> None:
+    backend = _headless_backend(monkeypatch)
+
+    # With a huge switch interval the main thread never hands the GIL over
+    # on its own, so the worker only advances while a native call has
+    # released it.
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(30.0)
+
+    ticks = 0
+    stop = threading.Event()
+
+    def worker() -> None:
+        nonlocal ticks
+        while not stop.is_set():
+            ticks += 1
+            time.sleep(0)
+
+    thread = threading.Thread(target=worker, daemon=True)
+    try:
+        thread.start()
+        before = ticks
+        for _ in range(20):
+            backend.begin_frame()
+            backend.end_frame()
+        during = ticks - before
+    finally:
+        stop.set()
+        sys.setswitchinterval(previous)
+        thread.join(timeout=5.0)
+
+    assert during > 0
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import struct
 from pathlib import Path
 
+import pytest
+
 PACKAGE_ROOT = Path(__file__).resolve().parents[1]
 SRC_ROOT = PACKAGE_ROOT / "src"
 CORE_SRC_ROOT = PACKAGE_ROOT.parent / "mini-arcade-core" / "src"
@@ -34,3 +37,189 @@ def test_render_port_draw_texture_falls_back_to_legacy_signature(
     port.draw_texture(5, 380, 530, 40, 20, 15.0)
 
     assert calls == [(5, 380, 530, 40, 20)]
+
+
+def test_render_port_legacy_builds_reject_newer_draw_ops(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.ports.render import RenderPort
+
+    class _LegacyBackend:
+        pass
+
+    port = RenderPort(_LegacyBackend(), ViewportTransform())
+
+    with pytest.raises(RuntimeError, match="Backend.submit"):
+        port.draw_texture_region(5, (0, 0, 8, 8), 0, 0, 8, 8)
+    with pytest.raises(RuntimeError, match="Backend.submit"):
+        port.draw_texture(5, 0, 0, 8, 8, tint=(255, 0, 0, 255))
+
+
+def test_render_port_legacy_builds_map_tiled_textures(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.ports.render import RenderPort
+
+    calls: list[tuple[int, int, int, int, int]] = []
+
+    class _LegacyBackend:
+        def draw_texture_tiled_y(
+            self, texture_id: int, x: int, y: int, width: int, height: int
+        ) -> None:
+            calls.append((texture_id, x, y, width, height))
+
+    vp = ViewportTransform(ox=5, oy=7, s=2.0)
+    port = RenderPort(_LegacyBackend(), vp)
+
+    port.draw_texture_tiled_y(3, 10, 20, 30, 40)
+
+    assert calls == [(3, 25, 47, 60, 80)]
+    with pytest.raises(RuntimeError, match="Backend.submit"):
+        port.draw_texture_instances(3, memoryview(bytes(20)).cast("f"))
+
+
+def test_render_port_lock_texture_releases_view_and_unlocks(
+    monkeypatch,
+) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.ports.render import RenderPort
+
+    pixels = bytearray(16)
+    calls: list[tuple] = []
+
+    class _StreamingBackend:
+        def submit(self, commands) -> None:
+            calls.append(("submit", bytes(commands)))
+
+        def lock_texture(self, texture_id: int, rect):
+            calls.append(("lock", texture_id, rect))
+            return memoryview(pixels), 8
+
+        def unlock_texture(self, texture_id: int) -> None:
+            calls.append(("unlock", texture_id))
+
+    port = RenderPort(_StreamingBackend(), ViewportTransform())
+    port.draw_texture(4, 0, 0, 2, 2)
+
+    with port.lock_texture(4, (0, 0, 2, 2)) as (view, pitch):
+        view[pitch : pitch + 4] = b"\xff\x00\x00\xff"
+
+    assert [c[0] for c in calls] == ["submit", "lock", "unlock"]
+    assert calls[1:] == [("lock", 4, (0, 0, 2, 2)), ("unlock", 4)]
+    assert pixels[8:12] == b"\xff\x00\x00\xff"
+    try:
+        view[0]
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("locked view must be released")
+
+
+def test_render_port_layers_cache_until_invalidated(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.ports.render import RenderPort
+
+    calls: list[tuple] = []
+
+    class _TargetBackend:
+        def submit(self, commands) -> None:
+            calls.append(("submit", len(commands)))
+
+        def create_render_target(self, w: int, h: int) -> int:
+            calls.append(("create", w, h))
+            return 9
+
+        def set_render_target(self, texture_id: int) -> None:
+            calls.append(("target", texture_id))
+
+        def clear(self, r: int, g: int, b: int, a: int) -> None:
+            calls.append(("clear", r, g, b, a))
+
+    vp = ViewportTransform(ox=5, oy=7, s=2.0)
+    port = RenderPort(_TargetBackend(), vp)
+    layer = port.create_layer(30, 20)
+
+    assert port.layer_dirty(layer)
+    port.begin_layer(layer)
+    assert (vp.ox, vp.oy) == (0, 0)
+    port.draw_rect(1, 1, 2, 2)
+    port.end_layer()
+
+    assert (vp.ox, vp.oy) == (5, 7)
+    assert not port.layer_dirty(layer)
+    assert calls == [
+        ("create", 60, 40),
+        ("target", 9),
+        ("clear", 0, 0, 0, 0),
+        ("submit", 24),
+        ("target", 0),
+    ]
+
+    port.invalidate_layer(layer)
+    assert port.layer_dirty(layer)
+
+
+def test_render_port_submits_queued_draws_before_budget_eviction(
+    monkeypatch,
+) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.ports.render import RenderPort
+
+    class _EvictingBackend:
+        """Evicts evictable textures not drawn this frame, like SdlRenderer."""
+
+        def __init__(self) -> None:
+            self.alive: set[int] = set()
+            self.evictable: set[int] = set()
+            self.used: set[int] = set()
+            self.budget = 0
+            self.next_id = 0
+            self.drawn: list[int] = []
+            self.missing: list[int] = []
+
+        def submit(self, commands) -> None:
+            _, tex = struct.unpack_from("<II", commands)
+            if tex in self.alive:
+                self.used.add(tex)
+                self.drawn.append(tex)
+            else:
+                self.missing.append(tex)
+
+        def set_texture_budget(self, budget: int) -> None:
+            self.budget = budget
+
+        def set_texture_evictable(self, tex: int, evictable: bool) -> None:
+            self.evictable.add(tex)
+
+        def create_texture_rgba(self, w, h, pixels, pitch) -> int:
+            self.next_id += 1
+            self.alive.add(self.next_id)
+            if len(self.alive) * 64 > self.budget:
+                self.alive -= self.evictable - self.used
+            return self.next_id
+
+    backend = _EvictingBackend()
+    port = RenderPort(backend, ViewportTransform())
+    port.set_texture_budget(64)
+    sprite = port.create_texture_rgba(4, 4, bytes(64), evictable=True)
+
+    port.draw_texture(sprite, 0, 0, 4, 4)
+    port.create_texture_rgba(4, 4, bytes(64))
+    port.flush()
+
+    assert backend.drawn == [sprite]
+    assert backend.missing == []
+    assert sprite in backend.alive
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PACKAGE_ROOT / "src"
+CORE_SRC_ROOT = PACKAGE_ROOT.parent / "mini-arcade-core" / "src"
+
+
+def test_text_port_drops_textures_evicted_by_the_budget(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.ports.render import RenderPort
+    from mini_arcade_native_backend.ports.text import TextPort
+
+    class _BudgetBackend:
+        def __init__(self) -> None:
+            self.created = 0
+            self.evictable: set[int] = set()
+            self.pending_evictions: list[int] = []
+
+        def submit(self, commands) -> None:
+            pass
+
+        def create_texture_rgba(self, w, h, pixels, pitch) -> int:
+            self.created += 1
+            return self.created
+
+        def set_texture_evictable(self, texture_id, evictable) -> None:
+            self.evictable.add(texture_id)
+
+        def take_evicted_textures(self) -> list[int]:
+            evicted, self.pending_evictions = self.pending_evictions, []
+            return evicted
+
+    backend = _BudgetBackend()
+    vp = ViewportTransform()
+    render = RenderPort(backend, vp)
+    text = TextPort(backend, vp, None, textures=render)
+
+    text.draw(0, 0, "score")
+    text.draw(0, 0, "score")
+    assert backend.created == 1
+    assert backend.evictable == {1}
+
+    # Another texture pushed the first one out of the budget.
+    backend.pending_evictions = [1]
+    render.create_texture_rgba(4, 4, bytes(64))
+    text.draw(0, 0, "score")
+
+    assert backend.created == 3
+    assert backend.evictable == {1, 3}
+
+
+def test_text_port_cache_is_byte_budgeted_and_keeps_pins(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.ports.text import TextPort
+
+    created: list[tuple[int, int]] = []
+    destroyed: list[int] = []
+
+    class _CacheBackend:
+        def submit(self, commands) -> None:
+            pass
+
+        def create_texture_rgba(self, w, h, pixels, pitch) -> int:
+            created.append((w, h))
+            return len(created)
+
+        def destroy_texture(self, texture_id) -> None:
+            destroyed.append(texture_id)
+
+    # No font path, so strings go through the PIL texture cache.
+    port = TextPort(_CacheBackend(), ViewportTransform(), None, cache_bytes=1)
+    port.pin("HUD")
+
+    port.draw(0, 0, "HUD")
+    port.draw(0, 0, "one-off")
+    port.draw(0, 0, "another")
+    port.draw(0, 0, "HUD")
+
+    assert destroyed == [2]
+    stats = port.cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 2
+    assert stats["upload_bytes"] == sum(w * h * 4 for w, h in created)
+    assert stats["bytes"] == 4 * sum(w * h for w, h in (created[0], created[2]))
+
+
+def test_text_port_prewarm_uploads_at_begin_frame(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.ports.render import RenderPort
+    from mini_arcade_native_backend.ports.text import TextPort
+
+    class _PrewarmBackend:
+        def __init__(self) -> None:
+            self.created: list[int] = []
+            self.frames = 0
+
+        def submit(self, commands) -> None:
+            pass
+
+        def begin_frame(self) -> None:
+            self.frames += 1
+
+        def create_texture_rgba(self, w, h, pixels, pitch) -> int:
+            self.created.append(self.frames)
+            return len(self.created)
+
+        def set_texture_evictable(self, texture_id, evictable) -> None:
+            pass
+
+    backend = _PrewarmBackend()
+    vp = ViewportTransform()
+    render = RenderPort(backend, vp)
+    text = TextPort(backend, vp, None, textures=render)
+
+    assert text.prewarm(["Play", "Quit", "Play"], sizes=[10, 20]) == 4
+    # Nothing touches the renderer until a frame starts.
+    assert backend.created == []
+
+    # A pending string is finished on demand instead of rasterized twice.
+    text.draw(0, 0, "Play", font_size=10)
+    assert backend.created == [0]
+
+    deadline = time.monotonic() + 5.0
+    while text.cache_stats()["entries"] < 4 and time.monotonic() < deadline:
+        render.begin_frame()
+        time.sleep(0.01)
+
+    assert text.cache_stats()["entries"] == 4
+    assert len(backend.created) == 4
+    assert all(frame > 0 for frame in backend.created[1:])
+
+    text.draw(0, 0, "Quit", font_size=20)
+    assert len(backend.created) == 4
+
+    text.close()
+    assert not any(
+        t.name.startswith("text-prewarm") for t in threading.enumerate()
+    )
+
+
+def test_text_port_prewarm_renders_glyphs_off_thread(monkeypatch) -> None:
+    monkeypatch.syspath_prepend(str(CORE_SRC_ROOT))
+    monkeypatch.syspath_prepend(str(SRC_ROOT))
+
+    from mini_arcade_core.backend.viewport import ViewportTransform
+    from mini_arcade_native_backend.ports.render import RenderPort
+    from mini_arcade_native_backend.ports.text import TextPort
+
+    class _GlyphBackend:
+        def __init__(self) -> None:
+            self.rendered: list[tuple[list[str], int, threading.Thread]] = []
+            self.uploads: list[threading.Thread] = []
+
+        def submit(self, commands) -> None:
+            pass
+
+        def begin_frame(self) -> None:
+            pass
+
+        def load_font(self, path, pt) -> int:
+            return pt
+
+        def rasterize_text(self, texts, font_id) -> None:
+            self.rendered.append((texts, font_id, threading.current_thread()))
+
+        def upload_rasterized_text(self) -> None:
+            self.uploads.append(threading.current_thread())
+
+    backend = _GlyphBackend()
+    vp = ViewportTransform()
+    render = RenderPort(backend, vp)
+    text = TextPort(backend, vp, "font.ttf", textures=render)
+
+    assert text.prewarm(["Play", "Quit"], sizes=[10, 20]) == 4
+
+    deadline = time.monotonic() + 5.0
+    while (
+        len(backend.rendered) < 2 or not backend.uploads
+    ) and time.monotonic() < deadline:
+        render.begin_frame()
+        time.sleep(0.01)
+
+    assert sorted(font_id for _, font_id, _ in backend.rendered) == [10, 20]
+    main = threading.current_thread()
+    assert all(texts == ["Play", "Quit"] for texts, _, _ in backend.rendered)
+    assert all(thread is not main for _, _, thread in backend.rendered)
+    assert backend.uploads and all(t is main for t in backend.uploads)